@@ -0,0 +1,57 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from threading import Thread
+from urllib.request import urlopen
+
+import pytest
+from prometheus_client import CollectorRegistry, generate_latest
+
+from opentelemetry.exporter.prometheus import PrometheusMetricReader
+from opentelemetry.sdk.metrics import MeterProvider
+
+NUM_SERIES = 10_000
+
+
+@pytest.mark.parametrize("exposition", ["prometheus_client", "render"])
+def test_benchmark_scrape(benchmark, exposition):
+    registry = CollectorRegistry()
+    reader = PrometheusMetricReader(registry=registry)
+    meter_provider = MeterProvider(metric_readers=[reader], shutdown_on_exit=False)
+    meter = meter_provider.get_meter("sdk_meter_provider")
+    counter = meter.create_counter("test_counter")
+    histogram = meter.create_histogram("test_histogram")
+    for i in range(NUM_SERIES):
+        counter.add(1, {"series": i, "http.route": "/path"})
+        histogram.record(1, {"series": i, "http.route": "/path"})
+
+    if exposition == "prometheus_client":
+        benchmark(generate_latest, registry)
+    else:
+        benchmark(reader.render)
+    meter_provider.shutdown()
+
+
+@pytest.mark.parametrize("num_scrapers", [1, 2, 4])
+def test_benchmark_concurrent_scrapes(benchmark, num_scrapers):
+    reader = PrometheusMetricReader(registry=None)
+    meter_provider = MeterProvider(metric_readers=[reader], shutdown_on_exit=False)
+    counter = meter_provider.get_meter("sdk_meter_provider").create_counter("test_counter")
+    for i in range(NUM_SERIES):
+        counter.add(1, {"series": i, "http.route": "/path"})
+    reader.start_http_server(port=0)
+    host, port = reader._server.server_address  # pylint: disable=protected-access
+
+    def scrape():
+        with urlopen(f"http://{host}:{port}/metrics", timeout=10) as response:
+            response.read()
+
+    def benchmark_scrapes():
+        threads = [Thread(target=scrape) for _ in range(num_scrapers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    benchmark(benchmark_scrapes)
+    meter_provider.shutdown()
@@ -47,16 +47,27 @@ metrics to `Prometheus`_.
     counter.add(25, labels)
     input("Press any key to exit...")
 
+The reader can also render the metrics itself, straight from the collected
+data points, with `PrometheusMetricReader.render`, and serve them with its own
+HTTP server. A reader created with ``registry=None`` is only exposed this way.
+
+.. code:: python
+
+    reader = PrometheusMetricReader(registry=None)
+    reader.start_http_server(port=8000, addr="localhost", cache_ttl_millis=1000)
+
 API
 ---
 """
 
 from collections import deque
 from collections.abc import Callable, Iterable, Sequence
+from functools import partial
 from itertools import chain
 from json import dumps
 from logging import getLogger
 from os import environ
+from threading import Lock, local
 from typing import (
     Any,
     TypeVar,
@@ -72,11 +83,21 @@ from prometheus_client.core import (
 )
 from prometheus_client.core import Metric as PrometheusMetric
 
+from opentelemetry.exporter.prometheus._exposition import (
+    _OTEL_SCOPE_ATTR_PREFIX,
+    _OTEL_SCOPE_NAME_LABEL,
+    _OTEL_SCOPE_SCHEMA_URL_LABEL,
+    _OTEL_SCOPE_VERSION_LABEL,
+    _TARGET_INFO_DESCRIPTION,
+    _TARGET_INFO_NAME,
+    _ExpositionWriter,
+)
 from opentelemetry.exporter.prometheus._mapping import (
     map_unit,
     sanitize_attribute,
     sanitize_full_name,
 )
+from opentelemetry.exporter.prometheus._server import _Scraper, _ScrapeServer
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPORTER_PROMETHEUS_HOST,
     OTEL_EXPORTER_PROMETHEUS_PORT,
@@ -108,14 +129,6 @@ from opentelemetry.util.types import Attributes, AttributeValue
 
 _logger = getLogger(__name__)
 
-_TARGET_INFO_NAME = "target"
-_TARGET_INFO_DESCRIPTION = "Target metadata"
-
-_OTEL_SCOPE_NAME_LABEL = "otel_scope_name"
-_OTEL_SCOPE_VERSION_LABEL = "otel_scope_version"
-_OTEL_SCOPE_SCHEMA_URL_LABEL = "otel_scope_schema_url"
-_OTEL_SCOPE_ATTR_PREFIX = "otel_scope_"
-
 
 def _convert_buckets(bucket_counts: Sequence[int], explicit_bounds: Sequence[float]) -> Sequence[tuple[str, int]]:
     buckets = []
@@ -245,6 +258,9 @@ class PrometheusMetricReader(MetricReader):
         scope_info_enabled: Whether to include instrumentation scope labels on
             exported metrics. Scope labels are exported by default.
         prefix: Prefix added to exported Prometheus metric names.
+        registry: The ``prometheus_client`` registry the reader is registered
+            on. When ``None`` the reader is not registered and the metrics are
+            only exposed by `render`.
     """
 
     def __init__(
@@ -253,7 +269,7 @@ class PrometheusMetricReader(MetricReader):
         prefix: str = "",
         scope_info_enabled: bool = True,
         *,
-        registry: CollectorRegistry = REGISTRY,
+        registry: CollectorRegistry | None = REGISTRY,
     ) -> None:
         super().__init__(
             preferred_temporality={
@@ -272,9 +288,20 @@ class PrometheusMetricReader(MetricReader):
             scope_info_enabled=scope_info_enabled,
         )
         self._registry = registry
-        self._registry.register(self._collector)
+        if registry is not None:
+            registry.register(self._collector)
         self._collector._callback = self.collect
         self._prefix = prefix
+        self._writer = _ExpositionWriter(
+            disable_target_info=disable_target_info,
+            prefix=prefix,
+            scope_info_enabled=scope_info_enabled,
+        )
+        self._render_lock = Lock()
+        self._server: _ScrapeServer | None = None
+        # Set on the thread collecting for render so the collected metrics
+        # are handed to the writer instead of the registry collector.
+        self._render_state = local()
 
     def _receive_metrics(
         self,
@@ -284,10 +311,82 @@ class PrometheusMetricReader(MetricReader):
     ) -> None:
         if metrics_data is None:
             return
+        if getattr(self._render_state, "rendering", False):
+            self._render_state.metrics_data = metrics_data
+            return
         self._collector.add_metrics_data(metrics_data)
 
+    def render(self, openmetrics: bool = False, timeout_millis: float = 10_000) -> bytes:
+        """Collects the metrics and renders them in the Prometheus exposition format.
+
+        The exposition is written straight from the collected data points,
+        without going through the ``prometheus_client`` registry.
+
+        Args:
+            openmetrics: Whether to render the OpenMetrics format instead of
+                the Prometheus text format.
+            timeout_millis: Amount of time in milliseconds before the
+                collection times out.
+        """
+        return self._write(self._collect_metrics_data(timeout_millis), openmetrics)
+
+    def start_http_server(
+        self,
+        port: int = 9464,
+        addr: str = "localhost",
+        *,
+        cache_ttl_millis: float = 0,
+        timeout_millis: float = 10_000,
+    ) -> None:
+        """Starts an HTTP server exposing the metrics rendered by `render`.
+
+        Concurrent scrapes share a single collection, bodies are compressed
+        for scrapes accepting ``gzip`` and the OpenMetrics format is served to
+        scrapes asking for it. The server is stopped by `shutdown`.
+
+        Args:
+            port: Port the server listens on.
+            addr: Address the server listens on.
+            cache_ttl_millis: Amount of time in milliseconds a collection is
+                reused by the following scrapes, collections are not reused
+                by default.
+            timeout_millis: Amount of time in milliseconds before the
+                collection of a scrape times out.
+        """
+        if cache_ttl_millis < 0:
+            raise ValueError("cache_ttl_millis must be a non-negative number")
+        if self._server is not None:
+            _logger.warning("The Prometheus HTTP server of this reader is already started")
+            return
+        self._server = _ScrapeServer(
+            (addr, port),
+            _Scraper(
+                partial(self._collect_metrics_data, timeout_millis),
+                self._write,
+                cache_ttl_millis=cache_ttl_millis,
+            ),
+        )
+        self._server.start()
+
+    def _collect_metrics_data(self, timeout_millis: float = 10_000) -> MetricsData | None:
+        self._render_state.rendering = True
+        try:
+            self.collect(timeout_millis=timeout_millis)
+            return getattr(self._render_state, "metrics_data", None)
+        finally:
+            self._render_state.rendering = False
+            self._render_state.metrics_data = None
+
+    def _write(self, metrics_data: MetricsData | None, openmetrics: bool) -> bytes:
+        with self._render_lock:
+            return "".join(self._writer.write(metrics_data, openmetrics)).encode("utf-8")
+
     def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
-        self._registry.unregister(self._collector)
+        if self._server is not None:
+            self._server.stop()
+            self._server = None
+        if self._registry is not None:
+            self._registry.unregister(self._collector)
 
 
 class _CustomCollector:
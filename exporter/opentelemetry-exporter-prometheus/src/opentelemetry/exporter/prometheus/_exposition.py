@@ -0,0 +1,313 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""Renders collected metrics in the Prometheus exposition formats.
+
+The writer renders the text and OpenMetrics formats straight from the
+collected data points, without building ``prometheus_client`` metric
+families. The sanitized names and rendered labels of every metric and series
+are cached between collections, so a scrape of series that were already
+exposed only formats their values.
+"""
+
+from collections.abc import Iterator, Sequence
+from itertools import chain
+from json import dumps
+from logging import getLogger
+from math import inf, isnan
+from typing import Any
+
+from opentelemetry.exporter.prometheus._mapping import (
+    map_unit,
+    sanitize_attribute,
+    sanitize_full_name,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    Gauge,
+    Histogram,
+    Metric,
+    MetricsData,
+    Sum,
+)
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.util.types import Attributes
+
+_logger = getLogger(__name__)
+
+TEXT_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+_TARGET_INFO_NAME = "target"
+_TARGET_INFO_DESCRIPTION = "Target metadata"
+
+_OTEL_SCOPE_NAME_LABEL = "otel_scope_name"
+_OTEL_SCOPE_VERSION_LABEL = "otel_scope_version"
+_OTEL_SCOPE_SCHEMA_URL_LABEL = "otel_scope_schema_url"
+_OTEL_SCOPE_ATTR_PREFIX = "otel_scope_"
+
+_EOF = "# EOF\n"
+
+# The attributes and scope of a series, its rendered labels and the labels
+# sorting before and after the ``le`` label of histogram buckets.
+_SeriesLabels = tuple[Attributes, InstrumentationScope, str, str, str]
+
+
+def _format_value(value: float) -> str:
+    """Formats a sample value the way Go formats floats."""
+    value = float(value)
+    if value == inf:
+        return "+Inf"
+    if value == -inf:
+        return "-Inf"
+    if isnan(value):
+        return "NaN"
+    text = repr(value)
+    dot = text.find(".")
+    # Go switches to exponents sooner than Python.
+    if value > 0 and dot > 6:
+        mantissa = f"{text[0]}.{text[1:dot]}{text[dot + 1 :]}".rstrip("0.")
+        return f"{mantissa}e+{dot - 1:02d}"
+    return text
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", r"\\").replace("\n", r"\n").replace('"', r"\"")
+
+
+def _label_value(value: Any) -> str:
+    if not isinstance(value, str):
+        value = dumps(value, default=str)
+    return _escape_label_value(value)
+
+
+class _Family:
+    """The names and headers of a Prometheus metric family."""
+
+    __slots__ = ("key", "kind", "name", "text_header", "openmetrics_header")
+
+    def __init__(self, name: str, description: str, unit: str, kind: str) -> None:
+        if kind == "counter" and name.endswith("_total"):
+            name = name[:-6]
+        if unit and not name.endswith("_" + unit):
+            name += "_" + unit
+        self.key = (name, description, unit, kind)
+        self.kind = kind
+        self.name = name
+        text_name = name + "_total" if kind == "counter" else name
+        help_text = description.replace("\\", r"\\").replace("\n", r"\n")
+        self.text_header = f"# HELP {text_name} {help_text}\n# TYPE {text_name} {kind}\n"
+        self.openmetrics_header = f"# HELP {name} {_escape_label_value(description)}\n# TYPE {name} {kind}\n" + (
+            f"# UNIT {name} {unit}\n" if unit else ""
+        )
+
+
+class _ExpositionWriter:
+    """Writes collected metrics in the text or OpenMetrics format.
+
+    The writer is not thread safe, callers serialize the calls to `write`.
+
+    Args:
+        disable_target_info: Whether to disable the ``target_info`` metric.
+        prefix: Prefix added to exported Prometheus metric names.
+        scope_info_enabled: Whether to include instrumentation scope labels on
+            exported metrics.
+    """
+
+    def __init__(
+        self,
+        disable_target_info: bool = False,
+        prefix: str = "",
+        scope_info_enabled: bool = True,
+    ) -> None:
+        self._disable_target_info = disable_target_info
+        self._prefix = prefix
+        self._scope_info_enabled = scope_info_enabled
+        self._target_info: tuple[str, str] | None = None
+        self._families: dict[tuple, _Family] = {}
+        self._label_names: dict[str, str] = {}
+        self._scope_labels: dict[InstrumentationScope, dict[str, str]] = {}
+        # The attributes of a series are the same object on every collection,
+        # the rendered labels are cached by identity. The attributes are kept
+        # in the entry so their id can not be reused while the entry exists.
+        self._series_labels: dict[int, _SeriesLabels] = {}
+
+    def write(self, metrics_data: MetricsData | None, openmetrics: bool = False) -> Iterator[str]:
+        """Yields the exposition of the metrics data in chunks of text."""
+        if metrics_data is None or not metrics_data.resource_metrics:
+            if openmetrics:
+                yield _EOF
+            return
+
+        families: dict[tuple, tuple[_Family, list[str]]] = {}
+        # Only the series written by this collection are kept in the cache,
+        # so the labels of evicted series are released.
+        series_labels: dict[int, _SeriesLabels] = {}
+        for resource_metrics in metrics_data.resource_metrics:
+            for scope_metrics in resource_metrics.scope_metrics:
+                scope = scope_metrics.scope
+                for metric in scope_metrics.metrics:
+                    family = self._family(metric)
+                    if family is None:
+                        continue
+                    entry = families.get(family.key)
+                    if entry is None:
+                        entry = families[family.key] = (family, [])
+                    self._write_data_points(family, metric, scope, entry[1], series_labels)
+        self._series_labels = series_labels
+
+        if not self._disable_target_info:
+            if self._target_info is None:
+                self._target_info = self._render_target_info(metrics_data)
+            yield self._target_info[openmetrics]
+        for family, lines in families.values():
+            yield family.openmetrics_header if openmetrics else family.text_header
+            yield "".join(lines)
+        if openmetrics:
+            yield _EOF
+
+    def _family(self, metric: Metric) -> _Family | None:
+        data = metric.data
+        if isinstance(data, Sum):
+            cache_key = (
+                metric.name,
+                metric.description,
+                metric.unit,
+                Sum,
+                data.is_monotonic,
+                data.aggregation_temporality,
+            )
+        else:
+            cache_key = (metric.name, metric.description, metric.unit, type(data))
+        try:
+            return self._families[cache_key]
+        except KeyError:
+            pass
+
+        if isinstance(data, Sum):
+            # The Prometheus compatibility spec requires cumulative
+            # non-monotonic Sums to be exported as Gauges.
+            if not data.is_monotonic and data.aggregation_temporality == AggregationTemporality.CUMULATIVE:
+                kind = "gauge"
+            else:
+                kind = "counter"
+        elif isinstance(data, Gauge):
+            kind = "gauge"
+        elif isinstance(data, Histogram):
+            kind = "histogram"
+        else:
+            # Unsupported data is warned about on every collection.
+            _logger.warning("Unsupported metric data. %s", type(data))
+            return None
+
+        name = metric.name
+        if self._prefix:
+            name = self._prefix + "_" + name
+        family = self._families[cache_key] = _Family(
+            sanitize_full_name(name),
+            metric.description or "",
+            map_unit(metric.unit or ""),
+            kind,
+        )
+        return family
+
+    def _write_data_points(
+        self,
+        family: _Family,
+        metric: Metric,
+        scope: InstrumentationScope,
+        lines: list[str],
+        series_labels: dict[int, _SeriesLabels],
+    ) -> None:
+        cached_labels = self._series_labels
+        kind = family.kind
+        name = family.name
+        if kind == "counter":
+            name += "_total"
+        last_bounds = None
+        bounds: Sequence[str] = ()
+        for point in metric.data.data_points:
+            attributes = point.attributes
+            entry = cached_labels.get(id(attributes))
+            if entry is None or entry[0] is not attributes or entry[1] is not scope:
+                entry = (attributes, scope, *self._render_labels(scope, attributes))
+            series_labels[id(attributes)] = entry
+            labels = entry[2]
+
+            if kind != "histogram":
+                if labels:
+                    lines.append(f"{name}{{{labels}}} {_format_value(point.value)}\n")
+                else:
+                    lines.append(f"{name} {_format_value(point.value)}\n")
+                continue
+
+            explicit_bounds = point.explicit_bounds
+            if explicit_bounds is not last_bounds:
+                last_bounds = explicit_bounds
+                bounds = [f"{bound}" for bound in chain(explicit_bounds, ("+Inf",))]
+            bucket_prefix = f'{name}_bucket{{{entry[3]}le="'
+            bucket_suffix = f'"{entry[4]}}} '
+            total_count = 0
+            for bound, count in zip(bounds, point.bucket_counts):
+                total_count += count
+                lines.append(f"{bucket_prefix}{bound}{bucket_suffix}{_format_value(total_count)}\n")
+            # Prometheus does not expose the count and sum of histograms
+            # with negative buckets.
+            if explicit_bounds and explicit_bounds[0] < 0:
+                continue
+            labels = f"{{{labels}}}" if labels else ""
+            lines.append(f"{name}_count{labels} {_format_value(total_count)}\n")
+            lines.append(f"{name}_sum{labels} {_format_value(point.sum)}\n")
+
+    def _render_labels(self, scope: InstrumentationScope, attributes: Attributes) -> tuple[str, str, str]:
+        """Renders the labels of a series.
+
+        Returns the labels, and the labels sorting before and after the ``le``
+        label of histogram buckets.
+        """
+        labels = dict(self._scope_label_values(scope))
+        if attributes:
+            for key, value in attributes.items():
+                labels[self._label_name(key)] = _label_value(value)
+        labels = [(key, f'{key}="{value}"') for key, value in sorted(labels.items())]
+        before_le = "".join(label + "," for key, label in labels if key < "le")
+        after_le = "".join("," + label for key, label in labels if key > "le")
+        return ",".join(label for _, label in labels), before_le, after_le
+
+    def _label_name(self, key: str) -> str:
+        try:
+            return self._label_names[key]
+        except KeyError:
+            label = self._label_names[key] = sanitize_attribute(key)
+            return label
+
+    def _scope_label_values(self, scope: InstrumentationScope) -> dict[str, str]:
+        if not self._scope_info_enabled:
+            return {}
+        try:
+            return self._scope_labels[scope]
+        except KeyError:
+            pass
+        labels = {}
+        if scope.attributes:
+            for key, value in scope.attributes.items():
+                labels[self._label_name(_OTEL_SCOPE_ATTR_PREFIX + key)] = _label_value(value)
+        labels[_OTEL_SCOPE_NAME_LABEL] = _escape_label_value(scope.name or "")
+        labels[_OTEL_SCOPE_VERSION_LABEL] = _escape_label_value(scope.version or "")
+        labels[_OTEL_SCOPE_SCHEMA_URL_LABEL] = _escape_label_value(scope.schema_url or "")
+        self._scope_labels[scope] = labels
+        return labels
+
+    def _render_target_info(self, metrics_data: MetricsData) -> tuple[str, str]:
+        """Renders the ``target_info`` metric in the text and OpenMetrics formats."""
+        attributes = {}
+        for resource_metrics in metrics_data.resource_metrics:
+            attributes.update(resource_metrics.resource.attributes)
+        labels = {sanitize_attribute(key): _label_value(value) for key, value in attributes.items()}
+        labels = ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+        sample = f"{_TARGET_INFO_NAME}_info{{{labels}}} 1.0\n" if labels else f"{_TARGET_INFO_NAME}_info 1.0\n"
+        return (
+            f"# HELP {_TARGET_INFO_NAME}_info {_TARGET_INFO_DESCRIPTION}\n"
+            f"# TYPE {_TARGET_INFO_NAME}_info gauge\n{sample}",
+            f"# HELP {_TARGET_INFO_NAME} {_TARGET_INFO_DESCRIPTION}\n# TYPE {_TARGET_INFO_NAME} info\n{sample}",
+        )
@@ -0,0 +1,206 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""A lightweight HTTP server exposing the metrics to Prometheus scrapes.
+
+Concurrent scrapes share a single collection, so the cost of a scrape does
+not depend on the number of scrapers. The rendered bodies of a collection
+are kept for every content type and encoding that was requested, and the
+collection can be reused by the scrapes of the next ``cache_ttl_millis``.
+"""
+
+from collections.abc import Callable
+from gzip import compress
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from logging import getLogger
+from threading import Event, Lock, Thread
+from time import monotonic
+
+from opentelemetry.exporter.prometheus._exposition import (
+    OPENMETRICS_CONTENT_TYPE,
+    TEXT_CONTENT_TYPE,
+)
+from opentelemetry.sdk.metrics.export import MetricsData
+
+_logger = getLogger(__name__)
+
+_OPENMETRICS_MEDIA_TYPE = "application/openmetrics-text"
+
+
+def _accepts_openmetrics(accept: str | None) -> bool:
+    """Whether the ``Accept`` header of a scrape asks for OpenMetrics."""
+    if not accept:
+        return False
+    for media_range in accept.split(","):
+        media_type, *params = media_range.split(";")
+        if media_type.strip() != _OPENMETRICS_MEDIA_TYPE:
+            continue
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "version" and value.strip() not in ("0.0.1", "1.0.0"):
+                break
+        else:
+            return True
+    return False
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    """Whether the ``Accept-Encoding`` header of a scrape allows gzip."""
+    if not accept_encoding:
+        return False
+    for coding in accept_encoding.split(","):
+        coding, *params = coding.split(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+class _Collection:
+    """A collection shared by the scrapes that wait for it."""
+
+    __slots__ = ("_bodies", "_lock", "done", "error", "finished", "metrics_data")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.finished = 0.0
+        self.metrics_data: MetricsData | None = None
+        self.error: Exception | None = None
+        self._lock = Lock()
+        self._bodies: dict[tuple[bool, bool], bytes] = {}
+
+    def body(self, write: Callable[[MetricsData | None, bool], bytes], openmetrics: bool, gzip: bool) -> bytes:
+        """Returns the body of the collection, rendering it once per format."""
+        with self._lock:
+            body = self._bodies.get((openmetrics, False))
+            if body is None:
+                body = self._bodies[(openmetrics, False)] = write(self.metrics_data, openmetrics)
+            if not gzip:
+                return body
+            compressed = self._bodies.get((openmetrics, True))
+            if compressed is None:
+                compressed = self._bodies[(openmetrics, True)] = compress(body)
+            return compressed
+
+
+class _Scraper:
+    """Coalesces concurrent scrapes into a single collection.
+
+    Args:
+        collect: Collects the metrics data.
+        write: Renders collected metrics data in the text or OpenMetrics
+            format.
+        cache_ttl_millis: Amount of time in milliseconds a finished
+            collection is served to new scrapes.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[], MetricsData | None],
+        write: Callable[[MetricsData | None, bool], bytes],
+        cache_ttl_millis: float = 0,
+    ) -> None:
+        self._collect = collect
+        self._write = write
+        self._cache_ttl = cache_ttl_millis / 1e3
+        self._lock = Lock()
+        self._collection: _Collection | None = None
+
+    def scrape(self, openmetrics: bool = False, gzip: bool = False) -> bytes:
+        """Returns the exposition of a collection that finished after the
+        scrape started, or of a cached one that is still fresh."""
+        with self._lock:
+            collection = self._collection
+            if collection is None or (
+                collection.done.is_set() and monotonic() - collection.finished >= self._cache_ttl
+            ):
+                collection = self._collection = _Collection()
+                collecting = True
+            else:
+                collecting = False
+
+        if collecting:
+            try:
+                collection.metrics_data = self._collect()
+            except Exception as error:  # pylint: disable=broad-exception-caught
+                collection.error = error
+            finally:
+                collection.finished = monotonic()
+                if collection.error is not None:
+                    # Failed collections are not cached.
+                    with self._lock:
+                        if self._collection is collection:
+                            self._collection = None
+                collection.done.set()
+        else:
+            collection.done.wait()
+
+        if collection.error is not None:
+            raise collection.error
+        return collection.body(self._write, openmetrics, gzip)
+
+
+class _ScrapeHandler(BaseHTTPRequestHandler):
+    server: "_ScrapeServer"
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        if self.path == "/favicon.ico":
+            self.send_response(200)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        openmetrics = _accepts_openmetrics(self.headers.get("Accept"))
+        gzip = _accepts_gzip(self.headers.get("Accept-Encoding"))
+        try:
+            body = self.server.scraper.scrape(openmetrics=openmetrics, gzip=gzip)
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Failed to collect the metrics for a scrape")
+            self.send_error(500, "Failed to collect the metrics")
+            return
+
+        self.send_response(200)
+        self.send_header(
+            "Content-Type",
+            OPENMETRICS_CONTENT_TYPE if openmetrics else TEXT_CONTENT_TYPE,
+        )
+        if gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Vary", "Accept, Accept-Encoding")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:  # pylint: disable=redefined-builtin
+        # Scrapes are not logged.
+        pass
+
+
+class _ScrapeServer(ThreadingHTTPServer):
+    """Serves every scrape from a thread of its own."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], scraper: _Scraper) -> None:
+        super().__init__(address, _ScrapeHandler)
+        self.scraper = scraper
+        self._thread = Thread(
+            name="OtelPrometheusScrapeServer",
+            target=self.serve_forever,
+            daemon=True,
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+        self._thread.join()
@@ -0,0 +1,134 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from textwrap import dedent
+from unittest import TestCase
+
+from prometheus_client import CollectorRegistry, generate_latest
+from prometheus_client.openmetrics.exposition import (
+    generate_latest as generate_latest_openmetrics,
+)
+
+from opentelemetry.exporter.prometheus import PrometheusMetricReader
+from opentelemetry.exporter.prometheus._exposition import (
+    _ExpositionWriter,
+    _format_value,
+)
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    MetricsData,
+    ResourceMetrics,
+    ScopeMetrics,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+from opentelemetry.test.metrictestutil import (
+    _generate_sum,
+    _generate_unsupported_metric,
+)
+
+_SCOPE = InstrumentationScope("scope")
+
+
+def _metrics_data(*metrics):
+    return MetricsData(
+        resource_metrics=[
+            ResourceMetrics(
+                resource=Resource({"service.name": "test"}),
+                scope_metrics=[
+                    ScopeMetrics(
+                        scope=_SCOPE,
+                        metrics=list(metrics),
+                        schema_url="",
+                    )
+                ],
+                schema_url="",
+            )
+        ]
+    )
+
+
+class TestExpositionWriter(TestCase):
+    def test_render_matches_prometheus_client(self):
+        registry = CollectorRegistry()
+        reader = PrometheusMetricReader(prefix="app", registry=registry)
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            resource=Resource({"service.name": "test", "host\\name": 'a "b"\n'}),
+        )
+        meter = meter_provider.get_meter("meter", "1.0", attributes={"tier": 1})
+        counter = meter.create_counter("requests_total", unit="{request}", description="The requests")
+        histogram = meter.create_histogram("duration", unit="s", description="back\\slash")
+        up_down_counter = meter.create_up_down_counter("queue")
+        counter.add(3, {"path": "/a", "code": 200})
+        counter.add(1e21, {"path": '/"b"', "code": 500})
+        histogram.record(0.5, {"path": "/a", "method": "GET"})
+        histogram.record(20, {"path": "/a", "method": "GET"})
+        up_down_counter.add(-2, {"queue": ("x", "y")})
+
+        self.assertEqual(reader.render(), generate_latest(registry))
+        self.assertEqual(
+            reader.render(openmetrics=True),
+            generate_latest_openmetrics(registry),
+        )
+        meter_provider.shutdown()
+
+    def test_render_without_registry(self):
+        reader = PrometheusMetricReader(disable_target_info=True, scope_info_enabled=False, registry=None)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter_provider.get_meter("meter").create_counter("counter", description="The counter").add(1, {"key": "value"})
+
+        self.assertEqual(
+            reader.render().decode("utf-8"),
+            dedent(
+                """\
+                # HELP counter_total The counter
+                # TYPE counter_total counter
+                counter_total{key="value"} 1.0
+                """
+            ),
+        )
+        self.assertEqual(len(reader._collector._metrics_datas), 0)
+        meter_provider.shutdown()
+
+    def test_render_without_metrics(self):
+        reader = PrometheusMetricReader(registry=None)
+        meter_provider = MeterProvider(metric_readers=[reader])
+
+        self.assertEqual(reader.render(), b"")
+        self.assertEqual(reader.render(openmetrics=True), b"# EOF\n")
+        meter_provider.shutdown()
+
+    def test_labels_are_cached_per_series(self):
+        writer = _ExpositionWriter(disable_target_info=True)
+        attributes = {"a.b": "c"}
+        metric = _generate_sum("sum", 1, attributes=attributes)
+
+        first = "".join(writer.write(_metrics_data(metric)))
+        (entry,) = writer._series_labels.values()
+        self.assertIs(entry[0], attributes)
+        self.assertEqual(writer._label_names, {"a.b": "a_b"})
+
+        self.assertEqual("".join(writer.write(_metrics_data(metric))), first)
+        self.assertIs(writer._series_labels[id(attributes)], entry)
+
+        # Series that are no longer collected are released.
+        "".join(writer.write(_metrics_data(_generate_sum("sum", 1, attributes={"d": "e"}))))
+        self.assertNotIn(id(attributes), writer._series_labels)
+        self.assertEqual(len(writer._series_labels), 1)
+
+    def test_unsupported_metric(self):
+        writer = _ExpositionWriter(disable_target_info=True)
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual("".join(writer.write(_metrics_data(_generate_unsupported_metric("unsupported")))), "")
+
+    def test_format_value(self):
+        self.assertEqual(_format_value(1), "1.0")
+        self.assertEqual(_format_value(0.25), "0.25")
+        self.assertEqual(_format_value(12345678.0), "1.2345678e+07")
+        self.assertEqual(_format_value(float("inf")), "+Inf")
+        self.assertEqual(_format_value(float("-inf")), "-Inf")
+        self.assertEqual(_format_value(float("nan")), "NaN")
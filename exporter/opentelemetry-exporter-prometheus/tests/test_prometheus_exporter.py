@@ -20,6 +20,7 @@ from opentelemetry.exporter.prometheus import (
     PrometheusMetricReader,
     _CustomCollector,
 )
+from opentelemetry.exporter.prometheus._exposition import _ExpositionWriter
 from opentelemetry.metrics import NoOpMeterProvider
 from opentelemetry.sdk.metrics import MeterProvider
 from opentelemetry.sdk.metrics.export import (
@@ -69,6 +70,7 @@ class TestPrometheusMetricReader(TestCase):  # pylint: disable=too-many-public-m
         prefix: str = "",
         scope: InstrumentationScope | None = None,
         scope_info_enabled: bool = False,
+        expect_exposition_text: str | None = None,
     ) -> None:
         metrics_data = MetricsData(
             resource_metrics=[
@@ -96,6 +98,16 @@ class TestPrometheusMetricReader(TestCase):  # pylint: disable=too-many-public-m
         result = result_bytes.decode("utf-8")
         self.assertEqual(result, expect_prometheus_text)
 
+        writer = _ExpositionWriter(
+            disable_target_info=True,
+            scope_info_enabled=scope_info_enabled,
+            prefix=prefix,
+        )
+        self.assertEqual(
+            "".join(writer.write(metrics_data)),
+            expect_exposition_text or expect_prometheus_text,
+        )
+
     # pylint: disable=protected-access
     def test_constructor(self):
         """Test the constructor."""
@@ -879,4 +891,22 @@ class TestPrometheusMetricReader(TestCase):  # pylint: disable=too-many-public-m
                 http_server_request_duration_seconds_sum{http_target="",net_host_port="8080"} 579.0
                 """
             ),
+            # The exposition writer does not backfill missing labels, an
+            # empty label is the same as a missing one for Prometheus.
+            expect_exposition_text=dedent(
+                """\
+                # HELP http_server_request_duration_seconds test multiple label sets
+                # TYPE http_server_request_duration_seconds histogram
+                http_server_request_duration_seconds_bucket{http_target="/foobar",le="123.0",net_host_port="8080"} 1.0
+                http_server_request_duration_seconds_bucket{http_target="/foobar",le="456.0",net_host_port="8080"} 4.0
+                http_server_request_duration_seconds_bucket{http_target="/foobar",le="+Inf",net_host_port="8080"} 6.0
+                http_server_request_duration_seconds_count{http_target="/foobar",net_host_port="8080"} 6.0
+                http_server_request_duration_seconds_sum{http_target="/foobar",net_host_port="8080"} 579.0
+                http_server_request_duration_seconds_bucket{le="123.0",net_host_port="8080"} 1.0
+                http_server_request_duration_seconds_bucket{le="456.0",net_host_port="8080"} 4.0
+                http_server_request_duration_seconds_bucket{le="+Inf",net_host_port="8080"} 7.0
+                http_server_request_duration_seconds_count{net_host_port="8080"} 7.0
+                http_server_request_duration_seconds_sum{net_host_port="8080"} 579.0
+                """
+            ),
         )
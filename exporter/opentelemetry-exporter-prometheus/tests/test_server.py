@@ -0,0 +1,184 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from gzip import decompress
+from threading import Event, Thread
+from unittest import TestCase
+from unittest.mock import Mock, patch
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from opentelemetry.exporter.prometheus import PrometheusMetricReader
+from opentelemetry.exporter.prometheus._server import (
+    _accepts_gzip,
+    _accepts_openmetrics,
+    _Scraper,
+)
+from opentelemetry.sdk.metrics import MeterProvider
+
+
+class _CountingEvent:
+    """Counts the scrapes waiting for a collection."""
+
+    def __init__(self, event):
+        self._event = event
+        self.waiters = 0
+
+    def wait(self, timeout=None):
+        self.waiters += 1
+        return self._event.wait(timeout)
+
+    def set(self):
+        self._event.set()
+
+    def is_set(self):
+        return self._event.is_set()
+
+
+class TestScraper(TestCase):
+    def test_concurrent_scrapes_share_a_collection(self):
+        collecting = Event()
+        release = Event()
+
+        def collect():
+            collecting.set()
+            release.wait(5)
+            return "metrics_data"
+
+        write = Mock(return_value=b"body")
+        scraper = _Scraper(collect, write)
+        bodies = []
+        threads = [Thread(target=lambda: bodies.append(scraper.scrape())) for _ in range(3)]
+        threads[0].start()
+        collecting.wait(5)
+        done = scraper._collection.done = _CountingEvent(scraper._collection.done)
+        for thread in threads[1:]:
+            thread.start()
+        while done.waiters < 2:
+            pass
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(bodies, [b"body"] * 3)
+        write.assert_called_once_with("metrics_data", False)
+
+        # A finished collection is not reused without a cache TTL.
+        scraper.scrape()
+        self.assertEqual(write.call_count, 2)
+
+    def test_cache_ttl(self):
+        collect = Mock(return_value="metrics_data")
+        write = Mock(side_effect=lambda metrics_data, openmetrics: b"openmetrics" if openmetrics else b"text")
+        scraper = _Scraper(collect, write, cache_ttl_millis=1000)
+
+        with patch("opentelemetry.exporter.prometheus._server.monotonic") as mock_monotonic:
+            mock_monotonic.return_value = 10.0
+            self.assertEqual(scraper.scrape(), b"text")
+            mock_monotonic.return_value = 10.5
+            self.assertEqual(scraper.scrape(), b"text")
+            self.assertEqual(scraper.scrape(openmetrics=True), b"openmetrics")
+            self.assertEqual(decompress(scraper.scrape(gzip=True)), b"text")
+            self.assertEqual(collect.call_count, 1)
+            self.assertEqual(write.call_count, 2)
+
+            mock_monotonic.return_value = 11.0
+            scraper.scrape()
+            self.assertEqual(collect.call_count, 2)
+
+    def test_failed_collection_is_not_cached(self):
+        collect = Mock(side_effect=[ValueError("failed"), "metrics_data"])
+        scraper = _Scraper(collect, Mock(return_value=b"body"), cache_ttl_millis=1000)
+
+        with self.assertRaises(ValueError):
+            scraper.scrape()
+        self.assertEqual(scraper.scrape(), b"body")
+
+    def test_accepts_openmetrics(self):
+        self.assertFalse(_accepts_openmetrics(None))
+        self.assertFalse(_accepts_openmetrics("text/plain"))
+        self.assertTrue(_accepts_openmetrics("application/openmetrics-text"))
+        self.assertTrue(
+            _accepts_openmetrics(
+                "application/openmetrics-text;version=1.0.0,application/openmetrics-text;version=0.0.1;q=0.75,"
+                "text/plain;version=0.0.4;q=0.5,*/*;q=0.1"
+            )
+        )
+        self.assertFalse(_accepts_openmetrics("application/openmetrics-text;version=2.0.0"))
+
+    def test_accepts_gzip(self):
+        self.assertFalse(_accepts_gzip(None))
+        self.assertFalse(_accepts_gzip("identity"))
+        self.assertTrue(_accepts_gzip("gzip"))
+        self.assertTrue(_accepts_gzip("deflate, GZIP;q=0.5"))
+        self.assertFalse(_accepts_gzip("gzip;q=0"))
+
+
+class TestScrapeServer(TestCase):
+    def setUp(self):
+        self.reader = PrometheusMetricReader(disable_target_info=True, scope_info_enabled=False, registry=None)
+        self.meter_provider = MeterProvider(metric_readers=[self.reader])
+        self.meter_provider.get_meter("meter").create_counter("counter", description="The counter").add(1)
+
+    def tearDown(self):
+        self.meter_provider.shutdown()
+
+    def _scrape(self, path="/metrics", **headers):
+        host, port = self.reader._server.server_address
+        return urlopen(Request(f"http://{host}:{port}{path}", headers=headers), timeout=5)
+
+    def test_scrape(self):
+        self.reader.start_http_server(port=0)
+
+        with self._scrape() as response:
+            self.assertEqual(response.headers["Content-Type"], "text/plain; version=0.0.4; charset=utf-8")
+            self.assertIsNone(response.headers["Content-Encoding"])
+            self.assertEqual(
+                response.read(),
+                b"# HELP counter_total The counter\n# TYPE counter_total counter\ncounter_total 1.0\n",
+            )
+
+        with self._scrape(Accept="application/openmetrics-text", **{"Accept-Encoding": "gzip"}) as response:
+            self.assertEqual(
+                response.headers["Content-Type"],
+                "application/openmetrics-text; version=1.0.0; charset=utf-8",
+            )
+            self.assertEqual(response.headers["Content-Encoding"], "gzip")
+            self.assertEqual(
+                decompress(response.read()),
+                b"# HELP counter The counter\n# TYPE counter counter\ncounter_total 1.0\n# EOF\n",
+            )
+
+        with self._scrape("/favicon.ico") as response:
+            self.assertEqual(response.read(), b"")
+
+    def test_failed_scrape(self):
+        self.reader.start_http_server(port=0)
+
+        with patch.object(self.reader, "collect", side_effect=ValueError("failed")):
+            with self.assertLogs(level="ERROR"):
+                with self.assertRaises(HTTPError) as context:
+                    self._scrape()
+        self.assertEqual(context.exception.code, 500)
+        context.exception.close()
+
+    def test_shutdown_stops_server(self):
+        self.reader.start_http_server(port=0)
+        host, port = self.reader._server.server_address
+        self.reader.shutdown()
+
+        self.assertIsNone(self.reader._server)
+        with self.assertRaises(URLError):
+            urlopen(f"http://{host}:{port}/metrics", timeout=5)
+
+    def test_start_http_server(self):
+        with self.assertRaises(ValueError):
+            self.reader.start_http_server(port=0, cache_ttl_millis=-1)
+
+        self.reader.start_http_server(port=0)
+        server = self.reader._server
+        with self.assertLogs(level="WARNING"):
+            self.reader.start_http_server(port=0)
+        self.assertIs(self.reader._server, server)
@@ -333,5 +333,15 @@ class BoundedAttributes(MutableMapping):  # type: ignore
             copy_.dropped = self.dropped
         return copy_
 
+    def __getstate__(self) -> dict[str, object]:
+        # Locks can't be pickled, a fresh one is created on unpickling.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     def copy(self):  # type: ignore
         return self._dict.copy()  # type: ignore
@@ -11,6 +11,7 @@ from uuid import uuid4
 # pylint: disable=wrong-import-position
 from opentelemetry.context.context import Context, _RuntimeContext  # noqa
 from opentelemetry.context.contextvars_context import ContextVarsRuntimeContext
+from opentelemetry.context.persistent_context import PersistentContext
 from opentelemetry.environment_variables import OTEL_PYTHON_CONTEXT
 
 logger = logging.getLogger(__name__)
@@ -87,9 +88,11 @@ def set_value(key: str, value: object, context: Context | None = None) -> Contex
     """
     if context is None:
         context = get_current()
-    new_values = context.copy()
-    new_values[key] = value
-    return Context(new_values)
+    if isinstance(context, PersistentContext):
+        return context.set(key, value)
+    new_context = Context(context)
+    dict.__setitem__(new_context, key, value)
+    return new_context
 
 
 def get_current() -> Context:
@@ -0,0 +1,135 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+from __future__ import annotations
+
+import contextvars
+from collections.abc import Iterator, Mapping
+from contextvars import ContextVar, Token
+
+from opentelemetry.context.context import Context
+from opentelemetry.context.contextvars_context import ContextVarsRuntimeContext
+
+# The values are stored under a fixed pool of ContextVars, each key in the one
+# of its hash bucket. A ContextVar per key would never be released, as
+# ContextVars can't be weakly referenced, and keys made with
+# `opentelemetry.context.create_key` are unique.
+_BUCKETS = 256
+_BUCKET_VARS: tuple[ContextVar[tuple[tuple[str, object], ...]], ...] = tuple(
+    ContextVar(f"opentelemetry_context_bucket_{index}") for index in range(_BUCKETS)
+)
+
+
+def _bucket_var(key: str) -> ContextVar[tuple[tuple[str, object], ...]]:
+    return _BUCKET_VARS[hash(key) % _BUCKETS]
+
+
+def _set_value(values: contextvars.Context, key: str, value: object) -> bool:
+    """Sets the value in ``values`` and returns whether the key was added."""
+    bucket_var = _bucket_var(key)
+    bucket = values.get(bucket_var, ())
+    for index, (bucket_key, _) in enumerate(bucket):
+        if bucket_key == key:
+            values.run(bucket_var.set, (*bucket[:index], (key, value), *bucket[index + 1 :]))
+            return False
+    values.run(bucket_var.set, (*bucket, (key, value)))
+    return True
+
+
+class PersistentContext(Mapping[str, object]):
+    """A context backed by an immutable persistent map.
+
+    Values are stored in a `contextvars.Context`, which is a hash array mapped
+    trie, so setting a value shares the structure of the previous context
+    instead of copying it. This makes `opentelemetry.context.set_value`
+    O(log n) in the number of context keys, at a higher constant cost than
+    copying small dicts.
+
+    Unlike `Context` it is a read-only `Mapping` and not a `dict`, whose own
+    storage would be empty for code reading it directly (such as
+    `json.dumps`).
+    """
+
+    def __init__(self, values: Mapping[str, object] | None = None) -> None:
+        self._values = contextvars.Context()
+        self._len = 0
+        if values:
+            for key, value in values.items():
+                self._len += _set_value(self._values, key, value)
+
+    @classmethod
+    def _from_values(cls, values: contextvars.Context, length: int) -> PersistentContext:
+        context = cls.__new__(cls)
+        context._values = values
+        context._len = length
+        return context
+
+    def set(self, key: str, value: object) -> PersistentContext:
+        """Returns a new `PersistentContext` with the value set."""
+        values = self._values.copy()
+        added = _set_value(values, key, value)
+        return self._from_values(values, self._len + added)
+
+    def __getitem__(self, key: str) -> object:
+        for bucket_key, value in self._values.get(_bucket_var(key), ()):
+            if bucket_key == key:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: object = None) -> object:  # type: ignore[override]
+        for bucket_key, value in self._values.get(_bucket_var(key), ()):
+            if bucket_key == key:
+                return value
+        return default
+
+    def __iter__(self) -> Iterator[str]:
+        for bucket in self._values.values():
+            for key, _ in bucket:
+                yield key
+
+    def __len__(self) -> int:
+        return self._len
+
+    def copy(self) -> dict[str, object]:
+        return dict(self.items())
+
+    def __setitem__(self, key: str, value: object) -> None:
+        raise ValueError
+
+    def __delitem__(self, key: str) -> None:
+        raise ValueError
+
+    def update(self, *args: object, **kwargs: object) -> None:
+        raise ValueError
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __reduce__(self):  # type: ignore[no-untyped-def]
+        return (PersistentContext, (dict(self.items()),))
+
+
+class PersistentRuntimeContext(ContextVarsRuntimeContext):
+    """An implementation of the RuntimeContext interface which stores
+    `PersistentContext` objects in a ContextVar.
+
+    Any other `Context` is converted to a `PersistentContext` when it is
+    attached, so that values set on the current context are never copied.
+    """
+
+    def __init__(self) -> None:
+        self._current_context = ContextVar(self._CONTEXT_KEY, default=PersistentContext())
+
+    def attach(self, context: Context) -> Token[Context]:
+        """Sets the current `Context` object. Returns a
+        token that can be used to reset to the previous `Context`.
+
+        Args:
+            context: The Context to set.
+        """
+        if not isinstance(context, PersistentContext):
+            context = PersistentContext(context)
+        return self._current_context.set(context)
+
+
+__all__ = ["PersistentContext", "PersistentRuntimeContext"]
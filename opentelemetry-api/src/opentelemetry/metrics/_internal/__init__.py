@@ -31,7 +31,7 @@ The following code shows how to obtain a meter using the global :class:`.MeterPr
 
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from logging import getLogger
 from os import environ
@@ -40,6 +40,8 @@ from typing import cast
 
 from opentelemetry.environment_variables import OTEL_PYTHON_METER_PROVIDER
 from opentelemetry.metrics._internal.instrument import (
+    Asynchronous,
+    CallbackOptions,
     CallbackT,
     Counter,
     Gauge,
@@ -59,11 +61,13 @@ from opentelemetry.metrics._internal.instrument import (
     _ProxyCounter,
     _ProxyGauge,
     _ProxyHistogram,
+    _ProxyInstrument,
     _ProxyObservableCounter,
     _ProxyObservableGauge,
     _ProxyObservableUpDownCounter,
     _ProxyUpDownCounter,
 )
+from opentelemetry.metrics._internal.observation import Observation
 from opentelemetry.util._once import Once
 from opentelemetry.util._providers import _load_provider
 from opentelemetry.util.types import (
@@ -529,6 +533,65 @@ class Meter(ABC):
             description: A description for this instrument and what it measures.
         """
 
+    def register_batch_callback(  # pylint: disable=no-self-use
+        self,
+        callback: Callable[[CallbackOptions], Iterable[tuple[Asynchronous, Observation]]],
+        instruments: Sequence[Asynchronous],
+    ) -> None:
+        """Registers a callback that observes several asynchronous instruments
+        of this meter at once.
+
+        The callback is called once per collection, instead of once per
+        instrument, and returns ``(instrument, observation)`` pairs:
+
+        .. code-block:: python
+
+            def observe_pool(options):
+                stats = pool.stats()
+                yield used, Observation(stats.used)
+                yield idle, Observation(stats.idle)
+
+
+            used = meter.create_observable_gauge("pool.used")
+            idle = meter.create_observable_gauge("pool.idle")
+            meter.register_batch_callback(observe_pool, [used, idle])
+
+        Args:
+            callback: The callback to call on every collection.
+            instruments: The asynchronous instruments of this meter observed
+                by the callback.
+        """
+        warnings.warn("register_batch_callback() is not implemented and will be a no-op")
+
+
+def _register_real_batch_callback(
+    meter: Meter,
+    callback: Callable[[CallbackOptions], Iterable[tuple[Asynchronous, Observation]]],
+    instruments: Sequence[Asynchronous],
+) -> None:
+    """Registers a batch callback of a proxy meter with the real meter,
+    replacing the proxy instruments with their real instruments."""
+    # pylint: disable=protected-access
+    real_instruments = {
+        instrument: instrument._real_instrument
+        for instrument in instruments
+        if isinstance(instrument, _ProxyInstrument) and instrument._real_instrument is not None
+    }
+    if not real_instruments:
+        meter.register_batch_callback(callback, instruments)
+        return
+
+    def real_callback(
+        options: CallbackOptions,
+    ) -> Iterable[tuple[Asynchronous, Observation]]:
+        for instrument, observation in callback(options):
+            yield real_instruments.get(instrument, instrument), observation
+
+    meter.register_batch_callback(
+        real_callback,
+        [real_instruments.get(instrument, instrument) for instrument in instruments],
+    )
+
 
 class _ProxyMeter(Meter):
     def __init__(
@@ -540,6 +603,12 @@ class _ProxyMeter(Meter):
         super().__init__(name, version=version, schema_url=schema_url)
         self._lock = Lock()
         self._instruments: list[_ProxyInstrumentT] = []
+        self._batch_callbacks: list[
+            tuple[
+                Callable[[CallbackOptions], Iterable[tuple[Asynchronous, Observation]]],
+                Sequence[Asynchronous],
+            ]
+        ] = []
         self._real_meter: Meter | None = None
 
     def on_set_meter_provider(self, meter_provider: MeterProvider) -> None:
@@ -556,6 +625,9 @@ class _ProxyMeter(Meter):
             # real instruments to back themselves
             for instrument in self._instruments:
                 instrument.on_meter_set(real_meter)
+            for callback, instruments in self._batch_callbacks:
+                _register_real_batch_callback(real_meter, callback, instruments)
+            self._batch_callbacks.clear()
 
     def create_counter(
         self,
@@ -663,6 +735,17 @@ class _ProxyMeter(Meter):
             self._instruments.append(proxy)
             return proxy
 
+    def register_batch_callback(
+        self,
+        callback: Callable[[CallbackOptions], Iterable[tuple[Asynchronous, Observation]]],
+        instruments: Sequence[Asynchronous],
+    ) -> None:
+        with self._lock:
+            if self._real_meter:
+                _register_real_batch_callback(self._real_meter, callback, instruments)
+                return
+            self._batch_callbacks.append((callback, list(instruments)))
+
 
 class NoOpMeter(Meter):
     """The default Meter used when no Meter implementation is available.
@@ -828,6 +911,13 @@ class NoOpMeter(Meter):
             description=description,
         )
 
+    def register_batch_callback(
+        self,
+        callback: Callable[[CallbackOptions], Iterable[tuple[Asynchronous, Observation]]],
+        instruments: Sequence[Asynchronous],
+    ) -> None:
+        """Does nothing."""
+
 
 _METER_PROVIDER_SET_ONCE = Once()
 _METER_PROVIDER: MeterProvider | None = None
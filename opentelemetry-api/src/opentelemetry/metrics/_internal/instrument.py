@@ -97,6 +97,9 @@ class Instrument(ABC):
 
 
 class _ProxyInstrument(ABC, Generic[InstrumentT]):
+    # Methods replaced by the ones of the real instrument once it is created.
+    _delegated_methods: tuple[str, ...] = ()
+
     def __init__(
         self,
         name: str,
@@ -114,7 +117,10 @@ class _ProxyInstrument(ABC, Generic[InstrumentT]):
         # We don't need any locking on proxy instruments because it's OK if some
         # measurements get dropped while a real backing instrument is being
         # created.
-        self._real_instrument = self._create_real_instrument(meter)
+        real_instrument = self._create_real_instrument(meter)
+        for name in self._delegated_methods:
+            setattr(self, name, getattr(real_instrument, name))
+        self._real_instrument = real_instrument
 
     @abstractmethod
     def _create_real_instrument(self, meter: "metrics.Meter") -> InstrumentT:
@@ -192,6 +198,8 @@ class NoOpCounter(Counter):
 
 
 class _ProxyCounter(_ProxyInstrument[Counter], Counter):
+    _delegated_methods = ("add",)
+
     def add(
         self,
         amount: int | float,
@@ -254,6 +262,8 @@ class NoOpUpDownCounter(UpDownCounter):
 
 
 class _ProxyUpDownCounter(_ProxyInstrument[UpDownCounter], UpDownCounter):
+    _delegated_methods = ("add",)
+
     def add(
         self,
         amount: int | float,
@@ -409,6 +419,8 @@ class NoOpHistogram(Histogram):
 
 
 class _ProxyHistogram(_ProxyInstrument[Histogram], Histogram):
+    _delegated_methods = ("record",)
+
     def __init__(
         self,
         name: str,
@@ -523,6 +535,8 @@ class _ProxyGauge(
     _ProxyInstrument[Gauge],
     Gauge,
 ):
+    _delegated_methods = ("set",)
+
     def set(
         self,
         amount: int | float,
@@ -429,6 +429,9 @@ class ProxyTracer(Tracer):
                 self._schema_url,
                 self._attributes,
             )
+            # From now on calls go straight to the real tracer.
+            self.start_span = self._real_tracer.start_span  # type: ignore[method-assign]
+            self.start_as_current_span = self._real_tracer.start_as_current_span  # type: ignore[method-assign]
             return self._real_tracer
         return self._noop_tracer
 
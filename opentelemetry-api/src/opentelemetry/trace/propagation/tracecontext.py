@@ -1,6 +1,7 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 #
+import functools
 import re
 
 from opentelemetry import trace
@@ -9,6 +10,52 @@ from opentelemetry.propagators import textmap
 from opentelemetry.trace import format_span_id, format_trace_id
 from opentelemetry.trace.span import TraceState
 
+_TRACEPARENT_LENGTH = 55
+_TRACEPARENT_CHARACTERS = frozenset("0123456789abcdef-")
+# Most services receive and send a handful of distinct tracestate headers.
+_TRACESTATE_CACHE_SIZE = 128
+
+
+def _parse_traceparent(header: str) -> tuple[int, int, int] | None:
+    """Returns the trace id, span id and trace flags of a w3c traceparent
+    header, None if it is not valid.
+
+    Accepts the same headers as ``_TRACEPARENT_HEADER_FORMAT``.
+    """
+    if header.endswith("\n"):
+        # Like ``$``, a single trailing newline is allowed.
+        header = header[:-1]
+    header = header.strip(" \t")
+    length = len(header)
+    if length < _TRACEPARENT_LENGTH:
+        return None
+    # Like ``.``, the other fields don't match newlines.
+    if length > _TRACEPARENT_LENGTH and (header[_TRACEPARENT_LENGTH] != "-" or "\n" in header):
+        return None
+    if (
+        header[2] != "-"
+        or header[35] != "-"
+        or header[52] != "-"
+        or header.count("-", 0, _TRACEPARENT_LENGTH) != 3
+        or not _TRACEPARENT_CHARACTERS.issuperset(header[:_TRACEPARENT_LENGTH])
+    ):
+        return None
+    version = header[:2]
+    # Version 00 has no other fields, version ff is invalid.
+    if version == "ff" or (version == "00" and length > _TRACEPARENT_LENGTH):
+        return None
+    trace_id = int(header[3:35], 16)
+    span_id = int(header[36:52], 16)
+    if not trace_id or not span_id:
+        return None
+    return trace_id, span_id, int(header[53:55], 16)
+
+
+@functools.lru_cache(maxsize=_TRACESTATE_CACHE_SIZE)
+def _parse_tracestate(headers: tuple[str, ...]) -> TraceState:
+    # TraceState is immutable, so instances can be shared between contexts.
+    return TraceState.from_header(list(headers))
+
 
 class TraceContextTextMapPropagator(textmap.TextMapPropagator):
     """Extracts and injects using w3c TraceContext's headers."""
@@ -36,35 +83,22 @@ class TraceContextTextMapPropagator(textmap.TextMapPropagator):
         if not header:
             return context
 
-        match = re.search(self._TRACEPARENT_HEADER_FORMAT_RE, header[0])
-        if not match:
-            return context
-
-        version: str = match.group(1)
-        trace_id: str = match.group(2)
-        span_id: str = match.group(3)
-        trace_flags: str = match.group(4)
-
-        if trace_id == "0" * 32 or span_id == "0" * 16:
-            return context
-
-        if version == "00":
-            if match.group(5):  # type: ignore
-                return context
-        if version == "ff":
+        traceparent = _parse_traceparent(header[0])
+        if traceparent is None:
             return context
+        trace_id, span_id, trace_flags = traceparent
 
         tracestate_headers = getter.get(carrier, self._TRACESTATE_HEADER_NAME)
         if tracestate_headers is None:
             tracestate = None
         else:
-            tracestate = TraceState.from_header(tracestate_headers)
+            tracestate = _parse_tracestate(tuple(tracestate_headers))
 
         span_context = trace.SpanContext(
-            trace_id=int(trace_id, 16),
-            span_id=int(span_id, 16),
+            trace_id=trace_id,
+            span_id=span_id,
             is_remote=True,
-            trace_flags=trace.TraceFlags(int(trace_flags, 16)),
+            trace_flags=trace.TraceFlags(trace_flags),
             trace_state=tracestate,
         )
         return trace.set_span_in_context(trace.NonRecordingSpan(span_context), context)
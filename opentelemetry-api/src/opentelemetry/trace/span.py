@@ -247,6 +247,7 @@ class TraceState(Mapping[str, str]):
         entries: Sequence[tuple[str, str]] | None = None,
     ) -> None:
         self._dict = {}  # type: dict[str, str]
+        self._header: str | None = None
         if entries is None:
             return
         if len(entries) > _TRACECONTEXT_MAXIMUM_TRACESTATE_KEYS:
@@ -361,7 +362,10 @@ class TraceState(Mapping[str, str]):
             A string that adheres to the w3c tracestate
             header format.
         """
-        return ",".join(key + "=" + value for key, value in self._dict.items())
+        # The entries never change, so the header is only created once.
+        if self._header is None:
+            self._header = ",".join(key + "=" + value for key, value in self._dict.items())
+        return self._header
 
     @classmethod
     def from_header(cls, header_list: list[str]) -> TraceState:
@@ -5,6 +5,7 @@
 
 import copy
 import logging
+import pickle
 import threading
 import unittest
 import unittest.mock
@@ -365,3 +366,14 @@ class TestBoundedAttributes(unittest.TestCase):
 
         with self.assertRaises(TypeError):
             bdict_copy["invalid"] = "invalid"
+
+    def test_pickle(self):
+        bdict = BoundedAttributes(maxlen=4, attributes=self.base, immutable=True)
+        bdict.dropped = 10
+        bdict_copy = pickle.loads(pickle.dumps(bdict))
+
+        self.assertEqual(dict(bdict_copy), dict(bdict))
+        self.assertEqual(bdict_copy.dropped, bdict.dropped)
+        self.assertEqual(bdict_copy.maxlen, bdict.maxlen)
+        with self.assertRaises(TypeError):
+            bdict_copy["invalid"] = "invalid"
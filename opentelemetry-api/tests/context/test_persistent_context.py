@@ -0,0 +1,114 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import copy
+import json
+import pickle
+import unittest
+from unittest.mock import patch
+
+from opentelemetry import context
+from opentelemetry.context.context import Context
+from opentelemetry.context.persistent_context import (
+    _BUCKET_VARS,
+    PersistentContext,
+    PersistentRuntimeContext,
+)
+from opentelemetry.environment_variables import OTEL_PYTHON_CONTEXT
+
+# pylint: disable=import-error,no-name-in-module
+from tests.context.base_context import ContextTestCases
+
+
+class TestPersistentRuntimeContext(ContextTestCases.BaseTest):
+    # pylint: disable=invalid-name
+    def setUp(self) -> None:
+        super().setUp()
+        self.mock_runtime = patch.object(
+            context,
+            "_RUNTIME_CONTEXT",
+            PersistentRuntimeContext(),
+        )
+        self.mock_runtime.start()
+
+    # pylint: disable=invalid-name
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.mock_runtime.stop()
+
+    def test_current_context_is_persistent(self):
+        self.assertIsInstance(context.get_current(), PersistentContext)
+        self.assertIsInstance(context.set_value("a", "b"), PersistentContext)
+
+        context.attach(Context({"a": "b"}))
+        self.assertIsInstance(context.get_current(), PersistentContext)
+        self.assertEqual(context.get_value("a"), "b")
+
+    @patch.dict("os.environ", {OTEL_PYTHON_CONTEXT: "persistent_context"})
+    def test_load_runtime_context(self):  # type: ignore[misc]
+        ctx = context._load_runtime_context()  # pylint: disable=W0212
+        self.assertIsInstance(ctx, PersistentRuntimeContext)
+
+
+class TestPersistentContext(unittest.TestCase):
+    def test_set(self):
+        first = PersistentContext({"a": 1})
+        second = first.set("b", 2)
+        third = second.set("a", 3)
+
+        self.assertEqual(first, {"a": 1})
+        self.assertEqual(second, {"a": 1, "b": 2})
+        self.assertEqual(third, {"a": 3, "b": 2})
+        self.assertNotEqual(first, second)
+
+    def test_mapping(self):
+        ctx = PersistentContext({"a": 1, "b": 2})
+
+        self.assertEqual(ctx["a"], 1)
+        self.assertEqual(ctx.get("c", 3), 3)
+        self.assertIsNone(ctx.get("unknown-key"))
+        self.assertIn("a", ctx)
+        self.assertNotIn("c", ctx)
+        self.assertEqual(len(ctx), 2)
+        self.assertTrue(ctx)
+        self.assertFalse(PersistentContext())
+        self.assertEqual(sorted(ctx), ["a", "b"])
+        self.assertEqual(dict(ctx), {"a": 1, "b": 2})
+        self.assertEqual(ctx.copy(), {"a": 1, "b": 2})
+        self.assertEqual(repr(PersistentContext({"a": 1})), "{'a': 1}")
+        with self.assertRaises(KeyError):
+            ctx["c"]  # pylint: disable=pointless-statement
+
+    def test_dict(self):
+        ctx = PersistentContext({"a": 1}).set("b", 2)
+
+        self.assertEqual(dict(ctx), {"a": 1, "b": 2})
+        self.assertEqual({**ctx}, {"a": 1, "b": 2})
+        self.assertEqual(json.loads(json.dumps(ctx.copy())), {"a": 1, "b": 2})
+        self.assertEqual(copy.copy(ctx), {"a": 1, "b": 2})
+
+    def test_many_keys(self):
+        keys = [context.create_key("key") for _ in range(2 * len(_BUCKET_VARS))]
+        ctx = PersistentContext()
+        for index, key in enumerate(keys):
+            ctx = ctx.set(key, index)
+        ctx = ctx.set(keys[0], -1)
+
+        self.assertEqual(len(ctx), len(keys))
+        self.assertEqual(dict(ctx), {key: -1 if index == 0 else index for index, key in enumerate(keys)})
+        self.assertLessEqual(len(ctx._values), len(_BUCKET_VARS))  # pylint: disable=protected-access
+
+    def test_immutable(self):
+        ctx = PersistentContext({"a": 1})
+        with self.assertRaises(ValueError):
+            ctx["a"] = 2
+        with self.assertRaises(ValueError):
+            ctx.update({"a": 2})
+        self.assertEqual(ctx, {"a": 1})
+
+    def test_pickle(self):
+        ctx = PersistentContext({"a": 1})
+        unpickled = pickle.loads(pickle.dumps(ctx))
+
+        self.assertIsInstance(unpickled, PersistentContext)
+        self.assertEqual(unpickled, ctx)
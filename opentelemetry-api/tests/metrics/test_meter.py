@@ -166,3 +166,14 @@ class TestMeter(TestCase):
 
         self.assertTrue(hasattr(Meter, "create_observable_up_down_counter"))
         self.assertTrue(Meter.create_observable_up_down_counter.__isabstractmethod__)
+
+    def test_register_batch_callback(self):
+        """
+        Test that the meter provides a function to register a batch callback,
+        which is a no-op unless it is implemented
+        """
+
+        self.assertFalse(getattr(Meter.register_batch_callback, "__isabstractmethod__", False))
+        with self.assertWarns(UserWarning):
+            ChildMeter("name").register_batch_callback(Mock(), [])
+        NoOpMeter("name").register_batch_callback(Mock(), [])
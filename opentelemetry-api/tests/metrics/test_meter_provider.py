@@ -15,6 +15,7 @@ from opentelemetry.environment_variables import OTEL_PYTHON_METER_PROVIDER
 from opentelemetry.metrics import (
     NoOpMeter,
     NoOpMeterProvider,
+    Observation,
     get_meter_provider,
     set_meter_provider,
 )
@@ -249,14 +250,42 @@ class TestProxy(MetricsGlobalsTest, TestCase):
         real_histogram.assert_not_called()
         real_gauge.assert_not_called()
 
+        # The measurement methods of the real instruments are called directly.
+        self.assertEqual(proxy_counter.add, real_counter.add)
+        self.assertEqual(proxy_updowncounter.add, real_updowncounter.add)
+        self.assertEqual(proxy_histogram.record, real_histogram.record)
+        self.assertEqual(proxy_gauge.set, real_gauge.set)
         proxy_counter.add(amount, attributes=attributes)
-        real_counter.add.assert_called_once_with(amount, attributes, None)
+        real_counter.add.assert_called_once_with(amount, attributes=attributes)
         proxy_updowncounter.add(amount, attributes=attributes)
-        real_updowncounter.add.assert_called_once_with(amount, attributes, None)
+        real_updowncounter.add.assert_called_once_with(amount, attributes=attributes)
         proxy_histogram.record(amount, attributes=attributes)
-        real_histogram.record.assert_called_once_with(amount, attributes, None)
+        real_histogram.record.assert_called_once_with(amount, attributes=attributes)
         proxy_gauge.set(amount, attributes=attributes)
-        real_gauge.set.assert_called_once_with(amount, attributes, None)
+        real_gauge.set.assert_called_once_with(amount, attributes=attributes)
+
+    def test_proxy_meter_batch_callback(self):
+        proxy_meter: _ProxyMeter = _ProxyMeterProvider().get_meter("foo")
+        proxy_gauge = proxy_meter.create_observable_gauge("gauge")
+        observation = Observation(1)
+
+        def callback(options):
+            yield proxy_gauge, observation
+
+        proxy_meter.register_batch_callback(callback, [proxy_gauge])
+
+        # The batch callback is registered with the real meter once it is
+        # set, with the real instruments
+        real_meter_provider = Mock()
+        proxy_meter.on_set_meter_provider(real_meter_provider)
+        real_meter: Mock = real_meter_provider.get_meter()
+        real_gauge = real_meter.create_observable_gauge()
+        ((real_callback, instruments), _) = real_meter.register_batch_callback.call_args
+        self.assertEqual(instruments, [real_gauge])
+        self.assertEqual(list(real_callback(Mock())), [(real_gauge, observation)])
+
+        proxy_meter.register_batch_callback(callback, [proxy_gauge])
+        self.assertEqual(real_meter.register_batch_callback.call_count, 2)
 
     def test_proxy_meter_with_real_meter(self) -> None:
         # Creating new instruments on the _ProxyMeter with a real meter set
@@ -3,6 +3,7 @@
 
 # type: ignore
 
+import random
 import unittest
 from unittest.mock import Mock, patch
 
@@ -14,6 +15,18 @@ from opentelemetry.trace.span import TraceState
 FORMAT = tracecontext.TraceContextTextMapPropagator()
 
 
+def _parse_traceparent_with_regex(header):
+    match = FORMAT._TRACEPARENT_HEADER_FORMAT_RE.search(header)
+    if not match:
+        return None
+    version, trace_id, span_id, trace_flags, future = match.groups()
+    if trace_id == "0" * 32 or span_id == "0" * 16:
+        return None
+    if version == "ff" or (version == "00" and future):
+        return None
+    return int(trace_id, 16), int(span_id, 16), int(trace_flags, 16)
+
+
 class TestTraceContextFormat(unittest.TestCase):
     TRACE_ID = int("12345678901234567890123456789012", 16)  # type:int
     SPAN_ID = int("1234567890123456", 16)  # type:int
@@ -279,3 +292,88 @@ class TestTraceContextFormat(unittest.TestCase):
 
                 ctx = FORMAT.extract(carrier)
                 self.assertDictEqual(Context(), ctx)
+
+    def test_extract_traceparent_formats(self):
+        trace_parent_headers = {
+            " \t00-12345678901234567890123456789012-1234567890123456-01 \t": True,
+            "01-12345678901234567890123456789012-1234567890123456-01-future": True,
+            "ff-12345678901234567890123456789012-1234567890123456-01": False,
+            "00-1234567890123456789012345678901A-1234567890123456-01": False,
+            "00-1234567890123456789012345678901_-1234567890123456-01": False,
+            "00-12345678901234567890123456789012-1234567890123456-0": False,
+            "00-12345678901234567890123456789012-1234567890123456-01x": False,
+            "00-12345678901234567890123456789012+1234567890123456-01": False,
+            "00-12345678901234567890123456789012-1234567890123456-01\n": True,
+            "00-12345678901234567890123456789012-1234567890123456-01 \t\n": True,
+            "00-12345678901234567890123456789012-1234567890123456-01\n\n": False,
+            "00-12345678901234567890123456789012-1234567890123456-01\n ": False,
+            "\n00-12345678901234567890123456789012-1234567890123456-01": False,
+            "01-12345678901234567890123456789012-1234567890123456-01-future\n": True,
+            "01-12345678901234567890123456789012-1234567890123456-01-fu\nture": False,
+            "01-12345678901234567890123456789012-1234567890123456-01-fu\rture": True,
+        }
+        for trace_parent, valid in trace_parent_headers.items():
+            with self.subTest(trace_parent=trace_parent):
+                span_context = trace.get_current_span(
+                    FORMAT.extract({"traceparent": [trace_parent]})
+                ).get_span_context()
+                self.assertEqual(span_context.is_valid, valid)
+                self.assertEqual(
+                    tracecontext._parse_traceparent(trace_parent),
+                    _parse_traceparent_with_regex(trace_parent),
+                )
+                if valid:
+                    self.assertEqual(span_context.trace_id, self.TRACE_ID)
+                    self.assertEqual(span_context.span_id, self.SPAN_ID)
+                    self.assertEqual(span_context.trace_flags, 1)
+
+    def test_parse_traceparent_matches_regex(self):
+        header = "01-12345678901234567890123456789012-1234567890123456-01-future"
+        characters = "0-af \t\n\rx"
+        rand = random.Random(0)
+        for _ in range(20000):
+            mutated = list(header[: rand.choice((54, 55, 56, 62))])
+            for _ in range(rand.randint(1, 3)):
+                position = rand.randrange(len(mutated) + 1)
+                mutated.insert(position, rand.choice(characters))
+                if rand.random() < 0.5 and len(mutated) > 1:
+                    del mutated[rand.randrange(len(mutated))]
+            mutated = "".join(mutated)
+            self.assertEqual(
+                tracecontext._parse_traceparent(mutated),
+                _parse_traceparent_with_regex(mutated),
+                repr(mutated),
+            )
+
+    def test_extract_reuses_trace_state(self):
+        carrier = {
+            "traceparent": ["00-12345678901234567890123456789012-1234567890123456-01"],
+            "tracestate": ["foo=1,bar=2"],
+        }
+        trace_state = trace.get_current_span(FORMAT.extract(carrier)).get_span_context().trace_state
+        other_trace_state = trace.get_current_span(FORMAT.extract(carrier)).get_span_context().trace_state
+        self.assertIs(trace_state, other_trace_state)
+        self.assertEqual(trace_state, {"foo": "1", "bar": "2"})
+
+    def test_inject_reuses_tracestate_header(self):
+        span_context = trace.SpanContext(
+            self.TRACE_ID,
+            self.SPAN_ID,
+            is_remote=False,
+            trace_flags=trace.TraceFlags(trace.TraceFlags.SAMPLED),
+            trace_state=TraceState([("foo", "1")]),
+        )
+        ctx = trace.set_span_in_context(trace.NonRecordingSpan(span_context))
+        output: dict[str, str] = {}
+        other_output: dict[str, str] = {}
+        FORMAT.inject(output, context=ctx)
+        FORMAT.inject(other_output, context=ctx)
+
+        self.assertEqual(
+            output,
+            {
+                "traceparent": "00-12345678901234567890123456789012-1234567890123456-01",
+                "tracestate": "foo=1",
+            },
+        )
+        self.assertIs(output["tracestate"], other_output["tracestate"])
@@ -74,6 +74,16 @@ class TestProxy(TraceGlobalsTest, unittest.TestCase):
         with tracer.start_span("") as span:
             self.assertIsInstance(span, SpanTest)
 
+        # the methods of the real tracer are now called directly
+        self.assertIsInstance(tracer._real_tracer, TestTracer)
+        self.assertEqual(tracer.start_span, tracer._real_tracer.start_span)
+        self.assertEqual(
+            tracer.start_as_current_span,
+            tracer._real_tracer.start_as_current_span,
+        )
+        with tracer.start_as_current_span("") as span:
+            self.assertIsInstance(span, SpanTest)
+
     def test_late_config(self):
         # get a tracer and instrument a function as we would at the
         # root of a module
@@ -5,28 +5,38 @@ import logging
 
 import pytest
 
+from opentelemetry._logs import SeverityNumber
 from opentelemetry.sdk._logs import LoggerProvider, LoggingHandler
+from opentelemetry.sdk._logs._internal import _LoggerConfig
 from opentelemetry.sdk._logs.export import (
     InMemoryLogRecordExporter,
     SimpleLogRecordProcessor,
 )
 
 
-def _set_up_logging_handler(level):
-    logger_provider = LoggerProvider()
+def _set_up_logging_handler(level, logger_configurator=None, **handler_kwargs):
+    logger_provider = LoggerProvider(_logger_configurator=logger_configurator)
     exporter = InMemoryLogRecordExporter()
     processor = SimpleLogRecordProcessor(exporter=exporter)
     logger_provider.add_log_record_processor(processor)
-    handler = LoggingHandler(level=level, logger_provider=logger_provider)
+    handler = LoggingHandler(level=level, logger_provider=logger_provider, **handler_kwargs)
     return handler
 
 
 def _create_logger(handler, name):
     logger = logging.getLogger(name)
     logger.addHandler(handler)
+    # Only measure this handler, not the ones installed on the root logger.
+    logger.propagate = False
     return logger
 
 
+def _remove_handler(handler, loggers):
+    for logger in loggers:
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+
 @pytest.mark.parametrize("num_loggers", [1, 10, 100, 1000])
 def test_simple_get_logger_different_names(benchmark, num_loggers):
     handler = _set_up_logging_handler(level=logging.DEBUG)
@@ -37,3 +47,58 @@ def test_simple_get_logger_different_names(benchmark, num_loggers):
             loggers[index % num_loggers].warning("test message")
 
     benchmark(benchmark_get_logger)
+    _remove_handler(handler, loggers)
+
+
+@pytest.mark.parametrize("num_extra_attributes", [0, 5])
+def test_logging_handler_extra_attributes(benchmark, num_extra_attributes):
+    handler = _set_up_logging_handler(level=logging.DEBUG)
+    logger = _create_logger(handler, "extra_attributes_logger")
+    extra = {f"extra_{i}": i for i in range(num_extra_attributes)}
+
+    def benchmark_warning():
+        logger.warning("test message", extra=extra)
+
+    benchmark(benchmark_warning)
+    _remove_handler(handler, [logger])
+
+
+def test_logging_handler_exception(benchmark):
+    handler = _set_up_logging_handler(level=logging.DEBUG)
+    logger = _create_logger(handler, "exception_logger")
+    try:
+        raise ValueError("benchmark exception")
+    except ValueError:
+        benchmark(logger.exception, "test message")
+    _remove_handler(handler, [logger])
+
+
+@pytest.mark.parametrize("non_blocking", [False, True])
+def test_logging_handler_non_blocking(benchmark, non_blocking):
+    handler = _set_up_logging_handler(
+        level=logging.DEBUG,
+        non_blocking=non_blocking,
+        max_queue_size=1_000_000,
+    )
+    logger = _create_logger(handler, "non_blocking_logger")
+
+    def benchmark_warning():
+        logger.warning("test message %s", "argument")
+
+    # Only the time spent in the logging call is measured.
+    benchmark(benchmark_warning)
+    _remove_handler(handler, [logger])
+    handler.close()
+
+
+def test_logging_handler_minimum_severity_filtered(benchmark):
+    handler = _set_up_logging_handler(
+        level=logging.DEBUG,
+        logger_configurator=lambda _scope: _LoggerConfig(minimum_severity=SeverityNumber.WARN),
+    )
+    logger = _create_logger(handler, "minimum_severity_logger")
+    logger.setLevel(logging.DEBUG)
+
+    benchmark(logger.debug, "test message %s", "argument")
+    _remove_handler(handler, [logger])
+    logger.setLevel(logging.NOTSET)
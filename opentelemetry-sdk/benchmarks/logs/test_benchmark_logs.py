@@ -4,7 +4,8 @@
 import pytest
 
 from opentelemetry._logs import SeverityNumber
-from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs import LoggerProvider, LogRecordProcessor
+from opentelemetry.sdk._logs._internal import _LoggerConfig
 from opentelemetry.sdk._logs.export import (
     BatchLogRecordProcessor,
     InMemoryLogRecordExporter,
@@ -31,6 +32,29 @@ batch_provider.add_log_record_processor(BatchLogRecordProcessor(batch_exporter))
 batch_logger = batch_provider.get_logger("batch_logger")
 
 
+class AttributesReadingProcessor(LogRecordProcessor):
+    def on_emit(self, log_record):
+        dict(log_record.log_record.attributes)
+
+    def shutdown(self):
+        pass
+
+    def force_flush(self, timeout_millis=30000):
+        return True
+
+
+reading_provider = LoggerProvider(resource=resource)
+reading_provider.add_log_record_processor(AttributesReadingProcessor())
+reading_logger = reading_provider.get_logger("reading_logger")
+
+filtered_provider = LoggerProvider(
+    resource=resource,
+    _logger_configurator=lambda _scope: _LoggerConfig(minimum_severity=SeverityNumber.WARN),
+)
+filtered_provider.add_log_record_processor(SimpleLogRecordProcessor(InMemoryLogRecordExporter()))
+filtered_logger = filtered_provider.get_logger("filtered_logger")
+
+
 @pytest.mark.parametrize("num_attributes", [0, 1, 3, 5, 10])
 def test_simple_log_record_processor(benchmark, num_attributes):
     attributes = {f"key{i}": f"value{i}" for i in range(num_attributes)}
@@ -61,6 +85,21 @@ def test_batch_log_record_processor(benchmark, num_attributes):
     benchmark(benchmark_emit)
 
 
+@pytest.mark.parametrize("num_attributes", [0, 1, 3, 5, 10])
+def test_attributes_reading_processor(benchmark, num_attributes):
+    attributes = {f"key{i}": f"value{i}" for i in range(num_attributes)}
+
+    def benchmark_emit():
+        reading_logger.emit(
+            severity_number=SeverityNumber.INFO,
+            body="benchmark log message",
+            attributes=attributes,
+            event_name="test.event",
+        )
+
+    benchmark(benchmark_emit)
+
+
 def test_get_logger(benchmark):
     def benchmark_get_logger():
         simple_provider.get_logger(
@@ -70,3 +109,17 @@ def test_get_logger(benchmark):
         )
 
     benchmark(benchmark_get_logger)
+
+
+def test_minimum_severity_filtered(benchmark):
+    attributes = {f"key{i}": f"value{i}" for i in range(5)}
+
+    def benchmark_emit():
+        filtered_logger.emit(
+            severity_number=SeverityNumber.DEBUG,
+            body="benchmark log message",
+            attributes=attributes,
+            event_name="test.event",
+        )
+
+    benchmark(benchmark_emit)
@@ -1,8 +1,13 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
+from itertools import count
+from time import sleep
+
 import pytest
 
-from opentelemetry.sdk.metrics import Counter, MeterProvider
+from opentelemetry.metrics import Observation
+from opentelemetry.metrics._internal import _ProxyMeterProvider
+from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
 from opentelemetry.sdk.metrics._internal import (
     _default_meter_configurator,
     _disable_meter_configurator,
@@ -13,6 +18,7 @@ from opentelemetry.sdk.metrics.export import (
     AggregationTemporality,
     InMemoryMetricReader,
 )
+from opentelemetry.sdk.metrics.view import View
 from opentelemetry.sdk.util.instrumentation import _scope_name_matches_glob
 
 reader_cumulative = InMemoryMetricReader()
@@ -105,3 +111,146 @@ def test_counter_add_with_meter_configurator_rules(benchmark, num_meter_configur
 
     benchmark(benchmark_counter_add)
     provider_reader_cumulative._set_meter_configurator(meter_configurator=_default_meter_configurator)
+
+
+@pytest.mark.parametrize("attributes", [None, {"key": "value"}])
+def test_get_meter(benchmark, attributes):
+    def benchmark_get_meter():
+        provider_reader_cumulative.get_meter(
+            "test_meter",
+            version="1.0.0",
+            schema_url="https://opentelemetry.io/schemas/1.38.0",
+            attributes=attributes,
+        )
+
+    benchmark(benchmark_get_meter)
+
+
+@pytest.mark.parametrize("proxy", [False, True])
+def test_proxy_counter_add(benchmark, proxy):
+    if proxy:
+        proxy_meter_provider = _ProxyMeterProvider()
+        counter = proxy_meter_provider.get_meter("proxy_meter").create_counter("proxy_counter")
+        proxy_meter_provider.on_set_meter_provider(provider_reader_cumulative)
+    else:
+        counter = provider_reader_cumulative.get_meter("proxy_meter").create_counter("proxy_counter")
+    labels = {"Key": "Value"}
+
+    def benchmark_counter_add():
+        counter.add(1, labels)
+
+    benchmark(benchmark_counter_add)
+
+
+@pytest.mark.parametrize("temporality", ["delta", "cumulative_ttl"])
+def test_collect_rotating_attributes(benchmark, temporality):
+    # Every collection sees 100 new attribute sets, like pod names or tenant
+    # ids that are only used for a while.
+    if temporality == "delta":
+        reader = InMemoryMetricReader(preferred_temporality={Counter: AggregationTemporality.DELTA})
+        provider = MeterProvider(metric_readers=[reader])
+    else:
+        reader = InMemoryMetricReader()
+        provider = MeterProvider(metric_readers=[reader], idle_series_ttl_millis=1)
+    counter = provider.get_meter("rotating_meter").create_counter("rotating_counter")
+    generation = 0
+
+    def benchmark_collect():
+        nonlocal generation
+        generation += 1
+        for i in range(100):
+            counter.add(1, {"tenant": f"{generation}-{i}"})
+        reader.get_metrics_data()
+
+    benchmark(benchmark_collect)
+    provider.shutdown()
+
+
+@pytest.mark.parametrize(
+    "temporality",
+    [AggregationTemporality.CUMULATIVE, AggregationTemporality.DELTA],
+    ids=["cumulative", "delta"],
+)
+@pytest.mark.parametrize("num_readers", [1, 2, 4])
+def test_counter_add_multiple_readers(benchmark, num_readers, temporality):
+    provider = MeterProvider(
+        metric_readers=[InMemoryMetricReader(preferred_temporality={Counter: temporality}) for _ in range(num_readers)]
+    )
+    counter = provider.get_meter("readers_meter").create_counter("readers_counter")
+    labels = {"Key": "Value"}
+
+    def benchmark_counter_add():
+        counter.add(1, labels)
+
+    benchmark(benchmark_counter_add)
+    provider.shutdown()
+
+
+@pytest.mark.parametrize("temporality", ["delta", "cumulative"])
+def test_collect_many_instruments(benchmark, temporality):
+    # 200 instruments with 50 series each, only 10 of the instruments are
+    # measured between collections.
+    if temporality == "delta":
+        reader = InMemoryMetricReader(preferred_temporality={Counter: AggregationTemporality.DELTA})
+    else:
+        reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader])
+    meter = provider.get_meter("many_instruments_meter")
+    counters = [meter.create_counter(f"counter_{i}") for i in range(200)]
+    for counter in counters:
+        for i in range(50):
+            counter.add(1, {"series": i})
+    reader.get_metrics_data()
+
+    def benchmark_collect():
+        for counter in counters[:10]:
+            for i in range(50):
+                counter.add(1, {"series": i})
+        reader.get_metrics_data()
+
+    benchmark(benchmark_collect)
+    provider.shutdown()
+
+
+@pytest.mark.parametrize("callback_max_workers", [None, 4, 16])
+def test_collect_blocking_callbacks(benchmark, callback_max_workers):
+    # 16 callbacks that block for 1 ms, like reading a cgroup file or the
+    # stats of a connection pool.
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader], callback_max_workers=callback_max_workers)
+    meter = provider.get_meter("callbacks_meter")
+
+    def callback(options):
+        sleep(0.001)
+        return [Observation(1)]
+
+    for i in range(16):
+        meter.create_observable_gauge(f"gauge_{i}", callbacks=[callback])
+
+    benchmark(reader.get_metrics_data)
+    provider.shutdown()
+
+
+@pytest.mark.parametrize("num_views", [10, 100, 1000])
+def test_create_instruments_with_views(benchmark, num_views):
+    # Most of the views select an instrument by its exact name, some by a
+    # wildcard name and some by the instrument type. The views of an
+    # instrument are matched on its first measurement.
+    views = []
+    for i in range(num_views):
+        if i % 10 == 0:
+            views.append(View(instrument_name=f"wildcard_{i}_*"))
+        elif i % 10 == 1:
+            views.append(View(instrument_type=Histogram, meter_name=f"meter_{i}"))
+        else:
+            views.append(View(instrument_name=f"counter_{i}"))
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader], views=views)
+    meter = provider.get_meter("views_meter")
+    names = count()
+
+    def benchmark_create_counter():
+        meter.create_counter(f"counter_{next(names)}").add(1)
+
+    benchmark(benchmark_create_counter)
+    provider.shutdown()
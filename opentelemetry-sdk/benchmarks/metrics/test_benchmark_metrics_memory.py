@@ -0,0 +1,89 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+import tracemalloc
+
+import pytest
+
+from opentelemetry.sdk.metrics import (
+    AlwaysOffExemplarFilter,
+    AlwaysOnExemplarFilter,
+    MeterProvider,
+    TraceBasedExemplarFilter,
+)
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+NUM_SERIES = 10_000
+
+exemplar_filters = {
+    "always_off": AlwaysOffExemplarFilter,
+    "trace_based": TraceBasedExemplarFilter,
+    "always_on": AlwaysOnExemplarFilter,
+}
+
+
+@pytest.mark.parametrize("exemplar_filter", list(exemplar_filters))
+def test_counter_series_memory(benchmark, exemplar_filter):
+    """Measures the memory held by each counter series.
+
+    The time reported is the time taken to create ``NUM_SERIES`` series, the
+    traced memory per series is reported as ``bytes_per_series`` in the
+    extra info of the benchmark.
+    """
+    bytes_per_series = []
+
+    def benchmark_create_series():
+        meter_provider = MeterProvider(
+            metric_readers=[InMemoryMetricReader()],
+            exemplar_filter=exemplar_filters[exemplar_filter](),
+            shutdown_on_exit=False,
+        )
+        counter = meter_provider.get_meter("sdk_meter_provider").create_counter("test_counter")
+        # The first measurement builds the metric storage of the counter.
+        counter.add(1)
+
+        tracemalloc.start()
+        for i in range(NUM_SERIES):
+            counter.add(1, {"series": i})
+        traced_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        bytes_per_series.append(traced_memory / NUM_SERIES)
+
+    benchmark.pedantic(benchmark_create_series, rounds=3)
+    benchmark.extra_info["bytes_per_series"] = min(bytes_per_series)
+
+
+@pytest.mark.parametrize("instrument", ["counter", "histogram"])
+def test_collect_series_memory(benchmark, instrument):
+    """Measures the memory allocated by a collection for each series.
+
+    The collected metrics are kept while the traced memory is read, the
+    traced memory per series is reported as ``bytes_per_series`` in the
+    extra info of the benchmark.
+    """
+    reader = InMemoryMetricReader()
+    meter_provider = MeterProvider(
+        metric_readers=[reader],
+        exemplar_filter=AlwaysOffExemplarFilter(),
+        shutdown_on_exit=False,
+    )
+    meter = meter_provider.get_meter("sdk_meter_provider")
+    if instrument == "counter":
+        record = meter.create_counter("test_counter").add
+    else:
+        record = meter.create_histogram("test_histogram").record
+    for i in range(NUM_SERIES):
+        record(1, {"series": i})
+    reader.get_metrics_data()
+    bytes_per_series = []
+
+    def benchmark_collect():
+        tracemalloc.start()
+        metrics_data = reader.get_metrics_data()
+        traced_memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        bytes_per_series.append(traced_memory / NUM_SERIES)
+        del metrics_data
+
+    benchmark.pedantic(benchmark_collect, rounds=3)
+    benchmark.extra_info["bytes_per_series"] = min(bytes_per_series)
+    meter_provider.shutdown()
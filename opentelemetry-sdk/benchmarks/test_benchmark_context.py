@@ -0,0 +1,41 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=redefined-outer-name
+from unittest.mock import patch
+
+import pytest
+
+from opentelemetry import context
+from opentelemetry.context.contextvars_context import ContextVarsRuntimeContext
+from opentelemetry.context.persistent_context import PersistentRuntimeContext
+
+
+@pytest.fixture(params=[ContextVarsRuntimeContext, PersistentRuntimeContext])
+def runtime_context(request):
+    with patch.object(context, "_RUNTIME_CONTEXT", request.param()):
+        yield
+
+
+@pytest.fixture(params=[1, 10, 100, 1000])
+def context_size(request, runtime_context):
+    token = context.attach(context.get_current())
+    for index in range(request.param):
+        context.attach(context.set_value(f"key{index}", index))
+    yield request.param
+    context.detach(token)
+
+
+def test_set_value(benchmark, context_size):
+    benchmark(context.set_value, "key", "value")
+
+
+def test_get_value(benchmark, context_size):
+    benchmark(context.get_value, "key0")
+
+
+def test_attach_detach(benchmark, context_size):
+    def attach_detach():
+        context.detach(context.attach(context.set_value("key", "value")))
+
+    benchmark(attach_detach)
@@ -0,0 +1,47 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import threading
+
+import pytest
+
+from opentelemetry.sdk.trace.id_generator import (
+    BufferedRandomIdGenerator,
+    RandomIdGenerator,
+)
+
+# Total work is fixed regardless of thread count so that ideal parallelism
+# would produce a flat wall-clock time across thread counts.
+_TOTAL_IDS = 100_000
+
+
+@pytest.fixture(params=[RandomIdGenerator, BufferedRandomIdGenerator])
+def id_generator(request):
+    return request.param()
+
+
+def test_generate_span_id(benchmark, id_generator):
+    benchmark(id_generator.generate_span_id)
+
+
+def test_generate_trace_id(benchmark, id_generator):
+    benchmark(id_generator.generate_trace_id)
+
+
+@pytest.mark.parametrize("num_threads", [1, 2, 4, 8])
+def test_generate_ids_threads(benchmark, id_generator, num_threads):
+    ids_per_thread = _TOTAL_IDS // num_threads
+
+    def worker():
+        for _ in range(ids_per_thread):
+            id_generator.generate_trace_id()
+            id_generator.generate_span_id()
+
+    def benchmark_fn():
+        threads = [threading.Thread(target=worker) for _ in range(num_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    benchmark(benchmark_fn)
@@ -0,0 +1,50 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from opentelemetry.sdk.trace._sampling_experimental import (
+    composable_always_off,
+    composable_always_on,
+    composable_rule_based,
+    composite_sampler,
+)
+from opentelemetry.sdk.trace._sampling_experimental._rule_based import (
+    AllPredicate,
+    AttributePatternsPredicate,
+    SpanKindPredicate,
+    SpanNamePredicate,
+)
+from opentelemetry.trace import SpanKind
+
+TRACE_ID = int("00112233445566778800000000000000", 16)
+
+
+def _rules(num_rules):
+    rules = []
+    for index in range(num_rules):
+        if index % 2:
+            predicate = SpanNamePredicate([f"GET /api/v{index}/*"])
+        else:
+            predicate = AllPredicate(
+                [
+                    SpanKindPredicate([SpanKind.SERVER]),
+                    AttributePatternsPredicate("http.route", included=[f"/api/v{index}/*"]),
+                ]
+            )
+        rules.append((predicate, composable_always_off()))
+    # The matching rule is evaluated last.
+    rules.append((SpanNamePredicate(["GET /users/{id}"]), composable_always_on()))
+    return rules
+
+
+@pytest.mark.parametrize("num_rules", [10, 50, 200])
+@pytest.mark.parametrize("decision_cache_size", [0, 1024])
+def test_rule_based_should_sample(benchmark, num_rules, decision_cache_size):
+    sampler = composite_sampler(composable_rule_based(_rules(num_rules), decision_cache_size=decision_cache_size))
+    attributes = {"http.route": "/users/{id}", "http.request.method": "GET"}
+
+    def benchmark_should_sample():
+        sampler.should_sample(None, TRACE_ID, "GET /users/{id}", SpanKind.SERVER, attributes)
+
+    benchmark(benchmark_should_sample)
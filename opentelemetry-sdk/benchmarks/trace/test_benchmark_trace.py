@@ -2,16 +2,21 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import threading
+import time
 import tracemalloc
 from functools import lru_cache
+from unittest.mock import patch
 
 import pytest
 
+from opentelemetry import trace as trace_api
 from opentelemetry.attributes import BoundedAttributes
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import (
+    ConcurrentMultiSpanProcessor,
     ReadableSpan,
     SpanProcessor,
+    SynchronousMultiSpanProcessor,
     TracerProvider,
     _default_tracer_configurator,
     _RuleBasedTracerConfigurator,
@@ -148,6 +153,34 @@ def test_simple_start_as_current_span(benchmark):
     benchmark(benchmark_start_as_current_span)
 
 
+def test_nested_start_as_current_span(benchmark):
+    def benchmark_nested_start_as_current_span():
+        with tracer.start_as_current_span("parent"):
+            with tracer.start_as_current_span("child"):
+                pass
+
+    benchmark(benchmark_nested_start_as_current_span)
+
+
+def test_start_as_current_span_exception(benchmark):
+    def benchmark_start_as_current_span_exception():
+        try:
+            with tracer.start_as_current_span("benchmarkedSpan", record_exception=False):
+                raise ValueError("benchmark")
+        except ValueError:
+            pass
+
+    benchmark(benchmark_start_as_current_span_exception)
+
+
+def test_start_as_current_span_decorator(benchmark):
+    @tracer.start_as_current_span("benchmarkedSpan")
+    def decorated():
+        pass
+
+    benchmark(decorated)
+
+
 class _EventsReadingProcessor(SpanProcessor):
     def on_end(self, span: ReadableSpan) -> None:
         _ = span.events
@@ -289,3 +322,82 @@ def test_gil_contention_batch_processor(benchmark, num_threads):
             thread.join()
 
     benchmark(benchmark_fn)
+
+
+class _SleepingSpanProcessor(SpanProcessor):
+    # Simulates a processor doing some work in on_end, e.g. serialization.
+    def on_end(self, span: ReadableSpan) -> None:
+        time.sleep(0.00001)
+
+
+def _multi_span_processor_tracer(multi_span_processor, num_processors):
+    for _ in range(num_processors):
+        multi_span_processor.add_span_processor(_SleepingSpanProcessor())
+    provider = TracerProvider(sampler=sampling.DEFAULT_ON, active_span_processor=multi_span_processor)
+    return provider, provider.get_tracer("bench")
+
+
+@pytest.mark.parametrize("num_processors", [1, 2, 4])
+@pytest.mark.parametrize(
+    "multi_span_processor_factory",
+    [
+        pytest.param(SynchronousMultiSpanProcessor, id="synchronous"),
+        pytest.param(
+            lambda: ConcurrentMultiSpanProcessor(4, fire_and_forget=True, max_queue_size=100_000),
+            id="fire_and_forget",
+        ),
+    ],
+)
+def test_multi_span_processor_on_end(benchmark, multi_span_processor_factory, num_processors):
+    multi_span_processor = multi_span_processor_factory()
+    provider, tp = _multi_span_processor_tracer(multi_span_processor, num_processors)
+
+    def benchmark_start_span():
+        span = tp.start_span("benchmarkedSpan")
+        span.end()
+
+    benchmark(benchmark_start_span)
+    provider.shutdown()
+
+
+@pytest.mark.parametrize("attributes", [None, {"key": "value"}])
+def test_get_tracer(benchmark, attributes):
+    def benchmark_get_tracer():
+        tracer_provider.get_tracer(
+            "test_tracer",
+            "1.0.0",
+            schema_url="https://opentelemetry.io/schemas/1.38.0",
+            attributes=attributes,
+        )
+
+    benchmark(benchmark_get_tracer)
+
+
+def _proxy_tracer():
+    proxy_tracer = trace_api.ProxyTracer("sdk_tracer_provider")
+    # The proxy binds to the real tracer on its first use after the global
+    # tracer provider is set.
+    with patch.object(trace_api, "_TRACER_PROVIDER", tracer_provider):
+        proxy_tracer.start_span("warmup").end()
+    return proxy_tracer
+
+
+@pytest.mark.parametrize("proxy", [False, True])
+def test_proxy_tracer_start_span(benchmark, proxy):
+    benchmarked_tracer = _proxy_tracer() if proxy else tracer
+
+    def benchmark_start_span():
+        benchmarked_tracer.start_span("benchmarkedSpan").end()
+
+    benchmark(benchmark_start_span)
+
+
+@pytest.mark.parametrize("proxy", [False, True])
+def test_proxy_tracer_start_as_current_span(benchmark, proxy):
+    benchmarked_tracer = _proxy_tracer() if proxy else tracer
+
+    def benchmark_start_as_current_span():
+        with benchmarked_tracer.start_as_current_span("benchmarkedSpan"):
+            pass
+
+    benchmark(benchmark_start_as_current_span)
@@ -0,0 +1,48 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+
+from opentelemetry import trace
+from opentelemetry.trace.propagation.tracecontext import (
+    TraceContextTextMapPropagator,
+)
+from opentelemetry.trace.span import TraceState
+
+propagator = TraceContextTextMapPropagator()
+
+_TRACEPARENT = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+# A typical header with a couple of vendors and a maximal one with 32 members.
+_TRACESTATES = {
+    "typical": "congo=t61rcWkgMzE,rojo=00f067aa0ba902b7",
+    "maximal": ",".join(f"vendor{i}@tenant{i}={'v' * 200}" for i in range(32)),
+}
+
+
+@pytest.mark.parametrize("tracestate", [None, "typical", "maximal"])
+def test_extract(benchmark, tracestate):
+    carrier = {"traceparent": [_TRACEPARENT]}
+    if tracestate is not None:
+        carrier["tracestate"] = [_TRACESTATES[tracestate]]
+
+    benchmark(propagator.extract, carrier)
+
+
+@pytest.mark.parametrize("tracestate", [None, "typical", "maximal"])
+def test_inject(benchmark, tracestate):
+    trace_state = None
+    if tracestate is not None:
+        trace_state = TraceState.from_header([_TRACESTATES[tracestate]])
+    span_context = trace.SpanContext(
+        0x0AF7651916CD43DD8448EB211C80319C,
+        0xB7AD6B7169203331,
+        is_remote=False,
+        trace_flags=trace.TraceFlags(trace.TraceFlags.SAMPLED),
+        trace_state=trace_state,
+    )
+    context = trace.set_span_in_context(trace.NonRecordingSpan(span_context))
+
+    def benchmark_inject():
+        propagator.inject({}, context=context)
+
+    benchmark(benchmark_inject)
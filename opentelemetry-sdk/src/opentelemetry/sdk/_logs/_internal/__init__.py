@@ -35,7 +35,11 @@ from opentelemetry._logs import (
     get_logger,
     get_logger_provider,
 )
-from opentelemetry.attributes import _VALID_ANY_VALUE_TYPES, BoundedAttributes
+from opentelemetry.attributes import (
+    _VALID_ANY_VALUE_TYPES,
+    BoundedAttributes,
+    _clean_extended_attribute,
+)
 from opentelemetry.context import get_current
 from opentelemetry.context.context import Context
 from opentelemetry.metrics import MeterProvider, get_meter_provider
@@ -48,6 +52,7 @@ from opentelemetry.sdk._logs._internal._logger_metrics import (
     LoggerMetricsT,
     create_logger_metrics,
 )
+from opentelemetry.sdk._shared_internal import _QueueWorker
 from opentelemetry.sdk.environment_variables import (
     OTEL_ATTRIBUTE_COUNT_LIMIT,
     OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT,
@@ -75,6 +80,7 @@ from opentelemetry.semconv.attributes import (
 from opentelemetry.trace import (
     format_span_id,
     format_trace_id,
+    get_current_span,
 )
 from opentelemetry.util.types import AnyValue, _ExtendedAttributes
 
@@ -261,6 +267,58 @@ class ReadableLogRecord:
         )
 
 
+class _LogRecordAttributes(BoundedAttributes):
+    """`BoundedAttributes` that clean the attributes they were created with on
+    first access.
+
+    Log records are usually read only once they are exported, which for
+    batching processors happens off the thread that emitted them. The number
+    of dropped attributes only depends on the number of keys, so it is known
+    upfront. The attributes are copied, so changes the caller makes to them
+    after emitting the log record are not recorded.
+    """
+
+    def __init__(self, attributes: _ExtendedAttributes | None, limits: LogRecordLimits):
+        self._pending = dict(attributes) if attributes else None
+        super().__init__(
+            maxlen=limits.max_log_record_attributes,
+            immutable=False,
+            max_value_len=limits.max_log_record_attribute_length,
+            extended_attributes=True,
+        )
+        if self._pending is not None and self.maxlen is not None:
+            self.dropped = max(len(self._pending) - self.maxlen, 0)
+
+    @property
+    def _dict(self):  # type: ignore[override]
+        if self._pending is not None:
+            self._clean_pending()
+        return self._values
+
+    @_dict.setter
+    def _dict(self, value) -> None:  # type: ignore[override]
+        self._values = value
+
+    def _clean_pending(self) -> None:
+        # No lock is held while cleaning, as cleaning can log a warning that
+        # a `LoggingHandler` emits on the same thread. Threads cleaning
+        # concurrently compute the same values, which are swapped in before
+        # the pending attributes are released.
+        pending = self._pending
+        if pending is None:
+            return
+        values = {key: _clean_extended_attribute(key, value, self.max_value_len) for key, value in pending.items()}
+        if self.maxlen is not None and len(values) > self.maxlen:
+            # The oldest attributes are dropped first.
+            values = dict(list(values.items())[len(values) - self.maxlen :])
+        self._values = values
+        self._pending = None
+
+    def __getstate__(self) -> dict[str, object]:
+        self._clean_pending()
+        return super().__getstate__()
+
+
 @dataclass
 class ReadWriteLogRecord:
     """A ReadWriteLogRecord instance represents an event being logged.
@@ -275,14 +333,8 @@ class ReadWriteLogRecord:
     limits: LogRecordLimits = field(default_factory=LogRecordLimits)
 
     def __post_init__(self):
-        self.log_record.attributes = BoundedAttributes(
-            maxlen=self.limits.max_log_record_attributes,
-            attributes=self.log_record.attributes if self.log_record.attributes else None,
-            immutable=False,
-            max_value_len=self.limits.max_log_record_attribute_length,
-            extended_attributes=True,
-        )
-        if self.dropped_attributes > 0:
+        self.log_record.attributes = attributes = _LogRecordAttributes(self.log_record.attributes, self.limits)
+        if attributes.dropped > 0:
             warnings.warn(
                 "Log record attributes were dropped due to limits",
                 LogRecordDroppedAttributesWarning,
@@ -307,11 +359,13 @@ class ReadWriteLogRecord:
         record: LogRecord,
         resource: Resource,
         instrumentation_scope: InstrumentationScope | None = None,
+        limits: LogRecordLimits | None = None,
     ) -> ReadWriteLogRecord:
         return cls(
             log_record=record,
             resource=resource,
             instrumentation_scope=instrumentation_scope,
+            limits=limits or LogRecordLimits(),
         )
 
 
@@ -359,6 +413,19 @@ class LogRecordProcessor(abc.ABC):
         on error handling expectations.
         """
 
+    def enabled(self, severity_number: SeverityNumber, context: Context) -> bool:
+        """Returns whether the processor is interested in log records with the
+        given severity, emitted in the given context.
+
+        Loggers don't create log records when none of their processors is
+        interested in them. The default implementation returns True.
+
+        Args:
+            severity_number: The severity of the log record.
+            context: The context the log record is emitted in.
+        """
+        return True
+
     @abc.abstractmethod
     def shutdown(self) -> None:
         """Called when a :class:`opentelemetry.sdk._logs.Logger` is shutdown"""
@@ -377,6 +444,15 @@ class LogRecordProcessor(abc.ABC):
         """
 
 
+def _all_filtering(log_record_processors: tuple[LogRecordProcessor, ...]) -> bool:
+    # Processors that don't override `enabled` are interested in all records,
+    # so they are only asked when all of them do.
+    return bool(log_record_processors) and all(
+        getattr(type(lp), "enabled", LogRecordProcessor.enabled) is not LogRecordProcessor.enabled
+        for lp in log_record_processors
+    )
+
+
 # Temporary fix until https://github.com/PyCQA/pylint/issues/4098 is resolved
 # pylint:disable=no-member
 class SynchronousMultiLogRecordProcessor(LogRecordProcessor):
@@ -391,17 +467,24 @@ class SynchronousMultiLogRecordProcessor(LogRecordProcessor):
         # use a tuple to avoid race conditions when adding a new log and
         # iterating through it on "emit".
         self._log_record_processors = ()  # type: tuple[LogRecordProcessor, ...]
+        self._filtering = False
         self._lock = threading.Lock()
 
     def add_log_record_processor(self, log_record_processor: LogRecordProcessor) -> None:
         """Adds a Logprocessor to the list of log processors handled by this instance"""
         with self._lock:
             self._log_record_processors += (log_record_processor,)
+            self._filtering = _all_filtering(self._log_record_processors)
 
     def on_emit(self, log_record: ReadWriteLogRecord) -> None:
         for lp in self._log_record_processors:
             lp.on_emit(log_record)
 
+    def enabled(self, severity_number: SeverityNumber, context: Context) -> bool:
+        if not self._filtering:
+            return True
+        return any(lp.enabled(severity_number, context) for lp in self._log_record_processors)
+
     def shutdown(self) -> None:
         """Shutdown the log processors one by one"""
         for lp in self._log_record_processors:
@@ -449,12 +532,19 @@ class ConcurrentMultiLogRecordProcessor(LogRecordProcessor):
         # use a tuple to avoid race conditions when adding a new log and
         # iterating through it on "emit".
         self._log_record_processors = ()  # type: tuple[LogRecordProcessor, ...]
+        self._filtering = False
         self._lock = threading.Lock()
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
 
     def add_log_record_processor(self, log_record_processor: LogRecordProcessor):
         with self._lock:
             self._log_record_processors += (log_record_processor,)
+            self._filtering = _all_filtering(self._log_record_processors)
+
+    def enabled(self, severity_number: SeverityNumber, context: Context) -> bool:
+        if not self._filtering:
+            return True
+        return any(lp.enabled(severity_number, context) for lp in self._log_record_processors)
 
     def _submit_and_wait(
         self,
@@ -535,19 +625,86 @@ _RESERVED_ATTRS = frozenset(
 )
 
 
+# Map Python log level names to OTel severity text as defined in
+# https://github.com/open-telemetry/opentelemetry-specification/blob/main/specification/logs/data-model.md#displaying-severity
+# Python "WARNING" -> OTel "WARN" (see #3548)
+# Python "CRITICAL" -> OTel "FATAL" (see #4984)
+_PYTHON_TO_OTEL_SEVERITY_TEXT = {
+    "WARNING": "WARN",
+    "CRITICAL": "FATAL",
+}
+
+
+class _FormattedException:
+    """Formats an exception stacktrace when it is converted to a string.
+
+    Log record attributes are cleaned, which stringifies values that are not
+    valid attribute values, on first access, usually when the record is
+    exported.
+    """
+
+    __slots__ = ("_exc_info",)
+
+    def __init__(self, exc_info) -> None:
+        self._exc_info = exc_info
+
+    def __str__(self) -> str:
+        # https://opentelemetry.io/docs/specs/semconv/exceptions/exceptions-spans/#stacktrace-representation
+        return "".join(traceback.format_exception(*self._exc_info))
+
+
+def _report_dropped_log_records(count: int) -> None:
+    # Called from the worker thread, as logging from the handler could recurse.
+    _logger.warning("Queue full, dropped %d log records.", count)
+
+
 class LoggingHandler(logging.Handler):
     """A handler class which writes logging records, in OTLP format, to
     a network destination or file. Supports signals from the `logging` module.
     https://docs.python.org/3/library/logging.html
+
+    With ``non_blocking``, ``emit`` only puts the record, the current context
+    and the observed timestamp in a bounded queue. Records are translated and
+    emitted by a dedicated thread, like `logging.handlers.QueueHandler`
+    does. When the queue is full the oldest records are dropped and counted
+    in `dropped_log_records`. Since records are formatted later, arguments
+    of the log call should not be mutated after it.
+
+    Args:
+        level: The level of the handler.
+        logger_provider: The logger provider, defaults to the global one.
+        non_blocking: Whether records are translated and emitted from a
+            dedicated thread.
+        max_queue_size: The maximum number of records queued when
+            ``non_blocking`` is set.
     """
 
     def __init__(
         self,
         level: int = logging.NOTSET,
         logger_provider: APILoggerProvider | None = None,
+        *,
+        non_blocking: bool = False,
+        max_queue_size: int = 2048,
     ) -> None:
         super().__init__(level=level)
         self._logger_provider = logger_provider or get_logger_provider()
+        # OTel loggers by stdlib logger name, None for no-op loggers.
+        self._loggers: dict[str, APILogger | None] = {}
+        self._worker = None
+        if non_blocking:
+            if max_queue_size <= 0:
+                raise ValueError("max_queue_size must be a positive integer.")
+            self._worker = _QueueWorker(
+                "OtelLoggingHandlerWorker",
+                lambda item: self._emit(*item),
+                lambda item: self.handleError(item[0]),
+                _report_dropped_log_records,
+                max_queue_size,
+            )
+            if hasattr(os, "register_at_fork"):
+                weak_reinit = WeakMethod(self._worker._at_fork_reinit)
+                os.register_at_fork(after_in_child=lambda: weak_reinit()())  # pyright: ignore[reportOptionalCall] pylint: disable=unnecessary-lambda
 
         warnings.warn(
             "`LoggingHandler` in `opentelemetry-sdk` is deprecated. Use the "
@@ -555,9 +712,21 @@ class LoggingHandler(logging.Handler):
             DeprecationWarning,
         )
 
+    @property
+    def dropped_log_records(self) -> int:
+        """The number of records dropped because the queue was full."""
+        if self._worker is None:
+            return 0
+        return self._worker.dropped
+
     @staticmethod
     def _get_attributes(record: logging.LogRecord) -> _ExtendedAttributes:
-        attributes = {k: v for k, v in vars(record).items() if k not in _RESERVED_ATTRS}
+        record_dict = vars(record)
+        if _RESERVED_ATTRS.issuperset(record_dict):
+            # Most records have no extra attributes.
+            attributes = {}
+        else:
+            attributes = {k: v for k, v in record_dict.items() if k not in _RESERVED_ATTRS}
 
         # Add standard code attributes for logs.
         attributes[code_attributes.CODE_FILE_PATH] = record.pathname
@@ -571,17 +740,15 @@ class LoggingHandler(logging.Handler):
             if value is not None and value.args:
                 attributes[exception_attributes.EXCEPTION_MESSAGE] = str(value.args[0])
             if tb is not None:
-                # https://opentelemetry.io/docs/specs/semconv/exceptions/exceptions-spans/#stacktrace-representation
-                attributes[exception_attributes.EXCEPTION_STACKTRACE] = "".join(
-                    traceback.format_exception(*record.exc_info)
-                )
+                attributes[exception_attributes.EXCEPTION_STACKTRACE] = _FormattedException(record.exc_info)  # type: ignore[assignment]
         return attributes
 
-    def _translate(self, record: logging.LogRecord) -> LogRecord:
-        timestamp = int(record.created * 1e9)
-        observered_timestamp = time_ns()
-        attributes = self._get_attributes(record)
-        severity_number = std_to_otel(record.levelno)
+    def _translate(
+        self,
+        record: logging.LogRecord,
+        context: Context | None = None,
+        observed_timestamp: int | None = None,
+    ) -> LogRecord:
         if self.formatter:
             body = self.format(record)
         else:
@@ -605,40 +772,60 @@ class LoggingHandler(logging.Handler):
             else:
                 body = record.getMessage()
 
-        # Map Python log level names to OTel severity text as defined in
-        # https://github.com/open-telemetry/opentelemetry-specification/blob/main/specification/logs/data-model.md#displaying-severity
-        # Python "WARNING" -> OTel "WARN" (see #3548)
-        # Python "CRITICAL" -> OTel "FATAL" (see #4984)
-        _python_to_otel_severity_text = {
-            "WARNING": "WARN",
-            "CRITICAL": "FATAL",
-        }
-        level_name = _python_to_otel_severity_text.get(record.levelname, record.levelname)
-
         return LogRecord(
-            timestamp=timestamp,
-            observed_timestamp=observered_timestamp,
-            context=get_current() or None,
-            severity_text=level_name,
-            severity_number=severity_number,
+            timestamp=int(record.created * 1e9),
+            observed_timestamp=time_ns() if observed_timestamp is None else observed_timestamp,
+            context=get_current() if context is None else context,
+            severity_text=_PYTHON_TO_OTEL_SEVERITY_TEXT.get(record.levelname, record.levelname),
+            severity_number=std_to_otel(record.levelno),
             body=body,
-            attributes=attributes,
+            attributes=self._get_attributes(record),
         )
 
+    def _get_logger(self, name: str) -> APILogger | None:
+        try:
+            return self._loggers[name]
+        except KeyError:
+            logger = get_logger(name, logger_provider=self._logger_provider)
+            if isinstance(logger, NoOpLogger):
+                logger = None
+            return self._loggers.setdefault(name, logger)
+
+    def _emit(
+        self,
+        record: logging.LogRecord,
+        context: Context | None = None,
+        observed_timestamp: int | None = None,
+    ) -> None:
+        logger = self._get_logger(record.name)
+        if logger is not None:
+            logger.emit(self._translate(record, context, observed_timestamp))
+
     def emit(self, record: logging.LogRecord) -> None:
         """
-        Emit a record. Skip emitting if logger is NoOp.
+        Emit a record. Skip emitting if logger is NoOp or would drop the record.
 
         The record is translated to OTel format, and then sent across the pipeline.
+        With ``non_blocking``, this is done from a dedicated thread.
         """
-        logger = get_logger(record.name, logger_provider=self._logger_provider)
-        if not isinstance(logger, NoOpLogger):
-            logger.emit(self._translate(record))
+        logger = self._get_logger(record.name)
+        if logger is None:
+            return
+        context = get_current()
+        # Records dropped by the SDK logger are not translated at all.
+        if isinstance(logger, Logger) and not logger.enabled(std_to_otel(record.levelno), context):
+            return
+        if self._worker is not None:
+            self._worker.put((record, context, time_ns()))
+        else:
+            logger.emit(self._translate(record, context))
 
     def flush(self) -> None:
         """
         Flushes the logging output. Skip flushing if logging_provider has no force_flush method.
         """
+        if self._worker is not None:
+            self._worker.flush(30000)
         if hasattr(self._logger_provider, "force_flush") and callable(
             self._logger_provider.force_flush  # type: ignore[reportAttributeAccessIssue]
         ):
@@ -647,10 +834,28 @@ class LoggingHandler(logging.Handler):
             thread = threading.Thread(target=self._logger_provider.force_flush)  # type: ignore[reportAttributeAccessIssue]
             thread.start()
 
+    def close(self) -> None:
+        """Emits the queued records and stops the worker thread of a non-blocking handler."""
+        if self._worker is not None:
+            self._worker.shutdown(30000)
+        super().close()
+
 
 @dataclass
 class _LoggerConfig:
+    """Configuration of a `Logger`.
+
+    Args:
+        is_enabled: Whether the logger emits log records.
+        minimum_severity: Log records with a specified severity lower than it
+            are dropped.
+        trace_based: Whether log records emitted in the context of an
+            unsampled span are dropped.
+    """
+
     is_enabled: bool = True
+    minimum_severity: SeverityNumber = SeverityNumber.UNSPECIFIED
+    trace_based: bool = False
 
     @classmethod
     def default(cls) -> _LoggerConfig:
@@ -666,6 +871,7 @@ class Logger(APILogger):
         *,
         logger_metrics: LoggerMetricsT,
         _logger_config: _LoggerConfig,
+        log_record_limits: LogRecordLimits | None = None,
     ):
         super().__init__(
             instrumentation_scope.name,
@@ -677,13 +883,50 @@ class Logger(APILogger):
         self._multi_log_record_processor = multi_log_record_processor
         self._instrumentation_scope = instrumentation_scope
         self._logger_metrics = logger_metrics
-        self._logger_config = _logger_config
+        self._log_record_limits = log_record_limits or LogRecordLimits()
+        self._set_logger_config(_logger_config)
 
     def _is_enabled(self) -> bool:
         return self._logger_config.is_enabled
 
     def _set_logger_config(self, logger_config: _LoggerConfig) -> None:
         self._logger_config = logger_config
+        self._minimum_severity = logger_config.minimum_severity.value
+        self._trace_based = logger_config.trace_based
+
+    def enabled(
+        self,
+        severity_number: SeverityNumber | None = None,
+        context: Context | None = None,
+    ) -> bool:
+        """Returns whether a log record with the given severity, emitted in the
+        given context, would be processed.
+
+        Instrumentations can use it to avoid building log records that would be
+        dropped.
+
+        Args:
+            severity_number: The severity of the log record, unspecified by default.
+            context: The context the log record is emitted in, the current
+                context by default.
+        """
+        if not self._logger_config.is_enabled:
+            return False
+        if (
+            severity_number is not None
+            and severity_number.value < self._minimum_severity
+            and severity_number is not SeverityNumber.UNSPECIFIED
+        ):
+            return False
+        if not (self._trace_based or self._multi_log_record_processor._filtering):
+            return True
+        if context is None:
+            context = get_current()
+        if self._trace_based:
+            span_context = get_current_span(context).get_span_context()
+            if span_context.is_valid and not span_context.trace_flags.sampled:
+                return False
+        return self._multi_log_record_processor.enabled(severity_number or SeverityNumber.UNSPECIFIED, context)
 
     def _set_resource(self, resource: Resource) -> None:
         self._resource = resource
@@ -713,8 +956,14 @@ class Logger(APILogger):
     ) -> None:
         """Emits the :class:`ReadWriteLogRecord` by setting instrumentation scope
         and forwarding to the processor.
+
+        Nothing is created if the record would be dropped, see `enabled`.
         """
-        if not self._is_enabled():
+        if record is not None:
+            api_record = record.log_record if isinstance(record, ReadWriteLogRecord) else record
+            if not self.enabled(api_record.severity_number, api_record.context):
+                return
+        elif not self.enabled(severity_number, context):
             return
         # If a record is provided, use it directly
         if record is not None:
@@ -726,6 +975,7 @@ class Logger(APILogger):
                     record=record,
                     resource=self._resource,
                     instrumentation_scope=self._instrumentation_scope,
+                    limits=self._log_record_limits,
                 )
             else:
                 _set_log_record_exception_attributes(record.log_record)
@@ -748,6 +998,7 @@ class Logger(APILogger):
                 record=log_record,
                 resource=self._resource,
                 instrumentation_scope=self._instrumentation_scope,
+                limits=self._log_record_limits,
             )
 
         self._logger_metrics.emit_log()
@@ -780,6 +1031,7 @@ class LoggerProvider(APILoggerProvider):
         | None = None,
         *,
         meter_provider: MeterProvider | None = None,
+        log_record_limits: LogRecordLimits | None = None,
         _logger_configurator: _LoggerConfiguratorT | None = None,
     ):
         if resource is None:
@@ -787,6 +1039,8 @@ class LoggerProvider(APILoggerProvider):
         else:
             self._resource = resource
         self._multi_log_record_processor = multi_log_record_processor or SynchronousMultiLogRecordProcessor()
+        # Limits are read from the environment once and shared by all loggers.
+        self._log_record_limits = log_record_limits or LogRecordLimits()
         self._logger_metrics = create_logger_metrics(
             meter_provider or get_meter_provider(),
             parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
@@ -841,6 +1095,7 @@ class LoggerProvider(APILoggerProvider):
             scope,
             logger_metrics=self._logger_metrics,
             _logger_config=self._apply_logger_configurator(scope),
+            log_record_limits=self._log_record_limits,
         )
 
     def _get_logger_cached(
@@ -871,11 +1126,14 @@ class LoggerProvider(APILoggerProvider):
                 schema_url=schema_url,
                 attributes=attributes,
             )
-        logger = (
-            self._get_logger_cached(name, version, schema_url)
-            if attributes is None
-            else self._get_logger_no_cache(name, version, schema_url, attributes)
-        )
+        if attributes is None:
+            # Cached loggers are already active, so they are returned without locking.
+            logger = self._logger_cache.get((name, version, schema_url))
+            if logger is not None:
+                return logger
+            logger = self._get_logger_cached(name, version, schema_url)
+        else:
+            logger = self._get_logger_no_cache(name, version, schema_url, attributes)
         with self._active_loggers_lock:
             self._active_loggers.add(logger)
         return logger
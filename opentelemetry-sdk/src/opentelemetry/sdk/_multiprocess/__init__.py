@@ -0,0 +1,556 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Experimental support for exporting telemetry from pre-fork servers (gunicorn,
+uwsgi, ...) through a single collector owned by the master process.
+
+Without this, every worker process restarts its own batch processor threads,
+metric reader threads and exporter connections after ``fork``. With it, the
+workers only forward encoded telemetry over a Unix domain socket and the
+master runs one set of exporters for all of them:
+
+.. code-block:: python
+
+    # In the master process, before forking the workers
+    collector = TelemetryCollector(
+        "/tmp/otel.sock",
+        span_exporter=OTLPSpanExporter(),
+        metric_exporter=OTLPMetricExporter(),
+    )
+    collector.start()
+
+    # In every worker process
+    tracer_provider.add_span_processor(BatchSpanProcessor(ForwardingSpanExporter("/tmp/otel.sock")))
+    meter_provider = MeterProvider(
+        metric_readers=[PeriodicExportingMetricReader(ForwardingMetricExporter("/tmp/otel.sock"))]
+    )
+
+Telemetry is serialized with :mod:`pickle`, so the socket path must only be
+accessible to the processes of the application.
+"""
+
+from __future__ import annotations
+
+import collections
+import logging
+import os
+import pickle
+import socket
+import struct
+import threading
+import uuid
+import weakref
+from collections.abc import Sequence
+from dataclasses import replace
+from time import time_ns
+from typing import Any
+
+from opentelemetry.context import (
+    _SUPPRESS_INSTRUMENTATION_KEY,
+    attach,
+    detach,
+    set_value,
+)
+from opentelemetry.sdk._logs import ReadableLogRecord
+from opentelemetry.sdk._logs.export import (
+    LogRecordExporter,
+    LogRecordExportResult,
+)
+from opentelemetry.sdk._shared_internal import DuplicateFilter
+from opentelemetry.sdk.metrics._internal.export._delta_to_cumulative import (
+    _add_exponential_histogram_data_points,
+    _add_histogram_data_points,
+    _add_number_data_points,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    ExponentialHistogram,
+    Histogram,
+    Metric,
+    MetricExporter,
+    MetricExportResult,
+    MetricsData,
+    ResourceMetrics,
+    ScopeMetrics,
+    Sum,
+)
+from opentelemetry.sdk.resources import SERVICE_INSTANCE_ID, Resource
+from opentelemetry.sdk.trace import ReadableSpan
+from opentelemetry.sdk.trace.export import SpanExporter, SpanExportResult
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+_logger = logging.getLogger(__name__)
+_logger.addFilter(DuplicateFilter())
+
+# Every frame is a signal byte followed by the payload length.
+_HEADER = struct.Struct("!BI")
+_TRACES = 0
+_LOGS = 1
+_METRICS = 2
+
+_ADD_DATA_POINTS = {
+    Sum: _add_number_data_points,
+    Histogram: _add_histogram_data_points,
+    ExponentialHistogram: _add_exponential_histogram_data_points,
+}
+
+
+def _merge_metric(pending: Metric | None, metric: Metric) -> Metric:
+    """Merges a forwarded metric into the one pending for the next export.
+
+    The points of delta metrics are added to the pending ones with the same
+    attributes, other metrics replace the pending one.
+    """
+    add_data_points = _ADD_DATA_POINTS.get(type(metric.data))
+    if (
+        pending is None
+        or add_data_points is None
+        or metric.data.aggregation_temporality is not AggregationTemporality.DELTA  # type: ignore[union-attr]
+        or type(pending.data) is not type(metric.data)
+        or pending.data.aggregation_temporality is not AggregationTemporality.DELTA  # type: ignore[union-attr]
+    ):
+        return metric
+
+    data_points = {frozenset((point.attributes or {}).items()): point for point in pending.data.data_points}
+    for point in metric.data.data_points:
+        key = frozenset((point.attributes or {}).items())
+        pending_point = data_points.get(key)
+        if pending_point is not None:
+            # None when the boundaries of a histogram changed, the stream
+            # restarts with the new point.
+            merged = add_data_points(pending_point, point)  # type: ignore[operator]
+            if merged is not None:
+                point = merged
+        data_points[key] = point
+    return replace(metric, data=replace(metric.data, data_points=list(data_points.values())))
+
+
+_DEFAULT_SCHEDULE_DELAY_MILLIS = 5000
+_DEFAULT_MAX_EXPORT_BATCH_SIZE = 512
+_DEFAULT_EXPORT_TIMEOUT_MILLIS = 30000
+_DEFAULT_MAX_QUEUE_SIZE = 2048
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes | None:
+    chunks = []
+    while size:
+        chunk = sock.recv(size)
+        if not chunk:
+            return None
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b"".join(chunks)
+
+
+class _Forwarder:
+    """Sends frames to a `TelemetryCollector`, reconnecting lazily after a fork."""
+
+    def __init__(self, path: str, timeout_millis: float):
+        self._path = path
+        self._timeout = timeout_millis / 1e3
+        self._lock = threading.Lock()
+        self._socket: socket.socket | None = None
+        self._pid = os.getpid()
+        self._shutdown = False
+
+    def send(self, signal: int, data: Any) -> bool:
+        if self._shutdown:
+            _logger.warning("Forwarding exporter already shutdown, ignoring call")
+            return False
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._pid != os.getpid():
+                # The socket inherited from the parent is shared with it, never write to it.
+                self._socket = None
+                self._pid = os.getpid()
+            try:
+                if self._socket is None:
+                    self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                    self._socket.settimeout(self._timeout)
+                    self._socket.connect(self._path)
+                self._socket.sendall(_HEADER.pack(signal, len(payload)) + payload)
+                return True
+            except OSError:
+                _logger.exception("Failed to forward telemetry to %s.", self._path)
+                self._close()
+                return False
+
+    def _close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._shutdown = True
+            if self._pid == os.getpid():
+                self._close()
+
+
+class ForwardingSpanExporter(SpanExporter):
+    """`SpanExporter` that forwards spans to a `TelemetryCollector`.
+
+    Args:
+        path: The path of the Unix domain socket the collector listens on.
+        timeout_millis: The timeout of the socket operations.
+    """
+
+    def __init__(self, path: str, timeout_millis: float = 10_000):
+        self._forwarder = _Forwarder(path, timeout_millis)
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        if self._forwarder.send(_TRACES, list(spans)):
+            return SpanExportResult.SUCCESS
+        return SpanExportResult.FAILURE
+
+    def shutdown(self) -> None:
+        self._forwarder.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+class ForwardingLogRecordExporter(LogRecordExporter):
+    """`LogRecordExporter` that forwards log records to a `TelemetryCollector`.
+
+    Args:
+        path: The path of the Unix domain socket the collector listens on.
+        timeout_millis: The timeout of the socket operations.
+    """
+
+    def __init__(self, path: str, timeout_millis: float = 10_000):
+        self._forwarder = _Forwarder(path, timeout_millis)
+
+    def export(self, batch: Sequence[ReadableLogRecord]) -> LogRecordExportResult:
+        if self._forwarder.send(_LOGS, list(batch)):
+            return LogRecordExportResult.SUCCESS
+        return LogRecordExportResult.FAILURE
+
+    def shutdown(self):
+        self._forwarder.shutdown()
+
+    def force_flush(self, timeout_millis: int = 10_000) -> bool:
+        return True
+
+
+class ForwardingMetricExporter(MetricExporter):
+    """`MetricExporter` that forwards metrics to a `TelemetryCollector`.
+
+    Workers created by forking share the resource of the master process, so
+    every forwarded resource is stamped with a ``service.instance.id`` unique
+    to the process that produced it. This keeps the series of every worker
+    apart once they are merged by the collector.
+
+    Args:
+        path: The path of the Unix domain socket the collector listens on.
+        timeout_millis: The timeout of the socket operations.
+        preferred_temporality: See `MetricExporter`.
+        preferred_aggregation: See `MetricExporter`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        timeout_millis: float = 10_000,
+        preferred_temporality: dict[type, Any] | None = None,
+        preferred_aggregation: dict[type, Any] | None = None,
+    ):
+        super().__init__(
+            preferred_temporality=preferred_temporality,
+            preferred_aggregation=preferred_aggregation,
+        )
+        self._forwarder = _Forwarder(path, timeout_millis)
+        self._instance_pid: int | None = None
+        self._instance_resource: Resource | None = None
+        self._resources: dict[Resource, Resource] = {}
+
+    def _with_instance_id(self, resource: Resource) -> Resource:
+        if self._instance_pid != os.getpid():
+            self._instance_pid = os.getpid()
+            self._instance_resource = Resource({SERVICE_INSTANCE_ID: str(uuid.uuid4())})
+            self._resources.clear()
+        stamped = self._resources.get(resource)
+        if stamped is None:
+            stamped = self._resources[resource] = resource.merge(self._instance_resource)  # type: ignore[arg-type]
+        return stamped
+
+    def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        resource_metrics = [
+            ResourceMetrics(
+                resource=self._with_instance_id(metrics.resource),
+                scope_metrics=metrics.scope_metrics,
+                schema_url=metrics.schema_url,
+            )
+            for metrics in metrics_data.resource_metrics
+        ]
+        if self._forwarder.send(_METRICS, resource_metrics):
+            return MetricExportResult.SUCCESS
+        return MetricExportResult.FAILURE
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        return True
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        self._forwarder.shutdown()
+
+
+class TelemetryCollector:
+    """Receives telemetry forwarded by worker processes and exports it.
+
+    A single worker thread exports spans and log records in batches, the same
+    way `BatchSpanProcessor` and `BatchLogRecordProcessor` do it, and the
+    forwarded metrics merged per resource, every ``schedule_delay_millis``.
+    When a worker forwards a metric more than once between two exports, the
+    points of a delta metric are added together and only the latest state of
+    other metrics is exported.
+    The number of exporter threads and connections is the same regardless of
+    the number of workers.
+
+    The collector is meant to be started in the master process before the
+    workers are forked. Its threads are not restarted in the forked children
+    and the sockets they inherit are closed.
+
+    Args:
+        path: The path of the Unix domain socket to listen on. A stale socket
+            left at this path is removed.
+        span_exporter: The exporter for forwarded spans.
+        log_record_exporter: The exporter for forwarded log records.
+        metric_exporter: The exporter for forwarded metrics.
+        schedule_delay_millis: The delay between two consecutive exports.
+        max_export_batch_size: The maximum batch size of spans and log records.
+        export_timeout_millis: The timeout passed to the metric exporter.
+        max_queue_size: The maximum queue size of spans and log records.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        span_exporter: SpanExporter | None = None,
+        log_record_exporter: LogRecordExporter | None = None,
+        metric_exporter: MetricExporter | None = None,
+        schedule_delay_millis: float = _DEFAULT_SCHEDULE_DELAY_MILLIS,
+        max_export_batch_size: int = _DEFAULT_MAX_EXPORT_BATCH_SIZE,
+        export_timeout_millis: float = _DEFAULT_EXPORT_TIMEOUT_MILLIS,
+        max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE,
+    ):
+        if schedule_delay_millis <= 0:
+            raise ValueError("schedule_delay_millis must be positive.")
+        if max_export_batch_size <= 0:
+            raise ValueError("max_export_batch_size must be a positive integer.")
+        if max_export_batch_size > max_queue_size:
+            raise ValueError("max_export_batch_size must be less than or equal to max_queue_size.")
+        self._path = path
+        self._schedule_delay = schedule_delay_millis / 1e3
+        self._max_export_batch_size = max_export_batch_size
+        self._export_timeout_millis = export_timeout_millis
+        self._exporters: dict[int, SpanExporter | LogRecordExporter] = {}
+        if span_exporter is not None:
+            self._exporters[_TRACES] = span_exporter
+        if log_record_exporter is not None:
+            self._exporters[_LOGS] = log_record_exporter
+        # Deque is thread safe.
+        self._queues = {signal: collections.deque([], max_queue_size) for signal in self._exporters}
+        self._metric_exporter = metric_exporter
+        # The latest state of every forwarded metric by resource, scope and
+        # metric name, along with the schema URLs of the resource and scope.
+        self._resource_metrics: dict[
+            Resource,
+            tuple[str, dict[InstrumentationScope, tuple[str, dict[str, Metric]]]],
+        ] = {}
+        self._metrics_lock = threading.Lock()
+        self._export_lock = threading.Lock()
+        self._worker_awaken = threading.Event()
+        self._shutdown = False
+        self._listener: socket.socket | None = None
+        self._connections: set[socket.socket] = set()
+        self._connections_lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+        self._pid = os.getpid()
+        if hasattr(os, "register_at_fork"):
+            weak_at_fork = weakref.WeakMethod(self._at_fork_reinit)
+            os.register_at_fork(after_in_child=lambda: weak_at_fork()())  # pyright: ignore[reportOptionalCall] pylint: disable=unnecessary-lambda
+
+    def _at_fork_reinit(self):
+        # The children must not accept connections nor read from the ones of the master,
+        # closing the inherited file descriptors doesn't affect the master.
+        if self._listener is not None:
+            self._listener.close()
+        for connection in self._connections:
+            connection.close()
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        self._threads = []
+
+    def start(self) -> None:
+        """Starts listening for forwarded telemetry."""
+        if self._listener is not None:
+            _logger.warning("Collector already started")
+            return
+        if os.path.exists(self._path):
+            os.unlink(self._path)
+        self._listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._listener.bind(self._path)
+        self._listener.listen()
+        self._start_thread("OtelCollectorListener", self._accept)
+        self._start_thread("OtelCollectorExporter", self._worker)
+
+    def _start_thread(self, name: str, target, *args) -> None:
+        thread = threading.Thread(name=name, target=target, args=args, daemon=True)
+        thread.start()
+        self._threads.append(thread)
+
+    def _accept(self) -> None:
+        while not self._shutdown:
+            try:
+                connection, _ = self._listener.accept()  # type: ignore[union-attr]
+            except OSError:
+                # The listener was closed by shutdown.
+                return
+            with self._connections_lock:
+                self._connections.add(connection)
+            self._start_thread("OtelCollectorConnection", self._receive, connection)
+
+    def _receive(self, connection: socket.socket) -> None:
+        try:
+            while True:
+                header = _recv_exactly(connection, _HEADER.size)
+                if header is None:
+                    return
+                signal, size = _HEADER.unpack(header)
+                payload = _recv_exactly(connection, size)
+                if payload is None:
+                    return
+                try:
+                    self._dispatch(signal, pickle.loads(payload))
+                except Exception:  # pylint: disable=broad-exception-caught
+                    _logger.exception("Failed to decode forwarded telemetry.")
+        except OSError:
+            # The connection was closed by shutdown.
+            return
+        finally:
+            with self._connections_lock:
+                self._connections.discard(connection)
+            connection.close()
+
+    def _dispatch(self, signal: int, items: list) -> None:
+        if signal == _METRICS:
+            if self._metric_exporter is None:
+                return
+            with self._metrics_lock:
+                for resource_metrics in items:
+                    _, scopes = self._resource_metrics.get(resource_metrics.resource, (None, {}))
+                    self._resource_metrics[resource_metrics.resource] = (resource_metrics.schema_url, scopes)
+                    for scope_metrics in resource_metrics.scope_metrics:
+                        _, metrics = scopes.get(scope_metrics.scope, (None, {}))
+                        scopes[scope_metrics.scope] = (scope_metrics.schema_url, metrics)
+                        for metric in scope_metrics.metrics:
+                            metrics[metric.name] = _merge_metric(metrics.get(metric.name), metric)
+            return
+        queue = self._queues.get(signal)
+        if queue is None:
+            return
+        if len(queue) + len(items) > queue.maxlen:  # type: ignore[operator]
+            _logger.warning("Queue full, dropping forwarded telemetry.")
+        # This will drop items from the right side if the queue is full.
+        queue.extendleft(items)
+        if len(queue) >= self._max_export_batch_size and not self._worker_awaken.is_set():
+            self._worker_awaken.set()
+
+    def _worker(self) -> None:
+        while not self._shutdown:
+            self._worker_awaken.wait(self._schedule_delay)
+            if self._shutdown:
+                break
+            self._worker_awaken.clear()
+            self._export()
+        self._export()
+
+    def _export(self) -> None:
+        token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
+        try:
+            with self._export_lock:
+                for signal, queue in self._queues.items():
+                    while queue:
+                        count = min(self._max_export_batch_size, len(queue))
+                        # Oldest items are at the back, so pop from there.
+                        batch = [queue.pop() for _ in range(count)]
+                        try:
+                            self._exporters[signal].export(batch)  # type: ignore[arg-type]
+                        except Exception:  # pylint: disable=broad-exception-caught
+                            _logger.exception("Exception while exporting forwarded telemetry.")
+                self._export_metrics()
+        finally:
+            detach(token)
+
+    def _export_metrics(self) -> None:
+        with self._metrics_lock:
+            pending = self._resource_metrics
+            self._resource_metrics = {}
+        if not pending:
+            return
+        metrics_data = MetricsData(
+            resource_metrics=[
+                ResourceMetrics(
+                    resource=resource,
+                    scope_metrics=[
+                        ScopeMetrics(
+                            scope=scope,
+                            metrics=list(metrics.values()),
+                            schema_url=scope_schema_url,
+                        )
+                        for scope, (scope_schema_url, metrics) in scopes.items()
+                    ],
+                    schema_url=schema_url,
+                )
+                for resource, (schema_url, scopes) in pending.items()
+            ]
+        )
+        try:
+            self._metric_exporter.export(  # type: ignore[union-attr]
+                metrics_data, timeout_millis=self._export_timeout_millis
+            )
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Exception while exporting metrics")
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        """Exports all the telemetry received so far."""
+        if self._shutdown:
+            return False
+        self._export()
+        return True
+
+    def shutdown(self, timeout_millis: int = 30000) -> None:
+        """Stops receiving telemetry, exports what is left and shuts down the exporters."""
+        if self._shutdown or self._pid != os.getpid():
+            return
+        deadline_ns = time_ns() + timeout_millis * 10**6
+        self._shutdown = True
+        if self._listener is not None:
+            # Closing the listener alone doesn't interrupt a pending accept.
+            try:
+                self._listener.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+            self._listener.close()
+            if os.path.exists(self._path):
+                os.unlink(self._path)
+        with self._connections_lock:
+            for connection in self._connections:
+                try:
+                    connection.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    # The peer already closed the connection.
+                    pass
+        self._worker_awaken.set()
+        for thread in self._threads:
+            thread.join(max(0, (deadline_ns - time_ns()) / 1e9))
+        for exporter in self._exporters.values():
+            exporter.shutdown()
+        if self._metric_exporter is not None:
+            self._metric_exporter.shutdown(timeout_millis=max(0, (deadline_ns - time_ns()) / 1e6))
@@ -12,6 +12,7 @@ import threading
 import time
 import weakref
 from abc import abstractmethod
+from collections.abc import Callable
 from typing import (
     Generic,
     Protocol,
@@ -230,3 +231,108 @@ class BatchProcessor(Generic[Telemetry]):
         # Blocking call to export.
         self._export(BatchExportStrategy.EXPORT_ALL)
         return True
+
+
+class _QueueWorker(Generic[Telemetry]):
+    """Processes the items put in a bounded queue from a dedicated thread.
+
+    The oldest items are dropped when the queue is full, and the items put
+    after shutdown are dropped. Dropped items are reported from the worker
+    thread, once the queue is drained, as reporting them from the caller
+    could recurse when the caller is a logging handler.
+
+    Args:
+        name: The name of the worker thread.
+        process: Called with every queued item from the worker thread.
+        on_error: Called with the item ``process`` raised for, from the
+            ``except`` block.
+        report_dropped: Called with the number of items dropped since the
+            last report.
+        max_queue_size: The maximum number of queued items.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        process: Callable[[Telemetry], None],
+        on_error: Callable[[Telemetry], None],
+        report_dropped: Callable[[int], None],
+        max_queue_size: int,
+    ):
+        self._name = name
+        self._process = process
+        self._on_error = on_error
+        self._report_dropped = report_dropped
+        self.dropped = 0
+        self._dropped_lock = threading.Lock()
+        self._reported_dropped = 0
+        # Deque is thread safe.
+        self._queue: collections.deque[Telemetry] = collections.deque([], max_queue_size)
+        self._start()
+
+    def _start(self) -> None:
+        self._shutdown = False
+        self._worker_awaken = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._flush_events: list[threading.Event] = []
+        self._worker_thread = threading.Thread(
+            name=self._name,
+            target=self._worker,
+            daemon=True,
+        )
+        self._worker_thread.start()
+
+    def _at_fork_reinit(self) -> None:
+        self._queue.clear()
+        self._start()
+
+    def _worker(self) -> None:
+        while True:
+            self._worker_awaken.wait()
+            self._worker_awaken.clear()
+            with self._flush_lock:
+                flush_events, self._flush_events = self._flush_events, []
+            while self._queue:
+                # Oldest items are at the back, so pop from there.
+                item = self._queue.pop()
+                try:
+                    self._process(item)
+                # pylint: disable=broad-exception-caught
+                except Exception:
+                    self._on_error(item)
+            if self.dropped != self._reported_dropped:
+                self._report_dropped(self.dropped - self._reported_dropped)
+                self._reported_dropped = self.dropped
+            for flush_event in flush_events:
+                flush_event.set()
+            if self._shutdown:
+                return
+
+    def _drop(self) -> None:
+        with self._dropped_lock:
+            self.dropped += 1
+
+    def put(self, item: Telemetry) -> None:
+        if self._shutdown:
+            # The worker thread is stopped, the item would never be processed.
+            self._drop()
+            return
+        if len(self._queue) == self._queue.maxlen:
+            self._drop()
+        # This will drop an item from the right side if the queue is at maxlen.
+        self._queue.appendleft(item)
+        if not self._worker_awaken.is_set():
+            self._worker_awaken.set()
+
+    def flush(self, timeout_millis: float) -> bool:
+        """Waits until the items queued so far have been processed."""
+        flush_event = threading.Event()
+        with self._flush_lock:
+            self._flush_events.append(flush_event)
+        self._worker_awaken.set()
+        return flush_event.wait(timeout_millis / 1e3)
+
+    def shutdown(self, timeout_millis: float) -> None:
+        self._shutdown = True
+        self._worker_awaken.set()
+        self._worker_thread.join(timeout_millis / 1e3)
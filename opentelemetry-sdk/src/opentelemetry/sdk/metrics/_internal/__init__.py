@@ -4,7 +4,7 @@
 import os
 import weakref
 from atexit import register, unregister
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass
 from logging import getLogger
 from os import environ
@@ -13,11 +13,11 @@ from time import time_ns
 
 # This kind of import is needed to avoid Sphinx errors.
 import opentelemetry.sdk.metrics
+from opentelemetry.metrics import Asynchronous, CallbackOptions, NoOpMeter, Observation
 from opentelemetry.metrics import Counter as APICounter
 from opentelemetry.metrics import Histogram as APIHistogram
 from opentelemetry.metrics import Meter as APIMeter
 from opentelemetry.metrics import MeterProvider as APIMeterProvider
-from opentelemetry.metrics import NoOpMeter
 from opentelemetry.metrics import ObservableCounter as APIObservableCounter
 from opentelemetry.metrics import ObservableGauge as APIObservableGauge
 from opentelemetry.metrics import (
@@ -37,6 +37,8 @@ from opentelemetry.sdk.metrics._internal.exemplar import (
     TraceBasedExemplarFilter,
 )
 from opentelemetry.sdk.metrics._internal.instrument import (
+    _Asynchronous,
+    _BatchCallback,
     _Counter,
     _Gauge,
     _Histogram,
@@ -59,6 +61,7 @@ from opentelemetry.sdk.resources import (
 from opentelemetry.sdk.util._configurator import RuleBasedConfigurator
 from opentelemetry.sdk.util.instrumentation import (
     InstrumentationScope,
+    _instrumentation_scope_key,
 )
 from opentelemetry.util._once import Once
 from opentelemetry.util.types import (
@@ -355,6 +358,30 @@ class Meter(APIMeter):
             )
         return instrument
 
+    def register_batch_callback(
+        self,
+        callback: Callable[[CallbackOptions], Iterable[tuple[Asynchronous, Observation]]],
+        instruments: Sequence[Asynchronous],
+    ) -> None:
+        batch_instruments = []
+        for instrument in instruments:
+            if (
+                isinstance(instrument, _Asynchronous)
+                # pylint: disable=protected-access
+                and instrument._measurement_consumer is self._measurement_consumer
+                and instrument.instrumentation_scope == self._instrumentation_scope
+            ):
+                batch_instruments.append(instrument)
+            else:
+                _logger.warning(
+                    "Instrument %s is not an asynchronous instrument of meter %s, it is ignored by the batch callback.",
+                    getattr(instrument, "name", instrument),
+                    self._instrumentation_scope.name,
+                )
+
+        if batch_instruments:
+            self._measurement_consumer.register_asynchronous_instrument(_BatchCallback(callback, batch_instruments))
+
 
 def _get_exemplar_filter(exemplar_filter: str) -> ExemplarFilter:
     if exemplar_filter == "trace_based":
@@ -396,6 +423,18 @@ class MeterProvider(APIMeterProvider):
         shutdown_on_exit: If true, registers an `atexit` handler to call
             `MeterProvider.shutdown`
         views: The views to configure the metric output the SDK
+        idle_series_ttl_millis: If set, metric streams (unique attribute sets)
+            without measurements for this long are evicted. Delta streams of
+            synchronous instruments are always evicted as soon as a
+            collection finds them idle. An evicted stream starts again from a
+            new start time if it gets new measurements.
+        callback_max_workers: If set, the callbacks of asynchronous
+            instruments are run concurrently by a pool of at most this many
+            threads during a collection, instead of one after the other.
+        callback_timeout_millis: If set, the measurements of a callback that
+            runs for longer than this are dropped. The collection does not
+            wait for it, and the callback is skipped by the next collections
+            until it returns. Requires ``callback_max_workers``.
 
     .. code-block:: python
         :caption: Push-based export with PeriodicExportingMetricReader
@@ -438,8 +477,20 @@ class MeterProvider(APIMeterProvider):
         shutdown_on_exit: bool = True,
         views: Sequence["opentelemetry.sdk.metrics.view.View"] = (),
         *,
+        idle_series_ttl_millis: float | None = None,
+        callback_max_workers: int | None = None,
+        callback_timeout_millis: float | None = None,
         _meter_configurator: _MeterConfiguratorT | None = None,
     ):
+        if idle_series_ttl_millis is not None and idle_series_ttl_millis <= 0:
+            raise ValueError("idle_series_ttl_millis must be a positive number")
+        if callback_max_workers is not None and callback_max_workers <= 0:
+            raise ValueError("callback_max_workers must be a positive integer")
+        if callback_timeout_millis is not None:
+            if callback_max_workers is None:
+                raise ValueError("callback_timeout_millis requires callback_max_workers")
+            if callback_timeout_millis <= 0:
+                raise ValueError("callback_timeout_millis must be a positive number")
         self._lock = Lock()
         self._meter_lock = Lock()
         self._atexit_handler = None
@@ -451,11 +502,14 @@ class MeterProvider(APIMeterProvider):
             ),
             resource=resource,
             views=views,
+            idle_series_ttl_millis=idle_series_ttl_millis,
         )
         self._metric_readers = metric_readers
         self._measurement_consumer = SynchronousMeasurementConsumer(
             sdk_config=self._sdk_config,
             metric_readers=metric_readers,
+            callback_max_workers=callback_max_workers,
+            callback_timeout_millis=callback_timeout_millis,
         )
         disabled = environ.get(OTEL_SDK_DISABLED, "")
         self._disabled = disabled.lower().strip() == "true"
@@ -464,6 +518,8 @@ class MeterProvider(APIMeterProvider):
             self._atexit_handler = register(self.shutdown)
 
         self._meters: dict[InstrumentationScope, Meter] = {}
+        # Meters by get_meter arguments, read without locking.
+        self._meter_cache: dict[tuple[object, ...], Meter] = {}
         self._shutdown_once = Once()
         self._shutdown = False
         self._meter_configurator = _meter_configurator or _default_meter_configurator
@@ -478,7 +534,10 @@ class MeterProvider(APIMeterProvider):
 
                 self._all_metric_readers.add(metric_reader)
 
-            metric_reader._set_collect_callback(self._measurement_consumer.collect)
+            metric_reader._set_collect_callback(
+                self._measurement_consumer.collect,
+                self._measurement_consumer.collect_chunks,
+            )
             metric_reader._set_meter_provider(self)
 
         if hasattr(os, "register_at_fork"):
@@ -524,6 +583,25 @@ class MeterProvider(APIMeterProvider):
             )
             return _MeterConfig.default()
 
+    @property
+    def evicted_series(self) -> int:
+        """The number of idle metric streams evicted so far, summed over all
+        the metric readers."""
+        return self._measurement_consumer.evicted_series
+
+    @property
+    def timed_out_callbacks(self) -> int:
+        """The number of asynchronous instrument callbacks whose measurements
+        were dropped because they timed out."""
+        return self._measurement_consumer.timed_out_callbacks
+
+    @property
+    def skipped_callbacks(self) -> int:
+        """The number of asynchronous instrument callbacks that were not run
+        by a collection, because they were still running after timing out or
+        did not start before the collection deadline."""
+        return self._measurement_consumer.skipped_callbacks
+
     def force_flush(self, timeout_millis: float = 10_000) -> bool:
         deadline_ns = time_ns() + timeout_millis * 10**6
 
@@ -582,6 +660,8 @@ class MeterProvider(APIMeterProvider):
             except Exception as error:
                 metric_reader_error[metric_reader] = error
 
+        self._measurement_consumer.shutdown()
+
         if self._atexit_handler is not None:
             unregister(self._atexit_handler)
             self._atexit_handler = None
@@ -619,6 +699,12 @@ class MeterProvider(APIMeterProvider):
             _logger.warning("Meter name cannot be None or empty.")
             return NoOpMeter(name, version=version, schema_url=schema_url)
 
+        key = _instrumentation_scope_key(name, version, schema_url, attributes)
+        if key is not None:
+            meter = self._meter_cache.get(key)
+            if meter is not None:
+                return meter
+
         instrumentation_scope = InstrumentationScope(name, version, schema_url, attributes)
         with self._meter_lock:
             if not self._meters.get(instrumentation_scope):
@@ -629,7 +715,10 @@ class MeterProvider(APIMeterProvider):
                     self._measurement_consumer,
                     _meter_config=self._apply_meter_configurator(instrumentation_scope),
                 )
-            return self._meters[instrumentation_scope]
+            meter = self._meters[instrumentation_scope]
+            if key is not None:
+                self._meter_cache[key] = meter
+            return meter
 
     def add_metric_reader(self, metric_reader: "opentelemetry.sdk.metrics.export.MetricReader") -> None:
         with self._all_metric_readers_lock:
@@ -641,7 +730,10 @@ class MeterProvider(APIMeterProvider):
                 return
             self._measurement_consumer.add_metric_reader(metric_reader)
             # pylint: disable-next=protected-access
-            metric_reader._set_collect_callback(self._measurement_consumer.collect)
+            metric_reader._set_collect_callback(
+                self._measurement_consumer.collect,
+                self._measurement_consumer.collect_chunks,
+            )
             self._all_metric_readers.add(metric_reader)
 
     def remove_metric_reader(
@@ -2,38 +2,116 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from dataclasses import replace
 from logging import getLogger
 from threading import Lock
 from time import time_ns
 from typing import cast
 
+# This kind of import is needed to avoid Sphinx errors.
+import opentelemetry.sdk.metrics
+from opentelemetry.metrics import Asynchronous
 from opentelemetry.sdk.metrics._internal.aggregation import (
     Aggregation,
     AggregationTemporality,
     DefaultAggregation,
     _Aggregation,
+    _LastValueAggregation,
     _SumAggregation,
 )
+from opentelemetry.sdk.metrics._internal.export._delta_to_cumulative import (
+    _add_exponential_histogram_data_points,
+    _add_histogram_data_points,
+    _add_number_data_points,
+)
 from opentelemetry.sdk.metrics._internal.instrument import _Instrument
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
-from opentelemetry.sdk.metrics._internal.point import DataPointT
+from opentelemetry.sdk.metrics._internal.point import (
+    DataPointT,
+    HistogramDataPoint,
+    NumberDataPoint,
+)
 from opentelemetry.sdk.metrics._internal.view import View
 
 _logger = getLogger(__name__)
 
 
+def _merge_data_points(pending: DataPointT, data_point: DataPointT, add: bool) -> DataPointT:
+    """Merges a collected data point into the one pending for a reader.
+
+    Delta points are added, other points replace the pending one. The
+    exemplars of both are kept, up to the size of the larger of them, as the
+    reservoir of the stream would.
+    """
+    if not add:
+        merged = data_point
+    elif isinstance(data_point, NumberDataPoint):
+        merged = _add_number_data_points(pending, data_point)
+    elif isinstance(data_point, HistogramDataPoint):
+        merged = _add_histogram_data_points(pending, data_point)
+    else:
+        merged = _add_exponential_histogram_data_points(pending, data_point)
+
+    if not pending.exemplars:
+        return merged
+    exemplars = [*pending.exemplars, *data_point.exemplars]
+    return replace(
+        merged,
+        exemplars=exemplars[-max(len(pending.exemplars), len(data_point.exemplars)) :],
+    )
+
+
+def _merge_pending_data_points(
+    pending: dict[frozenset, DataPointT],
+    data_points: dict[frozenset, DataPointT],
+    add: bool,
+) -> None:
+    for aggr_key, data_point in data_points.items():
+        pending_data_point = pending.get(aggr_key)
+        pending[aggr_key] = (
+            data_point if pending_data_point is None else _merge_data_points(pending_data_point, data_point, add)
+        )
+
+
+class _ReaderCursor:
+    """The state of a stream for one of the readers that collect it."""
+
+    __slots__ = ("data_points", "idle_since_nanos")
+
+    def __init__(self) -> None:
+        # The data points collected by the other readers that this reader
+        # has not collected yet, by attributes.
+        self.data_points: dict[frozenset, DataPointT] = {}
+        self.idle_since_nanos: dict[frozenset, int] = {}
+
+
 class _ViewInstrumentMatch:
     def __init__(
         self,
         view: View,
         instrument: _Instrument,
         instrument_class_aggregation: dict[type, Aggregation],
+        idle_series_ttl_millis: float | None = None,
+        metric_readers: Iterable["opentelemetry.sdk.metrics.export.MetricReader | None"] = (None,),
     ):
         self._view = view
         self._instrument = instrument
         self._attributes_aggregation: dict[frozenset, _Aggregation] = {}
         self._lock = Lock()
+        # Delta streams of synchronous instruments keep no state between
+        # collections, so they are evicted as soon as they are idle. Other
+        # streams are evicted once they have been idle for the TTL.
+        self._evict_idle_delta = not isinstance(instrument, Asynchronous)
+        self._idle_series_ttl_nanos = None if idle_series_ttl_millis is None else int(idle_series_ttl_millis * 1e6)
+        self._evicted_series = 0
+        # The stream is aggregated once for all the readers, each collection
+        # keeps the data points for the other readers until they collect.
+        self._cursors: dict[opentelemetry.sdk.metrics.export.MetricReader | None, _ReaderCursor] = {
+            metric_reader: _ReaderCursor() for metric_reader in metric_readers
+        }
+        # Whether a measurement was consumed since the last collection.
+        self._dirty = False
         self._instrument_class_aggregation = instrument_class_aggregation
         self._name = self._view._name or self._instrument.name
         self._description = self._view._description or self._instrument.description
@@ -80,6 +158,8 @@ class _ViewInstrumentMatch:
 
     # pylint: disable=protected-access
     def consume_measurement(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
+        self._dirty = True
+
         if self._view._attribute_keys is not None:
             attributes = {}
 
@@ -87,15 +167,21 @@ class _ViewInstrumentMatch:
                 if key in self._view._attribute_keys:
                     attributes[key] = value
         elif measurement.attributes is not None:
-            attributes = dict(measurement.attributes)
+            # Copied only when a new stream is created.
+            attributes = measurement.attributes
         else:
             attributes = {}
 
         aggr_key = frozenset(attributes.items())
 
-        if aggr_key not in self._attributes_aggregation:
+        aggregation = self._attributes_aggregation.get(aggr_key)
+        if aggregation is None:
             with self._lock:
-                if aggr_key not in self._attributes_aggregation:
+                aggregation = self._attributes_aggregation.get(aggr_key)
+                if aggregation is None:
+                    # The attributes of a stream are shared by all of its
+                    # points.
+                    attributes = dict(attributes)
                     if not isinstance(self._view._aggregation, DefaultAggregation):
                         aggregation = self._view._aggregation._create_aggregation(
                             self._instrument,
@@ -114,21 +200,127 @@ class _ViewInstrumentMatch:
                         )
                     self._attributes_aggregation[aggr_key] = aggregation
 
-        self._attributes_aggregation[aggr_key].aggregate(measurement, should_sample_exemplar)
+        aggregation.aggregate(measurement, should_sample_exemplar)
+
+        if self._attributes_aggregation.get(aggr_key) is not aggregation:
+            # The stream was evicted by a concurrent collection before the
+            # measurement was aggregated, aggregate it in a new stream.
+            self.consume_measurement(measurement, should_sample_exemplar)
+
+    def _add_reader(self, metric_reader: "opentelemetry.sdk.metrics.export.MetricReader") -> None:
+        with self._lock:
+            self._cursors[metric_reader] = _ReaderCursor()
+
+    def _remove_reader(self, metric_reader: "opentelemetry.sdk.metrics.export.MetricReader") -> None:
+        with self._lock:
+            del self._cursors[metric_reader]
 
     def collect(
         self,
         collection_aggregation_temporality: AggregationTemporality,
         collection_start_nanos: int,
+        metric_reader: "opentelemetry.sdk.metrics.export.MetricReader | None" = None,
     ) -> Sequence[DataPointT] | None:
-        data_points: list[DataPointT] = []
         with self._lock:
-            for aggregation in self._attributes_aggregation.values():
-                data_point = aggregation.collect(collection_aggregation_temporality, collection_start_nanos)
-                if data_point is not None:
-                    data_points.append(data_point)
+            # Measurements consumed after this point are collected by the next
+            # collection, or by this one when they race with it.
+            dirty = self._dirty
+            self._dirty = False
+
+            cursor = self._cursors.get(metric_reader)
+            if cursor is None:
+                # The reader was removed while it was collecting.
+                return None
+
+            if dirty or self._attributes_aggregation:
+                data_points = self._collect_aggregations(
+                    collection_aggregation_temporality, collection_start_nanos, dirty, cursor
+                )
+            else:
+                data_points = {}
+
+            if len(self._cursors) > 1:
+                add = collection_aggregation_temporality is AggregationTemporality.DELTA and not isinstance(
+                    self._aggregation, _LastValueAggregation
+                )
+                for other_cursor in self._cursors.values():
+                    if other_cursor is not cursor:
+                        _merge_pending_data_points(other_cursor.data_points, data_points, add)
+                if cursor.data_points:
+                    pending = cursor.data_points
+                    cursor.data_points = {}
+                    _merge_pending_data_points(pending, data_points, add)
+                    data_points = pending
 
         # Returning here None instead of an empty list because the caller
         # does not consume a sequence and to be consistent with the rest of
         # collect methods that also return None.
-        return data_points or None
+        return list(data_points.values()) or None
+
+    def _collect_aggregations(
+        self,
+        collection_aggregation_temporality: AggregationTemporality,
+        collection_start_nanos: int,
+        dirty: bool,
+        cursor: _ReaderCursor,
+    ) -> dict[frozenset, DataPointT]:
+        """Collects the aggregations, it should be called while holding the
+        lock."""
+        data_points: dict[frozenset, DataPointT] = {}
+        evict_idle = self._evict_idle_delta and collection_aggregation_temporality is AggregationTemporality.DELTA
+        idle_series_ttl_nanos = self._idle_series_ttl_nanos
+        idle: list[frozenset] = []
+        if evict_idle and not dirty:
+            # No stream changed since the last collection, so every
+            # stream is idle and none of them has to be collected.
+            idle.extend(self._attributes_aggregation)
+        else:
+            for aggr_key, aggregation in self._attributes_aggregation.items():
+                if evict_idle:
+                    data_point = aggregation.collect(collection_aggregation_temporality, collection_start_nanos)
+                    if data_point is None:
+                        idle.append(aggr_key)
+                else:
+                    if idle_series_ttl_nanos is not None:
+                        # Read without the aggregation lock, a measurement
+                        # racing with the collection delays the eviction.
+                        if aggregation._has_measurements():
+                            # The measurements are collected for every reader.
+                            for reader_cursor in self._cursors.values():
+                                reader_cursor.idle_since_nanos.pop(aggr_key, None)
+                        else:
+                            cursor.idle_since_nanos.setdefault(aggr_key, collection_start_nanos)
+                            # The stream is evicted once it is idle for
+                            # every reader.
+                            if all(
+                                collection_start_nanos
+                                - reader_cursor.idle_since_nanos.get(aggr_key, collection_start_nanos)
+                                >= idle_series_ttl_nanos
+                                for reader_cursor in self._cursors.values()
+                            ):
+                                idle.append(aggr_key)
+                                continue
+                    data_point = aggregation.collect(collection_aggregation_temporality, collection_start_nanos)
+                if data_point is not None:
+                    data_points[aggr_key] = data_point
+
+        for aggr_key in idle:
+            aggregation = self._attributes_aggregation[aggr_key]
+            # The stream is removed while holding the aggregation lock so
+            # that measurements aggregated concurrently are either
+            # collected or aggregated again into a new stream.
+            with aggregation._lock:
+                evict = not aggregation._has_measurements()
+                if evict:
+                    del self._attributes_aggregation[aggr_key]
+            if evict:
+                for reader_cursor in self._cursors.values():
+                    reader_cursor.idle_since_nanos.pop(aggr_key, None)
+                self._evicted_series += 1
+            elif not evict_idle or not dirty:
+                # A measurement arrived after the stream was found idle.
+                data_point = aggregation.collect(collection_aggregation_temporality, collection_start_nanos)
+                if data_point is not None:
+                    data_points[aggr_key] = data_point
+
+        return data_points
@@ -30,6 +30,7 @@ from opentelemetry.metrics import (
 )
 from opentelemetry.sdk.metrics._internal.exemplar import (
     Exemplar,
+    ExemplarReservoir,
     ExemplarReservoirBuilder,
 )
 from opentelemetry.sdk.metrics._internal.exponential_histogram.buckets import (
@@ -84,7 +85,10 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
     ):
         self._lock = Lock()
         self._attributes = attributes
-        self._reservoir = reservoir_builder()
+        # The reservoir is built on the first sampled measurement, most
+        # streams never sample one.
+        self._reservoir_builder = reservoir_builder
+        self._reservoir: ExemplarReservoir | None = None
         self._previous_point = None
 
     @abstractmethod
@@ -104,12 +108,21 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
     ) -> _DataPointVarT | None:
         pass
 
+    def _has_measurements(self) -> bool:
+        """Returns whether there are measurements that were not collected yet.
+
+        It should be called while holding the aggregation lock.
+        """
+        return self._value is not None
+
     def _collect_exemplars(self) -> Sequence[Exemplar]:
         """Returns the collected exemplars.
 
         Returns:
             The exemplars collected by the reservoir
         """
+        if self._reservoir is None:
+            return []
         return self._reservoir.collect(self._attributes)
 
     def _sample_exemplar(self, measurement: Measurement, should_sample_exemplar: bool) -> None:
@@ -122,7 +135,13 @@ class _Aggregation(ABC, Generic[_DataPointVarT]):
             should_sample_exemplar: Whether the measurement should be sampled by the exemplars reservoir or not.
         """
         if should_sample_exemplar:
-            self._reservoir.offer(
+            reservoir = self._reservoir
+            if reservoir is None:
+                with self._lock:
+                    if self._reservoir is None:
+                        self._reservoir = self._reservoir_builder()
+                    reservoir = self._reservoir
+            reservoir.offer(
                 measurement.value,
                 measurement.time_unix_nano,
                 measurement.attributes,
@@ -134,6 +153,9 @@ class _DropAggregation(_Aggregation):
     def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
         pass
 
+    def _has_measurements(self) -> bool:
+        return False
+
     def collect(
         self,
         collection_aggregation_temporality: AggregationTemporality,
@@ -456,7 +478,8 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
         self._max = -math.inf
         self._sum = 0
 
-        self._previous_value = None
+        self._previous_value: tuple[int, ...] | None = None
+        self._previous_count = 0
         self._previous_min = math.inf
         self._previous_max = -math.inf
         self._previous_sum = 0
@@ -526,31 +549,34 @@ class _ExplicitBucketHistogramAggregation(_Aggregation[HistogramPoint]):
                         max=max_,
                     )
 
-                if value is None:
-                    value = self._get_empty_bucket_counts()
-
+                # The cumulative bucket counts are kept in a tuple, so that
+                # the points of a stream without new measurements share it
+                # instead of copying it.
                 if self._previous_value is None:
-                    self._previous_value = self._get_empty_bucket_counts()
-
-                self._previous_value = [
-                    value_element + previous_value_element
-                    for (
-                        value_element,
-                        previous_value_element,
-                    ) in zip(value, self._previous_value)
-                ]
-                self._previous_min = min(min_, self._previous_min)
-                self._previous_max = max(max_, self._previous_max)
-                self._previous_sum = sum_ + self._previous_sum
+                    self._previous_value = tuple(self._get_empty_bucket_counts())
+                    self._previous_count = 0
+
+                if value is not None:
+                    self._previous_value = tuple(
+                        value_element + previous_value_element
+                        for (
+                            value_element,
+                            previous_value_element,
+                        ) in zip(value, self._previous_value)
+                    )
+                    self._previous_count += sum(value)
+                    self._previous_min = min(min_, self._previous_min)
+                    self._previous_max = max(max_, self._previous_max)
+                    self._previous_sum = sum_ + self._previous_sum
 
                 return HistogramDataPoint(
                     attributes=self._attributes,
                     exemplars=self._collect_exemplars(),
                     start_time_unix_nano=self._start_time_unix_nano,
                     time_unix_nano=collection_start_nano,
-                    count=sum(self._previous_value),
+                    count=self._previous_count,
                     sum=self._previous_sum,
-                    bucket_counts=tuple(self._previous_value),
+                    bucket_counts=self._previous_value,
                     explicit_bounds=self._boundaries,
                     min=self._previous_min,
                     max=self._previous_max,
@@ -646,6 +672,9 @@ class _ExponentialBucketHistogramAggregation(_Aggregation[HistogramPoint]):
 
         self._mapping = self._new_mapping(self._max_scale)
 
+    def _has_measurements(self) -> bool:
+        return self._value_positive is not None or self._value_negative is not None
+
     def aggregate(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
         # pylint: disable=too-many-branches,too-many-statements, too-many-locals
 
@@ -6,7 +6,7 @@ import math
 import os
 import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from enum import Enum
 from logging import getLogger
 from os import environ, linesep
@@ -219,6 +219,16 @@ class MetricReader(ABC):
             ]
             | None
         ) = None
+        self._collect_chunks: (
+            Callable[
+                [opentelemetry.sdk.metrics.export.MetricReader, int],
+                Iterator[MetricsData],
+            ]
+            | None
+        ) = None
+        # Set by the readers that receive the metrics of a collection in
+        # chunks of at most this many metrics.
+        self._max_metrics_per_chunk: int | None = None
 
         self._instrument_class_temporality = {
             _Counter: AggregationTemporality.CUMULATIVE,
@@ -311,6 +321,10 @@ class MetricReader(ABC):
             _logger.warning("Cannot call collect on a MetricReader until it is registered on a MeterProvider")
             return
 
+        if self._max_metrics_per_chunk is not None and self._collect_chunks is not None:
+            self._collect_in_chunks(self._collect_chunks, self._max_metrics_per_chunk, timeout_millis)
+            return
+
         start_time = perf_counter()
         try:
             metrics = self._collect(self, timeout_millis=timeout_millis)
@@ -323,6 +337,37 @@ class MetricReader(ABC):
                 timeout_millis=timeout_millis,
             )
 
+    def _collect_in_chunks(
+        self,
+        collect_chunks: Callable[
+            [opentelemetry.sdk.metrics.export.MetricReader, int],
+            Iterator[MetricsData],
+        ],
+        max_metrics_per_chunk: int,
+        timeout_millis: float,
+    ) -> None:
+        # Each chunk is received as soon as it is collected, the collection
+        # time does not include the time spent receiving the chunks.
+        chunks = collect_chunks(self, max_metrics_per_chunk, timeout_millis=timeout_millis)
+        collection_time = 0.0
+        try:
+            while True:
+                start_time = perf_counter()
+                try:
+                    metrics = next(chunks, None)
+                finally:
+                    collection_time += perf_counter() - start_time
+
+                if metrics is None:
+                    return
+
+                self._receive_metrics(
+                    metrics,
+                    timeout_millis=timeout_millis,
+                )
+        finally:
+            self._metrics.record_collection(collection_time)
+
     @final
     def _set_collect_callback(
         self,
@@ -334,9 +379,15 @@ class MetricReader(ABC):
             MetricsData,
         ]
         | None,
+        chunks_func: Callable[
+            [opentelemetry.sdk.metrics.export.MetricReader, int],
+            Iterator[MetricsData],
+        ]
+        | None = None,
     ) -> None:
         """This function is internal to the SDK. It should not be called or overridden by users"""
         self._collect = func
+        self._collect_chunks = chunks_func
 
     @abstractmethod
     def _receive_metrics(
@@ -421,6 +472,10 @@ class PeriodicExportingMetricReader(MetricReader):
 
     The configured exporter's :py:meth:`~MetricExporter.export` method will not be called
     concurrently.
+
+    When ``max_metrics_per_export`` is set, the metrics of a collection are
+    exported in batches of at most that many metrics, each batch is exported
+    as soon as it is collected.
     """
 
     def __init__(
@@ -428,6 +483,7 @@ class PeriodicExportingMetricReader(MetricReader):
         exporter: MetricExporter,
         export_interval_millis: float | None = None,
         export_timeout_millis: float | None = None,
+        max_metrics_per_export: int | None = None,
     ) -> None:
         # PeriodicExportingMetricReader defers to exporter for configuration
         super().__init__(
@@ -456,6 +512,9 @@ class PeriodicExportingMetricReader(MetricReader):
                 export_timeout_millis = 30000
         self._export_interval_millis = export_interval_millis
         self._export_timeout_millis = export_timeout_millis
+        if max_metrics_per_export is not None and max_metrics_per_export <= 0:
+            raise ValueError("max_metrics_per_export must be a positive integer")
+        self._max_metrics_per_chunk = max_metrics_per_export
         self._shutdown = False
         self._shutdown_event = Event()
         self._shutdown_once = Once()
@@ -0,0 +1,461 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
+from logging import getLogger
+from threading import Lock
+from time import time_ns
+
+from opentelemetry.sdk.metrics._internal.aggregation import (
+    AggregationTemporality,
+)
+from opentelemetry.sdk.metrics._internal.export import (
+    MetricExporter,
+    MetricExportResult,
+)
+from opentelemetry.sdk.metrics._internal.instrument import (
+    Counter,
+    Histogram,
+    ObservableCounter,
+    ObservableUpDownCounter,
+    UpDownCounter,
+)
+from opentelemetry.sdk.metrics._internal.point import (
+    Buckets,
+    DataPointT,
+    ExponentialHistogramDataPoint,
+    HistogramDataPoint,
+    Metric,
+    MetricsData,
+    NumberDataPoint,
+    ResourceMetrics,
+    ScopeMetrics,
+    Sum,
+)
+from opentelemetry.sdk.metrics._internal.point import (
+    Histogram as HistogramPoint,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+_logger = getLogger(__name__)
+
+# The default maximum number of buckets of the exponential histogram
+# aggregation, accumulated exponential histograms are downscaled to fit it.
+_EXPONENTIAL_HISTOGRAM_MAX_SIZE = 160
+
+
+def _add_number_data_points(cumulative: NumberDataPoint, delta: NumberDataPoint) -> NumberDataPoint:
+    return NumberDataPoint(
+        attributes=cumulative.attributes,
+        start_time_unix_nano=cumulative.start_time_unix_nano,
+        time_unix_nano=delta.time_unix_nano,
+        value=cumulative.value + delta.value,
+        exemplars=delta.exemplars,
+    )
+
+
+def _add_histogram_data_points(cumulative: HistogramDataPoint, delta: HistogramDataPoint) -> HistogramDataPoint | None:
+    if cumulative.explicit_bounds is not delta.explicit_bounds and tuple(cumulative.explicit_bounds) != tuple(
+        delta.explicit_bounds
+    ):
+        return None
+    return HistogramDataPoint(
+        attributes=cumulative.attributes,
+        start_time_unix_nano=cumulative.start_time_unix_nano,
+        time_unix_nano=delta.time_unix_nano,
+        count=cumulative.count + delta.count,
+        sum=cumulative.sum + delta.sum,
+        bucket_counts=tuple(
+            cumulative_count + delta_count
+            for cumulative_count, delta_count in zip(cumulative.bucket_counts, delta.bucket_counts)
+        ),
+        explicit_bounds=cumulative.explicit_bounds,
+        min=min(cumulative.min, delta.min),
+        max=max(cumulative.max, delta.max),
+        exemplars=delta.exemplars,
+    )
+
+
+def _downscale_buckets(counts: dict[int, int], buckets: Buckets, shift: int) -> None:
+    """Adds the counts of the buckets to the counts by index, downscaled by shift."""
+    for index, count in enumerate(buckets.bucket_counts, buckets.offset):
+        if count:
+            index >>= shift
+            counts[index] = counts.get(index, 0) + count
+
+
+def _buckets(counts: dict[int, int], shift: int) -> Buckets:
+    if shift:
+        shifted: dict[int, int] = {}
+        for index, count in counts.items():
+            shifted[index >> shift] = shifted.get(index >> shift, 0) + count
+        counts = shifted
+    if not counts:
+        return Buckets(offset=0, bucket_counts=[])
+    offset = min(counts)
+    return Buckets(
+        offset=offset,
+        bucket_counts=[counts.get(index, 0) for index in range(offset, max(counts) + 1)],
+    )
+
+
+def _add_exponential_histogram_data_points(
+    cumulative: ExponentialHistogramDataPoint,
+    delta: ExponentialHistogramDataPoint,
+) -> ExponentialHistogramDataPoint:
+    scale = min(cumulative.scale, delta.scale)
+    positive: dict[int, int] = {}
+    negative: dict[int, int] = {}
+    for point in (cumulative, delta):
+        _downscale_buckets(positive, point.positive, point.scale - scale)
+        _downscale_buckets(negative, point.negative, point.scale - scale)
+
+    max_size = max(
+        _EXPONENTIAL_HISTOGRAM_MAX_SIZE,
+        len(delta.positive.bucket_counts),
+        len(delta.negative.bucket_counts),
+    )
+    # Downscale until the accumulated buckets fit in the maximum size.
+    shift = 0
+    for counts in (positive, negative):
+        if counts:
+            low, high = min(counts), max(counts)
+            while (high >> shift) - (low >> shift) + 1 > max_size:
+                shift += 1
+
+    return ExponentialHistogramDataPoint(
+        attributes=cumulative.attributes,
+        start_time_unix_nano=cumulative.start_time_unix_nano,
+        time_unix_nano=delta.time_unix_nano,
+        count=cumulative.count + delta.count,
+        sum=cumulative.sum + delta.sum,
+        scale=scale - shift,
+        zero_count=cumulative.zero_count + delta.zero_count,
+        positive=_buckets(positive, shift),
+        negative=_buckets(negative, shift),
+        flags=delta.flags,
+        min=min(cumulative.min, delta.min),
+        max=max(cumulative.max, delta.max),
+        exemplars=delta.exemplars,
+    )
+
+
+def _with_time(point: DataPointT, time_unix_nano: int) -> DataPointT:
+    """Returns the point of an unchanged stream at the time of an export."""
+    if isinstance(point, NumberDataPoint):
+        return NumberDataPoint(
+            attributes=point.attributes,
+            start_time_unix_nano=point.start_time_unix_nano,
+            time_unix_nano=time_unix_nano,
+            value=point.value,
+        )
+    if isinstance(point, HistogramDataPoint):
+        return HistogramDataPoint(
+            attributes=point.attributes,
+            start_time_unix_nano=point.start_time_unix_nano,
+            time_unix_nano=time_unix_nano,
+            count=point.count,
+            sum=point.sum,
+            bucket_counts=point.bucket_counts,
+            explicit_bounds=point.explicit_bounds,
+            min=point.min,
+            max=point.max,
+        )
+    return ExponentialHistogramDataPoint(
+        attributes=point.attributes,
+        start_time_unix_nano=point.start_time_unix_nano,
+        time_unix_nano=time_unix_nano,
+        count=point.count,
+        sum=point.sum,
+        scale=point.scale,
+        zero_count=point.zero_count,
+        positive=point.positive,
+        negative=point.negative,
+        flags=point.flags,
+        min=point.min,
+        max=point.max,
+    )
+
+
+class _Stream:
+    __slots__ = ("point", "updated", "exported")
+
+    def __init__(self, point: DataPointT, updated: int) -> None:
+        # The cumulative point of the stream.
+        self.point = point
+        self.updated = updated
+        # The last export of the stream.
+        self.exported = 0
+
+
+class _MetricState:
+    """The cumulative streams of a delta metric."""
+
+    __slots__ = ("name", "description", "unit", "data_type", "is_monotonic", "streams")
+
+    def __init__(self, metric: Metric) -> None:
+        self.name = metric.name
+        self.description = metric.description
+        self.unit = metric.unit
+        self.data_type = type(metric.data)
+        self.is_monotonic = getattr(metric.data, "is_monotonic", None)
+        self.streams: dict[frozenset, _Stream] = {}
+
+    def to_metric(self, export: int, time_unix_nano: int) -> Metric:
+        data_points = []
+        for stream in self.streams.values():
+            if stream.exported == export:
+                data_points.append(stream.point)
+            else:
+                data_points.append(_with_time(stream.point, time_unix_nano))
+        if self.data_type is Sum:
+            data = Sum(
+                data_points=data_points,
+                aggregation_temporality=AggregationTemporality.CUMULATIVE,
+                is_monotonic=self.is_monotonic,
+            )
+        else:
+            data = self.data_type(
+                data_points=data_points,
+                aggregation_temporality=AggregationTemporality.CUMULATIVE,
+            )
+        return Metric(
+            name=self.name,
+            description=self.description,
+            unit=self.unit,
+            data=data,
+        )
+
+
+class _ScopeState:
+    __slots__ = ("scope", "schema_url", "metrics")
+
+    def __init__(self, scope: InstrumentationScope, schema_url: str) -> None:
+        self.scope = scope
+        self.schema_url = schema_url
+        self.metrics: dict[tuple, _MetricState] = {}
+
+
+class _ResourceState:
+    __slots__ = ("resource", "schema_url", "scopes")
+
+    def __init__(self, resource: Resource, schema_url: str) -> None:
+        self.resource = resource
+        self.schema_url = schema_url
+        self.scopes: dict[InstrumentationScope, _ScopeState] = {}
+
+
+class DeltaToCumulativeMetricExporter(MetricExporter):
+    """`DeltaToCumulativeMetricExporter` is an implementation of
+    `MetricExporter` that accumulates delta metrics into cumulative metrics
+    before passing them to the configured exporter.
+
+    The SDK can then aggregate in delta temporality, which does not keep the
+    previous value of every stream, while the exporter still receives
+    cumulative metrics. Sums, histograms and exponential histograms in delta
+    temporality are accumulated, every other metric is passed as is.
+
+    Every accumulated stream is exported on every export, with the start time
+    of its first delta point. A stream that is not updated for
+    ``stream_ttl_millis`` is evicted, if it is updated again it starts from
+    zero with a new start time.
+
+    Args:
+        exporter: The exporter the cumulative metrics are passed to.
+        preferred_temporality: The temporality the metrics are collected
+            with. Defaults to delta for every instrument that supports it.
+        stream_ttl_millis: Amount of time in milliseconds after which a stream
+            that is not updated is evicted. Streams are not evicted when
+            ``None``.
+        max_streams: Maximum number of accumulated streams. The points of new
+            streams are dropped while the maximum is reached. The number of
+            streams is not limited when ``None``.
+    """
+
+    def __init__(
+        self,
+        exporter: MetricExporter,
+        preferred_temporality: dict[type, AggregationTemporality] | None = None,
+        stream_ttl_millis: float | None = 300_000,
+        max_streams: int | None = None,
+    ) -> None:
+        if stream_ttl_millis is not None and stream_ttl_millis <= 0:
+            raise ValueError("stream_ttl_millis must be a positive number")
+        if max_streams is not None and max_streams <= 0:
+            raise ValueError("max_streams must be a positive number")
+        if preferred_temporality is None:
+            preferred_temporality = {
+                Counter: AggregationTemporality.DELTA,
+                UpDownCounter: AggregationTemporality.DELTA,
+                Histogram: AggregationTemporality.DELTA,
+                ObservableCounter: AggregationTemporality.DELTA,
+                ObservableUpDownCounter: AggregationTemporality.DELTA,
+            }
+        super().__init__(
+            preferred_temporality=preferred_temporality,
+            preferred_aggregation=exporter._preferred_aggregation,
+        )
+        self._exporter = exporter
+        self._stream_ttl_nanos = None if stream_ttl_millis is None else int(stream_ttl_millis * 1e6)
+        self._max_streams = max_streams
+        self._lock = Lock()
+        self._resources: dict[Resource, _ResourceState] = {}
+        self._num_streams = 0
+        self._exports = 0
+        self._evicted_streams = 0
+        self._dropped_points = 0
+
+    @property
+    def evicted_streams(self) -> int:
+        """The number of streams evicted after ``stream_ttl_millis``."""
+        return self._evicted_streams
+
+    @property
+    def dropped_points(self) -> int:
+        """The number of points of new streams dropped because the maximum
+        number of streams was reached."""
+        return self._dropped_points
+
+    def export(
+        self,
+        metrics_data: MetricsData,
+        timeout_millis: float = 10_000,
+        **kwargs,
+    ) -> MetricExportResult:
+        with self._lock:
+            metrics_data = self._accumulate(metrics_data)
+        return self._exporter.export(metrics_data, timeout_millis=timeout_millis, **kwargs)
+
+    def _accumulate(self, metrics_data: MetricsData) -> MetricsData:
+        self._exports += 1
+        export = self._exports
+        now = time_ns()
+        dropped_points = self._dropped_points
+        passed: dict[_ScopeState, list[Metric]] = {}
+
+        for resource_metrics in metrics_data.resource_metrics:
+            resource_state = self._resources.get(resource_metrics.resource)
+            if resource_state is None:
+                resource_state = self._resources[resource_metrics.resource] = _ResourceState(
+                    resource_metrics.resource, resource_metrics.schema_url
+                )
+            for scope_metrics in resource_metrics.scope_metrics:
+                scope_state = resource_state.scopes.get(scope_metrics.scope)
+                if scope_state is None:
+                    scope_state = resource_state.scopes[scope_metrics.scope] = _ScopeState(
+                        scope_metrics.scope, scope_metrics.schema_url
+                    )
+                for metric in scope_metrics.metrics:
+                    if getattr(metric.data, "aggregation_temporality", None) != AggregationTemporality.DELTA:
+                        passed.setdefault(scope_state, []).append(metric)
+                        continue
+                    self._accumulate_metric(scope_state, metric, export, now)
+
+        if self._dropped_points > dropped_points:
+            _logger.warning(
+                "Dropped the points of %s new streams, the maximum of %s streams is reached",
+                self._dropped_points - dropped_points,
+                self._max_streams,
+            )
+        self._evict(now)
+
+        resource_metrics = []
+        for resource_state in self._resources.values():
+            scope_metrics = []
+            for scope_state in resource_state.scopes.values():
+                metrics = passed.get(scope_state, [])
+                metrics.extend(
+                    metric_state.to_metric(export, now)
+                    for metric_state in scope_state.metrics.values()
+                    if metric_state.streams
+                )
+                if metrics:
+                    scope_metrics.append(
+                        ScopeMetrics(
+                            scope=scope_state.scope,
+                            metrics=metrics,
+                            schema_url=scope_state.schema_url,
+                        )
+                    )
+            if scope_metrics:
+                resource_metrics.append(
+                    ResourceMetrics(
+                        resource=resource_state.resource,
+                        scope_metrics=scope_metrics,
+                        schema_url=resource_state.schema_url,
+                    )
+                )
+        self._prune()
+        return MetricsData(resource_metrics=resource_metrics)
+
+    def _accumulate_metric(self, scope_state: _ScopeState, metric: Metric, export: int, now: int) -> None:
+        data = metric.data
+        metric_key = (
+            metric.name,
+            metric.description,
+            metric.unit,
+            type(data),
+            getattr(data, "is_monotonic", None),
+        )
+        metric_state = scope_state.metrics.get(metric_key)
+        if metric_state is None:
+            metric_state = scope_state.metrics[metric_key] = _MetricState(metric)
+        if isinstance(data, Sum):
+            add = _add_number_data_points
+        elif isinstance(data, HistogramPoint):
+            add = _add_histogram_data_points
+        else:
+            add = _add_exponential_histogram_data_points
+
+        streams = metric_state.streams
+        for point in data.data_points:
+            stream_key = frozenset(point.attributes.items())
+            stream = streams.get(stream_key)
+            if stream is None:
+                if self._max_streams is not None and self._num_streams >= self._max_streams:
+                    self._dropped_points += 1
+                    continue
+                stream = streams[stream_key] = _Stream(point, now)
+                self._num_streams += 1
+            elif point.start_time_unix_nano < stream.point.time_unix_nano:
+                # Points overlapping the accumulated ones are out of order.
+                _logger.debug("Dropped an out of order point of %s", metric.name)
+                continue
+            else:
+                # Points that can not be added, like histograms whose
+                # boundaries changed, restart the stream.
+                stream.point = add(stream.point, point) or point
+                stream.updated = now
+            stream.exported = export
+
+    def _evict(self, now: int) -> None:
+        if self._stream_ttl_nanos is None:
+            return
+        stale = now - self._stream_ttl_nanos
+        for resource_state in self._resources.values():
+            for scope_state in resource_state.scopes.values():
+                for metric_state in scope_state.metrics.values():
+                    streams = metric_state.streams
+                    for stream_key in [key for key, stream in streams.items() if stream.updated <= stale]:
+                        del streams[stream_key]
+                        self._num_streams -= 1
+                        self._evicted_streams += 1
+
+    def _prune(self) -> None:
+        """Removes the state left empty by evictions and passed metrics."""
+        for resource_key, resource_state in list(self._resources.items()):
+            for scope_key, scope_state in list(resource_state.scopes.items()):
+                for metric_key, metric_state in list(scope_state.metrics.items()):
+                    if not metric_state.streams:
+                        del scope_state.metrics[metric_key]
+                if not scope_state.metrics:
+                    del resource_state.scopes[scope_key]
+            if not resource_state.scopes:
+                del self._resources[resource_key]
+
+    def force_flush(self, timeout_millis: float = 10_000) -> bool:
+        return self._exporter.force_flush(timeout_millis=timeout_millis)
+
+    def shutdown(self, timeout_millis: float = 30_000, **kwargs) -> None:
+        self._exporter.shutdown(timeout_millis=timeout_millis, **kwargs)
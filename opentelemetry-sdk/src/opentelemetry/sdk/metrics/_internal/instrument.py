@@ -5,7 +5,7 @@
 from __future__ import annotations
 
 import math
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Sequence
 from logging import getLogger
 from time import time_ns
 from typing import (
@@ -17,7 +17,7 @@ from typing import (
 
 # This kind of import is needed to avoid Sphinx errors.
 from opentelemetry.context import Context, get_current
-from opentelemetry.metrics import Asynchronous, CallbackT, Synchronous
+from opentelemetry.metrics import Asynchronous, CallbackT, Observation, Synchronous
 from opentelemetry.metrics import Counter as APICounter
 from opentelemetry.metrics import Histogram as APIHistogram
 from opentelemetry.metrics import ObservableCounter as APIObservableCounter
@@ -160,23 +160,67 @@ class _Asynchronous(_Instrument, Asynchronous):
         for callback in self._callbacks:
             try:
                 for api_measurement in callback(callback_options):
-                    if not math.isfinite(api_measurement.value):
-                        _logger.warning(
-                            "Callback returned a non-finite value %s for instrument %s, ignoring measurement.",
-                            api_measurement.value,
-                            self.name,
-                        )
-                        continue
-                    yield Measurement(
-                        api_measurement.value,
-                        time_unix_nano=time_ns(),
-                        instrument=self,
-                        context=api_measurement.context or get_current(),
-                        attributes=api_measurement.attributes,
-                    )
+                    measurement = self._measurement(api_measurement)
+                    if measurement is not None:
+                        yield measurement
             except Exception:  # pylint: disable=broad-exception-caught
                 _logger.exception("Callback failed for instrument %s.", self.name)
 
+    def _measurement(self, api_measurement: Observation) -> Measurement | None:
+        if not math.isfinite(api_measurement.value):
+            _logger.warning(
+                "Callback returned a non-finite value %s for instrument %s, ignoring measurement.",
+                api_measurement.value,
+                self.name,
+            )
+            return None
+        return Measurement(
+            api_measurement.value,
+            time_unix_nano=time_ns(),
+            instrument=self,
+            context=api_measurement.context or get_current(),
+            attributes=api_measurement.attributes,
+        )
+
+
+class _BatchCallback:
+    """A callback that observes several asynchronous instruments of a meter
+    at once.
+
+    The callback returns ``(instrument, observation)`` pairs, observations for
+    instruments the callback was not registered for are ignored.
+    """
+
+    def __init__(
+        self,
+        callback: Callable[[CallbackOptions], Iterable[tuple[Asynchronous, Observation]]],
+        instruments: Sequence[_Asynchronous],
+    ) -> None:
+        self._callback = callback
+        self._instruments = tuple(instruments)
+        self.name = ", ".join(instrument.name for instrument in self._instruments)
+
+    def callback(self, callback_options: CallbackOptions) -> Iterable[Measurement]:
+        # pylint: disable=protected-access
+        if not any(instrument._is_enabled() for instrument in self._instruments):
+            return
+        try:
+            for instrument, api_measurement in self._callback(callback_options):
+                if instrument not in self._instruments:
+                    _logger.warning(
+                        "Batch callback for instruments %s observed another instrument %s, ignoring measurement.",
+                        self.name,
+                        getattr(instrument, "name", instrument),
+                    )
+                    continue
+                if not instrument._is_enabled():
+                    continue
+                measurement = instrument._measurement(api_measurement)
+                if measurement is not None:
+                    yield measurement
+        except Exception:  # pylint: disable=broad-exception-caught
+            _logger.exception("Batch callback failed for instruments %s.", self.name)
+
 
 class Counter(_Synchronous, APICounter):
     def __new__(cls, *args, **kwargs):
@@ -3,22 +3,38 @@
 
 # pylint: disable=unused-import
 
+import os
+import weakref
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from logging import getLogger
 from threading import Lock
 from time import time_ns
+from typing import Union, cast
 
 # This kind of import is needed to avoid Sphinx errors.
 import opentelemetry.sdk.metrics
 import opentelemetry.sdk.metrics._internal.instrument
 from opentelemetry.metrics._internal.instrument import CallbackOptions
 from opentelemetry.sdk.metrics._internal.exceptions import MetricsTimeoutError
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
 from opentelemetry.sdk.metrics._internal.metric_reader_storage import (
     MetricReaderStorage,
+    _equivalent_configuration,
 )
 from opentelemetry.sdk.metrics._internal.point import MetricsData
 
+_logger = getLogger(__name__)
+
+_AsynchronousCallback = Union[
+    "opentelemetry.sdk.metrics._internal.instrument._Asynchronous",
+    "opentelemetry.sdk.metrics._internal.instrument._BatchCallback",
+]
+
 
 class MeasurementConsumer(ABC):
     @abstractmethod
@@ -46,35 +62,92 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
         self,
         sdk_config: "opentelemetry.sdk.metrics._internal.sdk_configuration.SdkConfiguration",
         metric_readers: Iterable["opentelemetry.sdk.metrics.MetricReader"],
+        *,
+        callback_max_workers: int | None = None,
+        callback_timeout_millis: float | None = None,
     ) -> None:
         self._lock = Lock()
         self._sdk_config = sdk_config
-        self._reader_storages: Mapping[opentelemetry.sdk.metrics.export.MetricReader, MetricReaderStorage] = {
-            reader: MetricReaderStorage(
-                sdk_config,
-                reader._instrument_class_temporality,
-                reader._instrument_class_aggregation,
-            )
-            for reader in metric_readers
-        }
-        self._async_instruments: list[opentelemetry.sdk.metrics._internal.instrument._Asynchronous] = []
+        # When the filter can never sample, it is not called at all and no
+        # exemplar reservoir is ever built.
+        self._never_sample_exemplars = type(sdk_config.exemplar_filter) is AlwaysOffExemplarFilter
+        # Readers with the same configuration share a storage, measurements
+        # are consumed once by each storage.
+        self._reader_storages: Mapping[opentelemetry.sdk.metrics.export.MetricReader, MetricReaderStorage] = {}
+        self._storages: tuple[MetricReaderStorage, ...] = ()
+        for reader in metric_readers:
+            self._reader_storages, self._storages = self._with_metric_reader(reader)
+        self._async_instruments: list[_AsynchronousCallback] = []
+        # Callbacks run concurrently in a bounded thread pool when
+        # callback_max_workers is set, sequentially otherwise.
+        self._callback_max_workers = callback_max_workers
+        self._callback_timeout_ns = None if callback_timeout_millis is None else int(callback_timeout_millis * 1e6)
+        self._callback_executor: ThreadPoolExecutor | None = None
+        # The callbacks that timed out and are still running, they are
+        # skipped until they return.
+        self._running_callbacks: dict[_AsynchronousCallback, Future] = {}
+        self._timed_out_callbacks = 0
+        self._skipped_callbacks = 0
+        if callback_max_workers is not None:
+            self._init_callback_executor()
+            if hasattr(os, "register_at_fork"):
+                # Only the main thread is kept in forked processes, the
+                # executor needs to be re-instantiated to get fresh threads.
+                weak_reinit = weakref.WeakMethod(self._init_callback_executor)
 
-    def consume_measurement(self, measurement: Measurement) -> None:
-        should_sample_exemplar = self._sdk_config.exemplar_filter.should_sample(
+                def _after_in_child() -> None:
+                    reinit = weak_reinit()
+                    if reinit is not None:
+                        reinit()
+
+                os.register_at_fork(after_in_child=_after_in_child)
+
+    def _init_callback_executor(self) -> None:
+        self._callback_executor = ThreadPoolExecutor(
+            max_workers=self._callback_max_workers,
+            thread_name_prefix="OtelMetricCallback",
+        )
+        self._running_callbacks = {}
+
+    @property
+    def evicted_series(self) -> int:
+        """The number of idle metric streams evicted from all the readers."""
+        return sum(reader_storage.evicted_series for reader_storage in self._storages)
+
+    @property
+    def timed_out_callbacks(self) -> int:
+        """The number of asynchronous instrument callbacks that did not return
+        within the callback timeout."""
+        return self._timed_out_callbacks
+
+    @property
+    def skipped_callbacks(self) -> int:
+        """The number of asynchronous instrument callbacks that were not run
+        by a collection, because they were still running from a previous
+        collection or did not start before the collection deadline."""
+        return self._skipped_callbacks
+
+    def _should_sample_exemplar(self, measurement: Measurement) -> bool:
+        if self._never_sample_exemplars:
+            return False
+        return self._sdk_config.exemplar_filter.should_sample(
             measurement.value,
             measurement.time_unix_nano,
             measurement.attributes,
             measurement.context,
         )
-        # `_reader_storages` is replaced (never mutated in place) by
+
+    def consume_measurement(self, measurement: Measurement) -> None:
+        should_sample_exemplar = self._should_sample_exemplar(measurement)
+        # `_storages` is replaced (never mutated in place) by
         # `add_metric_reader` and `remove_metric_reader`, so it is safe
         # to iterate over without a lock.
-        for reader_storage in self._reader_storages.values():
+        for reader_storage in self._storages:
             reader_storage.consume_measurement(measurement, should_sample_exemplar)
 
     def register_asynchronous_instrument(
         self,
-        instrument: ("opentelemetry.sdk.metrics._internal.instrument._Asynchronous"),
+        instrument: "_AsynchronousCallback",
     ) -> None:
         with self._lock:
             self._async_instruments.append(instrument)
@@ -86,55 +159,194 @@ class SynchronousMeasurementConsumer(MeasurementConsumer):
     ) -> MetricsData | None:
         with self._lock:
             metric_reader_storage = self._reader_storages[metric_reader]
-            # for now, just use the defaults
-            callback_options = CallbackOptions()
-            deadline_ns = time_ns() + (timeout_millis * 1e6)
+            self._consume_callback_measurements(metric_reader_storage, timeout_millis)
+
+            result = metric_reader_storage.collect(metric_reader)
+
+        return result
+
+    def collect_chunks(
+        self,
+        metric_reader: "opentelemetry.sdk.metrics.export.MetricReader",
+        max_metrics_per_chunk: int,
+        timeout_millis: float = 10_000,
+    ) -> Iterator[MetricsData]:
+        """Collects the metrics of the reader in chunks of at most
+        ``max_metrics_per_chunk`` metrics.
+
+        The asynchronous instrument callbacks run before the first chunk is
+        collected. The lock is released before the chunks are collected, so
+        that the reader can export a chunk without blocking the collections
+        of the other readers.
+        """
+        with self._lock:
+            metric_reader_storage = self._reader_storages[metric_reader]
+            self._consume_callback_measurements(metric_reader_storage, timeout_millis)
 
-            default_timeout_ns = 10000 * 1e6
+        yield from metric_reader_storage.collect_chunks(metric_reader, max_metrics_per_chunk)
 
-            for async_instrument in self._async_instruments:
-                remaining_time = deadline_ns - time_ns()
+    def _consume_callback_measurements(self, metric_reader_storage: MetricReaderStorage, timeout_millis: float) -> None:
+        deadline_ns = time_ns() + (timeout_millis * 1e6)
 
-                if remaining_time < default_timeout_ns:
-                    callback_options = CallbackOptions(timeout_millis=remaining_time / 1e6)
+        if self._callback_executor is None:
+            measurements = self._run_callbacks(deadline_ns)
+        else:
+            measurements = self._run_callbacks_concurrently(deadline_ns)
 
-                measurements = async_instrument.callback(callback_options)
-                if time_ns() >= deadline_ns:
-                    raise MetricsTimeoutError("Timed out while executing callback")
+        for measurement in measurements:
+            should_sample_exemplar = self._should_sample_exemplar(measurement)
+            metric_reader_storage.consume_measurement(measurement, should_sample_exemplar)
 
-                for measurement in measurements:
-                    should_sample_exemplar = self._sdk_config.exemplar_filter.should_sample(
-                        measurement.value,
-                        measurement.time_unix_nano,
-                        measurement.attributes,
-                        measurement.context,
-                    )
-                    metric_reader_storage.consume_measurement(measurement, should_sample_exemplar)
+    def _run_callbacks(self, deadline_ns: float) -> Iterator[Measurement]:
+        # for now, just use the defaults
+        callback_options = CallbackOptions()
 
-            result = self._reader_storages[metric_reader].collect()
+        default_timeout_ns = 10000 * 1e6
 
-        return result
+        for async_instrument in self._async_instruments:
+            remaining_time = deadline_ns - time_ns()
+
+            if remaining_time < default_timeout_ns:
+                callback_options = CallbackOptions(timeout_millis=remaining_time / 1e6)
+
+            measurements = async_instrument.callback(callback_options)
+            if time_ns() >= deadline_ns:
+                raise MetricsTimeoutError("Timed out while executing callback")
+
+            yield from measurements
+
+    def _run_callbacks_concurrently(self, deadline_ns: float) -> list[Measurement]:
+        """Runs the callbacks in the thread pool and returns their
+        measurements, in the order the callbacks were registered.
+
+        A callback that does not return within the callback timeout, counted
+        from when it starts running, is abandoned and its measurements are
+        dropped.
+        """
+        executor = cast(ThreadPoolExecutor, self._callback_executor)
+        timeout_ns = self._callback_timeout_ns
+        futures: dict[Future, _AsynchronousCallback] = {}
+        started_ns: dict[_AsynchronousCallback, int] = {}
+
+        def run_callback(
+            async_instrument: _AsynchronousCallback, callback_options: CallbackOptions
+        ) -> list[Measurement]:
+            started_ns[async_instrument] = time_ns()
+            return list(async_instrument.callback(callback_options))
+
+        for async_instrument in self._async_instruments:
+            running = self._running_callbacks.get(async_instrument)
+            if running is not None:
+                if not running.done():
+                    self._skipped_callbacks += 1
+                    continue
+                del self._running_callbacks[async_instrument]
+
+            timeout_millis = (deadline_ns - time_ns()) / 1e6
+            if timeout_ns is not None:
+                timeout_millis = min(timeout_millis, timeout_ns / 1e6)
+            future = executor.submit(run_callback, async_instrument, CallbackOptions(timeout_millis=timeout_millis))
+            futures[future] = async_instrument
+
+        pending = set(futures)
+        timed_out: list[Future] = []
+        while pending:
+            now_ns = time_ns()
+            if now_ns >= deadline_ns:
+                break
+            wake_up_ns = deadline_ns
+            if timeout_ns is not None:
+                for future in list(pending):
+                    start_ns = started_ns.get(futures[future])
+                    if start_ns is None:
+                        continue
+                    if now_ns - start_ns >= timeout_ns:
+                        pending.remove(future)
+                        timed_out.append(future)
+                    else:
+                        wake_up_ns = min(wake_up_ns, start_ns + timeout_ns)
+                if not pending:
+                    break
+            _, pending = wait(pending, timeout=(wake_up_ns - now_ns) / 1e9, return_when=FIRST_COMPLETED)
+
+        abandoned = [future for future in timed_out if not future.done()]
+        if pending:
+            for future in pending:
+                if future.done():
+                    continue
+                if future.cancel():
+                    self._skipped_callbacks += 1
+                else:
+                    abandoned.append(future)
+        for future in abandoned:
+            self._timed_out_callbacks += 1
+            self._running_callbacks[futures[future]] = future
+            _logger.warning("Callback for %s timed out, its measurements are dropped.", futures[future].name)
+        if pending:
+            raise MetricsTimeoutError("Timed out while executing callback")
+
+        measurements: list[Measurement] = []
+        for future in futures:
+            if future not in abandoned:
+                measurements.extend(future.result())
+        return measurements
+
+    def shutdown(self) -> None:
+        """Stops the thread pool that runs the callbacks, callbacks that are
+        still running are not waited for."""
+        with self._lock:
+            if self._callback_executor is not None:
+                self._callback_executor.shutdown(wait=False, cancel_futures=True)
+                # Later collections run the callbacks sequentially.
+                self._callback_executor = None
+
+    def _with_metric_reader(
+        self, metric_reader: "opentelemetry.sdk.metrics.MetricReader"
+    ) -> tuple[
+        dict["opentelemetry.sdk.metrics.MetricReader", MetricReaderStorage],
+        tuple[MetricReaderStorage, ...],
+    ]:
+        """Returns new reader storages with the given reader added."""
+        # pylint: disable=protected-access
+        reader_storages = dict(self._reader_storages)
+        for storage in self._reader_storages.values():
+            if _equivalent_configuration(
+                storage,
+                metric_reader._instrument_class_temporality,
+                metric_reader._instrument_class_aggregation,
+            ):
+                storage._add_reader(metric_reader)
+                reader_storages[metric_reader] = storage
+                return reader_storages, self._storages
+
+        storage = MetricReaderStorage(
+            self._sdk_config,
+            metric_reader._instrument_class_temporality,
+            metric_reader._instrument_class_aggregation,
+            metric_reader,
+        )
+        reader_storages[metric_reader] = storage
+        return reader_storages, self._storages + (storage,)
 
     def add_metric_reader(self, metric_reader: "opentelemetry.sdk.metrics.MetricReader") -> None:
         """Registers a new metric reader."""
-        # Build a new mapping and swap it in atomically so that
+        # Build new mappings and swap them in atomically so that
         # a concurrent consume_measurement never iterates a mapping
         # that is being mutated in place.
         with self._lock:
-            new_reader_storages = dict(self._reader_storages)
-            new_reader_storages[metric_reader] = MetricReaderStorage(
-                self._sdk_config,
-                # pylint: disable-next=protected-access
-                metric_reader._instrument_class_temporality,
-                # pylint: disable-next=protected-access
-                metric_reader._instrument_class_aggregation,
-            )
-            self._reader_storages = new_reader_storages
+            self._reader_storages, self._storages = self._with_metric_reader(metric_reader)
 
     def remove_metric_reader(self, metric_reader: "opentelemetry.sdk.metrics.MetricReader") -> None:
         """Unregisters the given metric reader."""
         # Mutate using copy-on-write: see add_metric_reader.
         with self._lock:
             new_reader_storages = dict(self._reader_storages)
-            new_reader_storages.pop(metric_reader)
+            storage = new_reader_storages.pop(metric_reader)
+            if any(other_storage is storage for other_storage in new_reader_storages.values()):
+                # pylint: disable-next=protected-access
+                storage._remove_reader(metric_reader)
+            else:
+                self._storages = tuple(
+                    other_storage for other_storage in self._storages if other_storage is not storage
+                )
             self._reader_storages = new_reader_storages
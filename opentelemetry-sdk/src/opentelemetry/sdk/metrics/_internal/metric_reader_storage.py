@@ -1,10 +1,14 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+from collections.abc import Callable, Iterable, Iterator
+from functools import partial
 from logging import getLogger
 from threading import RLock
 from time import time_ns
 
+# This kind of import is needed to avoid Sphinx errors.
+import opentelemetry.sdk.metrics
 from opentelemetry.metrics import (
     Asynchronous,
     Counter,
@@ -17,7 +21,6 @@ from opentelemetry.sdk.metrics._internal.aggregation import (
     Aggregation,
     AggregationTemporality,
     ExplicitBucketHistogramAggregation,
-    _DropAggregation,
     _ExplicitBucketHistogramAggregation,
     _ExponentialBucketHistogramAggregation,
     _LastValueAggregation,
@@ -26,6 +29,7 @@ from opentelemetry.sdk.metrics._internal.aggregation import (
 from opentelemetry.sdk.metrics._internal.instrument import _Instrument
 from opentelemetry.sdk.metrics._internal.measurement import Measurement
 from opentelemetry.sdk.metrics._internal.point import (
+    DataT,
     ExponentialHistogram,
     Gauge,
     Histogram,
@@ -38,7 +42,7 @@ from opentelemetry.sdk.metrics._internal.point import (
 from opentelemetry.sdk.metrics._internal.sdk_configuration import (
     SdkConfiguration,
 )
-from opentelemetry.sdk.metrics._internal.view import View
+from opentelemetry.sdk.metrics._internal.view import View, _ViewIndex
 from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 
 _logger = getLogger(__name__)
@@ -46,24 +50,84 @@ _logger = getLogger(__name__)
 _DEFAULT_VIEW = View(instrument_name="")
 
 
+def _equivalent_configuration(
+    metric_reader_storage: "MetricReaderStorage",
+    instrument_class_temporality: dict[type, AggregationTemporality],
+    instrument_class_aggregation: dict[type, Aggregation],
+) -> bool:
+    """Returns whether a reader with the given configuration can share the
+    storage."""
+    # pylint: disable=protected-access
+    storage_instrument_class_aggregation = metric_reader_storage._instrument_class_aggregation
+    return (
+        metric_reader_storage._instrument_class_temporality == instrument_class_temporality
+        and storage_instrument_class_aggregation.keys() == instrument_class_aggregation.keys()
+        and all(
+            type(aggregation) is type(storage_instrument_class_aggregation[instrument_class])
+            and vars(aggregation) == vars(storage_instrument_class_aggregation[instrument_class])
+            for instrument_class, aggregation in instrument_class_aggregation.items()
+        )
+    )
+
+
+def _data_builder(
+    view_instrument_match: _ViewInstrumentMatch,
+    aggregation_temporality: AggregationTemporality,
+) -> Callable[..., DataT] | None:
+    """Returns the callable that builds the metric data from the data points
+    of a stream, or None if the stream is not exported."""
+    # pylint: disable=protected-access
+    aggregation = view_instrument_match._aggregation
+
+    if isinstance(aggregation, _SumAggregation):
+        return partial(
+            Sum,
+            aggregation_temporality=aggregation_temporality,
+            is_monotonic=isinstance(view_instrument_match._instrument, (Counter, ObservableCounter)),
+        )
+    if isinstance(aggregation, _LastValueAggregation):
+        return Gauge
+    if isinstance(aggregation, _ExplicitBucketHistogramAggregation):
+        return partial(Histogram, aggregation_temporality=aggregation_temporality)
+    if isinstance(aggregation, _ExponentialBucketHistogramAggregation):
+        return partial(ExponentialHistogram, aggregation_temporality=aggregation_temporality)
+    return None
+
+
 class MetricReaderStorage:
-    """The SDK's storage for a given reader"""
+    """The SDK's storage for the readers with a given configuration
+
+    Readers whose temporality and aggregation configuration are equivalent
+    share a storage, so that measurements are aggregated once for all of
+    them. Each stream keeps the data points collected by a reader for the
+    other readers until they collect them.
+    """
 
     def __init__(
         self,
         sdk_config: SdkConfiguration,
         instrument_class_temporality: dict[type, AggregationTemporality],
         instrument_class_aggregation: dict[type, Aggregation],
+        metric_reader: "opentelemetry.sdk.metrics.export.MetricReader | None" = None,
     ) -> None:
         self._lock = RLock()
         self._sdk_config = sdk_config
         self._instrument_view_instrument_matches: dict[_Instrument, list[_ViewInstrumentMatch]] = {}
+        self._readers = [metric_reader]
+        # The point type of a stream is found once, instead of on every
+        # collection.
+        self._data_builders: dict[_ViewInstrumentMatch, Callable[..., DataT] | None] = {}
         self._instrument_class_temporality = instrument_class_temporality
         self._instrument_class_aggregation = instrument_class_aggregation
+        # Built on the first instrument, the views are matched with the index
+        # instead of trying every view.
+        self._view_index: _ViewIndex | None = None
+        # The streams by name, to find conflicting streams.
+        self._named_view_instrument_matches: dict[str, list[_ViewInstrumentMatch]] = {}
 
     def _get_or_init_view_instrument_match(self, instrument: _Instrument) -> list[_ViewInstrumentMatch]:
         # Optimistically get the relevant views for the given instrument. Once set for a given
-        # instrument, the mapping will never change
+        # instrument, the mapping will only change when readers are added or removed
 
         if instrument in self._instrument_view_instrument_matches:
             return self._instrument_view_instrument_matches[instrument]
@@ -80,158 +144,201 @@ class MetricReaderStorage:
 
             # if no view targeted the instrument, use the default
             if not view_instrument_matches:
-                view_instrument_matches.append(
-                    _ViewInstrumentMatch(
-                        view=_DEFAULT_VIEW,
-                        instrument=instrument,
-                        instrument_class_aggregation=(self._instrument_class_aggregation),
-                    )
+                view_instrument_matches.append(self._new_view_instrument_match(_DEFAULT_VIEW, instrument))
+
+            for view_instrument_match in view_instrument_matches:
+                # pylint: disable=protected-access
+                self._named_view_instrument_matches.setdefault(view_instrument_match._name, []).append(
+                    view_instrument_match
                 )
             self._instrument_view_instrument_matches[instrument] = view_instrument_matches
 
             return view_instrument_matches
 
+    def _new_view_instrument_match(self, view: View, instrument: _Instrument) -> _ViewInstrumentMatch:
+        return _ViewInstrumentMatch(
+            view=view,
+            instrument=instrument,
+            instrument_class_aggregation=(self._instrument_class_aggregation),
+            idle_series_ttl_millis=self._sdk_config.idle_series_ttl_millis,
+            metric_readers=self._readers,
+        )
+
+    def _add_reader(self, metric_reader: "opentelemetry.sdk.metrics.export.MetricReader") -> None:
+        """Shares the storage with another reader with the same configuration.
+
+        The new reader collects the measurements aggregated after its
+        addition, and the cumulative streams aggregated so far.
+        """
+        # pylint: disable=protected-access
+        with self._lock:
+            self._readers.append(metric_reader)
+            for view_instrument_matches in self._instrument_view_instrument_matches.values():
+                for view_instrument_match in view_instrument_matches:
+                    view_instrument_match._add_reader(metric_reader)
+
+    def _remove_reader(self, metric_reader: "opentelemetry.sdk.metrics.export.MetricReader") -> None:
+        # Only the cursors of the reader are removed. The streams, and the
+        # maps that reference them like _named_view_instrument_matches and
+        # _data_builders, are shared by the remaining readers.
+        # pylint: disable=protected-access
+        with self._lock:
+            self._readers.remove(metric_reader)
+            for view_instrument_matches in self._instrument_view_instrument_matches.values():
+                for view_instrument_match in view_instrument_matches:
+                    view_instrument_match._remove_reader(metric_reader)
+
+    @property
+    def evicted_series(self) -> int:
+        """The number of idle metric streams that have been evicted."""
+        # pylint: disable=protected-access
+        return sum(
+            view_instrument_match._evicted_series
+            for view_instrument_matches in list(self._instrument_view_instrument_matches.values())
+            for view_instrument_match in view_instrument_matches
+        )
+
     def consume_measurement(self, measurement: Measurement, should_sample_exemplar: bool = True) -> None:
         for view_instrument_match in self._get_or_init_view_instrument_match(measurement.instrument):
             view_instrument_match.consume_measurement(measurement, should_sample_exemplar)
 
-    def collect(self) -> MetricsData | None:
-        # Use a list instead of yielding to prevent a slow reader from holding
-        # SDK locks
+    def collect(
+        self, metric_reader: "opentelemetry.sdk.metrics.export.MetricReader | None" = None
+    ) -> MetricsData | None:
+        return self._metrics_data(self._collect_metrics(metric_reader))
 
-        # While holding the lock, new _ViewInstrumentMatch can't be added from
-        # another thread (so we are sure we collect all existing view).
-        # However, instruments can still send measurements that will make it
-        # into the individual aggregations; collection will acquire those locks
-        # iteratively to keep locking as fine-grained as possible. One side
-        # effect is that end times can be slightly skewed among the metric
-        # streams produced by the SDK, but we still align the output timestamps
-        # for a single instrument.
+    def collect_chunks(
+        self,
+        metric_reader: "opentelemetry.sdk.metrics.export.MetricReader | None" = None,
+        max_metrics_per_chunk: int = 1000,
+    ) -> Iterator[MetricsData]:
+        """Collects the metrics in chunks of at most ``max_metrics_per_chunk``
+        metrics.
+
+        Each chunk is collected when the previous one has been consumed, so
+        that the caller can start exporting metrics before all of them are
+        collected. All the chunks share the same collection time.
+        """
+        if max_metrics_per_chunk <= 0:
+            raise ValueError("max_metrics_per_chunk must be a positive integer")
+
+        chunk: list[tuple[InstrumentationScope, Metric]] = []
+        for scope_metric in self._collect_metrics(metric_reader):
+            chunk.append(scope_metric)
+            if len(chunk) == max_metrics_per_chunk:
+                yield self._metrics_data(chunk)
+                chunk = []
+        if chunk:
+            yield self._metrics_data(chunk)
+
+    def _collect_metrics(
+        self, metric_reader: "opentelemetry.sdk.metrics.export.MetricReader | None"
+    ) -> Iterator[tuple[InstrumentationScope, Metric]]:
+        # The streams are snapshotted while holding the lock, so that new
+        # _ViewInstrumentMatch can't be added from another thread while the
+        # snapshot is taken (so we are sure we collect all existing views).
+        # The lock is not held while the streams are collected, so that a
+        # slow consumer of the metrics does not hold SDK locks. Instruments
+        # can still send measurements that will make it into the individual
+        # aggregations; collection will acquire those locks iteratively to
+        # keep locking as fine-grained as possible. One side effect is that
+        # end times can be slightly skewed among the metric streams produced
+        # by the SDK, but we still align the output timestamps for a single
+        # instrument.
 
         collection_start_nanos = time_ns()
 
         with self._lock:
-            instrumentation_scope_scope_metrics: dict[InstrumentationScope, ScopeMetrics] = {}
-
+            if metric_reader is None:
+                metric_reader = self._readers[0]
             instrument_matches_snapshot = list(self._instrument_view_instrument_matches.items())
 
-            for (
-                instrument,
-                view_instrument_matches,
-            ) in instrument_matches_snapshot:
-                aggregation_temporality = self._instrument_class_temporality[instrument.__class__]
+        for (
+            instrument,
+            view_instrument_matches,
+        ) in instrument_matches_snapshot:
+            aggregation_temporality = self._instrument_class_temporality[instrument.__class__]
 
-                metrics: list[Metric] = []
+            for view_instrument_match in view_instrument_matches:
+                data_points = view_instrument_match.collect(
+                    aggregation_temporality, collection_start_nanos, metric_reader
+                )
 
-                for view_instrument_match in view_instrument_matches:
-                    data_points = view_instrument_match.collect(aggregation_temporality, collection_start_nanos)
+                if data_points is None:
+                    continue
 
-                    if data_points is None:
-                        continue
+                try:
+                    data_builder = self._data_builders[view_instrument_match]
+                except KeyError:
+                    data_builder = self._data_builders.setdefault(
+                        view_instrument_match,
+                        _data_builder(view_instrument_match, aggregation_temporality),
+                    )
 
-                    if isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _SumAggregation,
-                    ):
-                        data = Sum(
-                            aggregation_temporality=aggregation_temporality,
-                            data_points=data_points,
-                            is_monotonic=isinstance(instrument, (Counter, ObservableCounter)),
-                        )
-                    elif isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _LastValueAggregation,
-                    ):
-                        data = Gauge(data_points=data_points)
-                    elif isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _ExplicitBucketHistogramAggregation,
-                    ):
-                        data = Histogram(
-                            data_points=data_points,
-                            aggregation_temporality=aggregation_temporality,
-                        )
-                    elif isinstance(
-                        # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _DropAggregation,
-                    ):
-                        continue
+                if data_builder is None:
+                    continue
 
-                    elif isinstance(
+                yield (
+                    instrument.instrumentation_scope,
+                    Metric(
                         # pylint: disable=protected-access
-                        view_instrument_match._aggregation,
-                        _ExponentialBucketHistogramAggregation,
-                    ):
-                        data = ExponentialHistogram(
-                            data_points=data_points,
-                            aggregation_temporality=aggregation_temporality,
-                        )
-
-                    metrics.append(
-                        Metric(
-                            # pylint: disable=protected-access
-                            # pylint: disable=possibly-used-before-assignment
-                            name=view_instrument_match._name,
-                            description=view_instrument_match._description,
-                            unit=view_instrument_match._instrument.unit,
-                            data=data,
-                        )
-                    )
+                        name=view_instrument_match._name,
+                        description=view_instrument_match._description,
+                        unit=view_instrument_match._instrument.unit,
+                        data=data_builder(data_points=data_points),
+                    ),
+                )
+
+    def _metrics_data(self, scope_metrics: Iterable[tuple[InstrumentationScope, Metric]]) -> MetricsData | None:
+        instrumentation_scope_scope_metrics: dict[InstrumentationScope, ScopeMetrics] = {}
 
-                if metrics:
-                    if instrument.instrumentation_scope not in (instrumentation_scope_scope_metrics):
-                        instrumentation_scope_scope_metrics[instrument.instrumentation_scope] = ScopeMetrics(
-                            scope=instrument.instrumentation_scope,
-                            metrics=metrics,
-                            schema_url=instrument.instrumentation_scope.schema_url,
-                        )
-                    else:
-                        instrumentation_scope_scope_metrics[instrument.instrumentation_scope].metrics.extend(metrics)
-
-            if instrumentation_scope_scope_metrics:
-                return MetricsData(
-                    resource_metrics=[
-                        ResourceMetrics(
-                            resource=self._sdk_config.resource,
-                            scope_metrics=list(instrumentation_scope_scope_metrics.values()),
-                            schema_url=self._sdk_config.resource.schema_url,
-                        )
-                    ]
+        for instrumentation_scope, metric in scope_metrics:
+            if instrumentation_scope not in instrumentation_scope_scope_metrics:
+                instrumentation_scope_scope_metrics[instrumentation_scope] = ScopeMetrics(
+                    scope=instrumentation_scope,
+                    metrics=[metric],
+                    schema_url=instrumentation_scope.schema_url,
                 )
+            else:
+                instrumentation_scope_scope_metrics[instrumentation_scope].metrics.append(metric)
+
+        if instrumentation_scope_scope_metrics:
+            return MetricsData(
+                resource_metrics=[
+                    ResourceMetrics(
+                        resource=self._sdk_config.resource,
+                        scope_metrics=list(instrumentation_scope_scope_metrics.values()),
+                        schema_url=self._sdk_config.resource.schema_url,
+                    )
+                ]
+            )
 
-            return None
+        return None
 
     def _handle_view_instrument_match(
         self,
         instrument: _Instrument,
         view_instrument_matches: list["_ViewInstrumentMatch"],
     ) -> None:
-        for view in self._sdk_config.views:
-            # pylint: disable=protected-access
-            if not view._match(instrument):
-                continue
+        if self._view_index is None:
+            self._view_index = _ViewIndex(self._sdk_config.views)
 
+        for view in self._view_index.match(instrument):
             if not self._check_view_instrument_compatibility(view, instrument):
                 continue
 
-            new_view_instrument_match = _ViewInstrumentMatch(
-                view=view,
-                instrument=instrument,
-                instrument_class_aggregation=(self._instrument_class_aggregation),
-            )
+            new_view_instrument_match = self._new_view_instrument_match(view, instrument)
 
-            for existing_view_instrument_matches in self._instrument_view_instrument_matches.values():
-                for existing_view_instrument_match in existing_view_instrument_matches:
-                    if existing_view_instrument_match.conflicts(new_view_instrument_match):
-                        _logger.warning(
-                            "Views %s and %s will cause conflicting metrics identities",
-                            existing_view_instrument_match._view,
-                            new_view_instrument_match._view,
-                        )
+            # pylint: disable=protected-access
+            for existing_view_instrument_match in self._named_view_instrument_matches.get(
+                new_view_instrument_match._name, ()
+            ):
+                if existing_view_instrument_match.conflicts(new_view_instrument_match):
+                    _logger.warning(
+                        "Views %s and %s will cause conflicting metrics identities",
+                        existing_view_instrument_match._view,
+                        new_view_instrument_match._view,
+                    )
 
             view_instrument_matches.append(new_view_instrument_match)
 
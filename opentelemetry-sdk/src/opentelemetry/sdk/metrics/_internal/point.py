@@ -15,7 +15,7 @@ from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 from opentelemetry.util.types import Attributes
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NumberDataPoint:
     """Single data point in a timeseries that describes the time-varying scalar
     value of a metric.
@@ -31,7 +31,7 @@ class NumberDataPoint:
         return dumps(asdict(self), indent=indent)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HistogramDataPoint:
     """Single data point in a timeseries that describes the time-varying scalar
     value of a metric.
@@ -52,13 +52,13 @@ class HistogramDataPoint:
         return dumps(asdict(self), indent=indent)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Buckets:
     offset: int
     bucket_counts: Sequence[int]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExponentialHistogramDataPoint:
     """Single data point in a timeseries whose boundaries are defined by an
     exponential function. This timeseries describes the time-varying scalar
@@ -83,7 +83,7 @@ class ExponentialHistogramDataPoint:
         return dumps(asdict(self), indent=indent)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExponentialHistogram:
     """Represents the type of a metric that is calculated by aggregating as an
     ExponentialHistogram of all reported measurements over a time interval.
@@ -102,7 +102,7 @@ class ExponentialHistogram:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sum:
     """Represents the type of a scalar metric that is calculated as a sum of
     all reported measurements over a time interval."""
@@ -122,7 +122,7 @@ class Sum:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Gauge:
     """Represents the type of a scalar metric that always exports the current
     value for every data point. It should be used for an unknown
@@ -139,7 +139,7 @@ class Gauge:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Histogram:
     """Represents the type of a metric that is calculated by aggregating as a
     histogram of all reported measurements over a time interval."""
@@ -162,7 +162,7 @@ DataT = Sum | Gauge | Histogram | ExponentialHistogram
 DataPointT = NumberDataPoint | HistogramDataPoint | ExponentialHistogramDataPoint
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Metric:
     """Represents a metric point in the OpenTelemetry data model to be
     exported."""
@@ -184,7 +184,7 @@ class Metric:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScopeMetrics:
     """A collection of Metrics produced by a scope"""
 
@@ -203,7 +203,7 @@ class ScopeMetrics:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResourceMetrics:
     """A collection of ScopeMetrics from a Resource"""
 
@@ -222,7 +222,7 @@ class ResourceMetrics:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MetricsData:
     """An array of ResourceMetrics"""
 
@@ -16,3 +16,4 @@ class SdkConfiguration:
     exemplar_filter: "opentelemetry.sdk.metrics.ExemplarFilter"
     resource: "opentelemetry.sdk.resources.Resource"
     views: Sequence["opentelemetry.sdk.metrics.view.View"]
+    idle_series_ttl_millis: float | None = None
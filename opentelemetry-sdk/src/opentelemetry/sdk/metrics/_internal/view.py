@@ -2,9 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 
-from collections.abc import Callable
-from fnmatch import fnmatch
+from collections.abc import Callable, Sequence
+from fnmatch import fnmatch, translate
 from logging import getLogger
+from os.path import normcase
+from re import compile as re_compile
 
 from opentelemetry.metrics import Instrument
 from opentelemetry.sdk.metrics._internal.aggregation import (
@@ -23,6 +25,8 @@ from opentelemetry.sdk.metrics._internal.instrument import _Instrument
 
 _logger = getLogger(__name__)
 
+_WILDCARD_CHARACTERS = frozenset("*?[")
+
 
 def _default_reservoir_factory(
     aggregation_type: type[_Aggregation],
@@ -166,3 +170,58 @@ class View:
                 return False
 
         return True
+
+
+class _ViewIndex:
+    """Finds the views matching an instrument without trying every view.
+
+    Views are indexed by their exact instrument name and views without an
+    instrument name by their instrument type. The patterns of the views with
+    a wildcard instrument name are compiled into a single regular expression,
+    so they are only tried one by one when one of them matches. The candidate
+    views are matched with `View._match` in the order they were registered.
+    """
+
+    def __init__(self, views: Sequence[View]) -> None:
+        self._views = tuple(views)
+        self._names: dict[str, list[int]] = {}
+        self._types: dict[type | None, list[int]] = {}
+        self._patterns = []
+        for position, view in enumerate(self._views):
+            # pylint: disable=protected-access
+            instrument_name = view._instrument_name
+            if instrument_name is None:
+                self._types.setdefault(view._instrument_type, []).append(position)
+            elif _WILDCARD_CHARACTERS.isdisjoint(instrument_name):
+                self._names.setdefault(normcase(instrument_name), []).append(position)
+            else:
+                self._patterns.append((position, re_compile(translate(normcase(instrument_name)))))
+        self._patterns_union = (
+            re_compile("|".join(f"(?:{pattern.pattern})" for _, pattern in self._patterns)) if self._patterns else None
+        )
+        # The positions of the views without an instrument name matching
+        # each instrument class.
+        self._class_positions: dict[type, list[int]] = {}
+
+    def match(self, instrument: _Instrument) -> list[View]:
+        """Returns the views matching the instrument, in registration order."""
+        positions = []
+        if self._names or self._patterns_union is not None:
+            name = normcase(instrument.name)
+            positions.extend(self._names.get(name, ()))
+            if self._patterns_union is not None and self._patterns_union.match(name):
+                positions.extend(position for position, pattern in self._patterns if pattern.match(name))
+
+        class_positions = self._class_positions.get(type(instrument))
+        if class_positions is None:
+            class_positions = self._class_positions[type(instrument)] = [
+                position
+                for instrument_type, type_positions in self._types.items()
+                if instrument_type is None or issubclass(type(instrument), instrument_type)
+                for position in type_positions
+            ]
+        positions.extend(class_positions)
+
+        positions.sort()
+        # pylint: disable=protected-access
+        return [self._views[position] for position in positions if self._views[position]._match(instrument)]
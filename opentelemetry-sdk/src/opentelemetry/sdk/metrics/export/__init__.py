@@ -13,6 +13,9 @@ from opentelemetry.sdk.metrics._internal.export import (
     MetricReader,
     PeriodicExportingMetricReader,
 )
+from opentelemetry.sdk.metrics._internal.export._delta_to_cumulative import (
+    DeltaToCumulativeMetricExporter,
+)
 
 # The point module is not in the export directory to avoid a circular import.
 from opentelemetry.sdk.metrics._internal.point import (  # noqa: F401
@@ -36,6 +39,7 @@ __all__ = [
     "AggregationTemporality",
     "Buckets",
     "ConsoleMetricExporter",
+    "DeltaToCumulativeMetricExporter",
     "InMemoryMetricReader",
     "MetricExporter",
     "MetricExportResult",
@@ -5,6 +5,8 @@
 import abc
 import atexit
 import concurrent.futures
+import functools
+import inspect
 import json
 import logging
 import os
@@ -14,7 +16,6 @@ import typing
 import weakref
 from collections.abc import (
     Callable,
-    Iterator,
     Mapping,
     MutableMapping,
     Sequence,
@@ -25,8 +26,8 @@ from time import time_ns
 from types import MappingProxyType, TracebackType
 from typing import (
     Any,
+    TypeVar,
 )
-from warnings import filterwarnings
 
 from typing_extensions import deprecated
 
@@ -35,6 +36,7 @@ from opentelemetry import metrics as metrics_api
 from opentelemetry import trace as trace_api
 from opentelemetry.attributes import BoundedAttributes
 from opentelemetry.sdk import util
+from opentelemetry.sdk._shared_internal import _QueueWorker
 from opentelemetry.sdk.environment_variables import (
     OTEL_ATTRIBUTE_COUNT_LIMIT,
     OTEL_ATTRIBUTE_VALUE_LENGTH_LIMIT,
@@ -62,6 +64,8 @@ from opentelemetry.sdk.util._configurator import RuleBasedConfigurator
 from opentelemetry.sdk.util.instrumentation import (
     InstrumentationInfo,
     InstrumentationScope,
+    _instrumentation_info,
+    _instrumentation_scope_key,
 )
 from opentelemetry.semconv.attributes.exception_attributes import (
     EXCEPTION_ESCAPED,
@@ -72,10 +76,11 @@ from opentelemetry.semconv.attributes.exception_attributes import (
 from opentelemetry.trace import NoOpTracer, SpanContext
 from opentelemetry.trace.status import Status, StatusCode
 from opentelemetry.util import types
-from opentelemetry.util._decorator import _agnosticcontextmanager
 
 logger = logging.getLogger(__name__)
 
+_FuncT = TypeVar("_FuncT", bound=Callable[..., Any])
+
 _DEFAULT_OTEL_ATTRIBUTE_COUNT_LIMIT = 128
 _DEFAULT_OTEL_SPAN_ATTRIBUTE_COUNT_LIMIT = 128
 _DEFAULT_OTEL_EVENT_ATTRIBUTE_COUNT_LIMIT = 128
@@ -148,6 +153,17 @@ class SpanProcessor:
         return True
 
 
+def _implements_hook(span_processor: SpanProcessor, hook: str) -> bool:
+    """Returns whether ``span_processor`` implements ``hook``, rather than
+    inheriting the no-op of `SpanProcessor`.
+
+    Hooks that are not implemented don't need to be called.
+    """
+    if hook in getattr(span_processor, "__dict__", ()):
+        return True
+    return getattr(type(span_processor), hook, None) is not getattr(SpanProcessor, hook)
+
+
 # Temporary fix until https://github.com/PyCQA/pylint/issues/4098 is resolved
 # pylint:disable=no-member
 class SynchronousMultiSpanProcessor(SpanProcessor):
@@ -164,28 +180,43 @@ class SynchronousMultiSpanProcessor(SpanProcessor):
         # use a tuple to avoid race conditions when adding a new span and
         # iterating through it on "on_start" and "on_end".
         self._span_processors = ()
+        # The span processors implementing each hook, computed when they are
+        # added so that spans skip the hooks that are no-ops.
+        self._on_start_span_processors: tuple[SpanProcessor, ...] = ()
+        self._on_ending_span_processors: tuple[SpanProcessor, ...] = ()
+        self._on_end_span_processors: tuple[SpanProcessor, ...] = ()
         self._lock = threading.Lock()
 
+    @property
+    def _has_on_end(self) -> bool:
+        return bool(self._on_end_span_processors)
+
     def add_span_processor(self, span_processor: SpanProcessor) -> None:
         """Adds a SpanProcessor to the list handled by this instance."""
         with self._lock:
             self._span_processors += (span_processor,)
+            if _implements_hook(span_processor, "on_start"):
+                self._on_start_span_processors += (span_processor,)
+            if _implements_hook(span_processor, "_on_ending"):
+                self._on_ending_span_processors += (span_processor,)
+            if _implements_hook(span_processor, "on_end"):
+                self._on_end_span_processors += (span_processor,)
 
     def on_start(
         self,
         span: "Span",
         parent_context: context_api.Context | None = None,
     ) -> None:
-        for sp in self._span_processors:
+        for sp in self._on_start_span_processors:
             sp.on_start(span, parent_context=parent_context)
 
     def _on_ending(self, span: "Span") -> None:
-        for sp in self._span_processors:
+        for sp in self._on_ending_span_processors:
             # pylint: disable=protected-access
             sp._on_ending(span)
 
     def on_end(self, span: "ReadableSpan") -> None:
-        for sp in self._span_processors:
+        for sp in self._on_end_span_processors:
             sp.on_end(span)
 
     def shutdown(self) -> None:
@@ -228,23 +259,50 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
     submitting them to a thread pool executor and waiting until each span
     processor finished its work.
 
+    With ``fire_and_forget``, ``on_end`` doesn't wait for the span processors:
+    ended spans are put in a bounded queue per span processor, drained by a
+    dedicated thread, and the caller returns immediately. When a queue is full
+    the oldest spans are dropped and counted in `dropped_spans`. Since they
+    may modify the span, ``on_start`` and ``_on_ending`` are still awaited but
+    called sequentially from the caller thread, which is cheaper than handing
+    them off to the thread pool executor.
+
     Args:
         num_threads: The number of threads managed by the thread pool executor
             and thus defining how many span processors can work in parallel.
+        fire_and_forget: Whether ``on_end`` returns without waiting for the
+            span processors.
+        max_queue_size: The maximum number of spans queued per span processor
+            when ``fire_and_forget`` is set.
     """
 
     _span_processors: tuple[SpanProcessor, ...]
+    _workers: tuple["_QueueWorker[ReadableSpan]", ...]
 
-    def __init__(self, num_threads: int = 2):
+    def __init__(
+        self,
+        num_threads: int = 2,
+        *,
+        fire_and_forget: bool = False,
+        max_queue_size: int = 2048,
+    ):
+        if max_queue_size <= 0:
+            raise ValueError("max_queue_size must be a positive integer.")
         # use a tuple to avoid race conditions when adding a new span and
         # iterating through it on "on_start" and "on_end".
         self._span_processors = ()
+        self._on_start_span_processors: tuple[SpanProcessor, ...] = ()
+        self._on_ending_span_processors: tuple[SpanProcessor, ...] = ()
+        self._on_end_span_processors: tuple[SpanProcessor, ...] = ()
+        self._workers = ()
+        self._fire_and_forget = fire_and_forget
+        self._max_queue_size = max_queue_size
         self._lock = threading.Lock()
         self._init_executor(num_threads)
         if hasattr(os, "register_at_fork"):
             # Only the main thread is kept in forked processed, the executor
-            # needs to be re-instantiated to get a fresh pool of threads:
-            weak_reinit = weakref.WeakMethod(self._init_executor)
+            # and the workers need to be re-instantiated to get fresh threads:
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
 
             def _after_in_child() -> None:
                 reinit = weak_reinit()
@@ -256,19 +314,56 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
     def _init_executor(self, num_threads: int) -> None:
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=num_threads)
 
+    def _at_fork_reinit(self, num_threads: int) -> None:
+        self._init_executor(num_threads)
+        for worker in self._workers:
+            worker._at_fork_reinit()  # pylint: disable=protected-access
+
+    @property
+    def dropped_spans(self) -> int:
+        """The number of spans dropped because a span processor queue was full."""
+        return sum(worker.dropped for worker in self._workers)
+
+    @property
+    def _has_on_end(self) -> bool:
+        return bool(self._on_end_span_processors)
+
     def add_span_processor(self, span_processor: SpanProcessor) -> None:
         """Adds a SpanProcessor to the list handled by this instance."""
         with self._lock:
             self._span_processors += (span_processor,)
+            if _implements_hook(span_processor, "on_start"):
+                self._on_start_span_processors += (span_processor,)
+            if _implements_hook(span_processor, "_on_ending"):
+                self._on_ending_span_processors += (span_processor,)
+            if _implements_hook(span_processor, "on_end"):
+                self._on_end_span_processors += (span_processor,)
+                if self._fire_and_forget:
+                    self._workers += (self._new_worker(span_processor),)
+
+    def _new_worker(self, span_processor: SpanProcessor) -> "_QueueWorker[ReadableSpan]":
+        def report_dropped(count: int) -> None:
+            logger.warning("Queue full, dropped %d spans for %s.", count, span_processor)
+
+        return _QueueWorker(
+            "OtelSpanProcessorWorker",
+            span_processor.on_end,
+            lambda _span: logger.exception("Exception while processing Span."),
+            report_dropped,
+            self._max_queue_size,
+        )
 
     def _submit_and_await(
         self,
         func: Callable[[SpanProcessor], Callable[..., None]],
         *args: Any,
+        span_processors: tuple[SpanProcessor, ...] | None = None,
         **kwargs: Any,
     ):
+        if span_processors is None:
+            span_processors = self._span_processors
         futures = []
-        for sp in self._span_processors:
+        for sp in span_processors:
             future = self._executor.submit(func(sp), *args, **kwargs)
             futures.append(future)
         for future in futures:
@@ -279,17 +374,46 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
         span: "Span",
         parent_context: context_api.Context | None = None,
     ) -> None:
-        self._submit_and_await(lambda sp: sp.on_start, span, parent_context=parent_context)
+        if self._fire_and_forget:
+            for sp in self._on_start_span_processors:
+                sp.on_start(span, parent_context=parent_context)
+            return
+        self._submit_and_await(
+            lambda sp: sp.on_start,
+            span,
+            span_processors=self._on_start_span_processors,
+            parent_context=parent_context,
+        )
 
     def _on_ending(self, span: "Span") -> None:
+        if self._fire_and_forget:
+            for sp in self._on_ending_span_processors:
+                # pylint: disable=protected-access
+                sp._on_ending(span)
+            return
         # pylint: disable=protected-access
-        self._submit_and_await(lambda sp: sp._on_ending, span)
+        self._submit_and_await(lambda sp: sp._on_ending, span, span_processors=self._on_ending_span_processors)
 
     def on_end(self, span: "ReadableSpan") -> None:
-        self._submit_and_await(lambda sp: sp.on_end, span)
+        if self._fire_and_forget:
+            for worker in self._workers:
+                worker.put(span)
+            return
+        self._submit_and_await(lambda sp: sp.on_end, span, span_processors=self._on_end_span_processors)
+
+    def _flush_workers(self, timeout_millis: float) -> bool:
+        deadline_ns = time_ns() + timeout_millis * 1000000
+        for worker in self._workers:
+            if not worker.flush(max(0, (deadline_ns - time_ns()) / 1000000)):
+                return False
+        return True
 
     def shutdown(self) -> None:
         """Shuts down all underlying span processors in parallel."""
+        # The workers share one deadline, like in _flush_workers.
+        deadline_ns = time_ns() + 30000 * 1000000
+        for worker in self._workers:
+            worker.shutdown(max(0, (deadline_ns - time_ns()) / 1000000))
         self._submit_and_await(lambda sp: sp.shutdown)
 
     def force_flush(self, timeout_millis: int = 30000) -> bool:
@@ -303,6 +427,10 @@ class ConcurrentMultiSpanProcessor(SpanProcessor):
             True if all span processors flushed their spans within the given
             timeout, False otherwise.
         """
+        deadline_ns = time_ns() + timeout_millis * 1000000
+        if not self._flush_workers(timeout_millis):
+            return False
+        timeout_millis = max(0, (deadline_ns - time_ns()) // 1000000)
         futures = []
         for sp in self._span_processors:
             future = self._executor.submit(sp.force_flush, timeout_millis)
@@ -959,9 +1087,12 @@ class Span(trace_api.Span, ReadableSpan):
 
         if self._record_end_metrics:
             self._record_end_metrics()
+        span_processor = self._span_processor
         # pylint: disable=protected-access
-        self._span_processor._on_ending(self)
-        self._span_processor.on_end(self._readable_span())
+        span_processor._on_ending(self)
+        # Only take the ReadableSpan snapshot if a span processor consumes it.
+        if getattr(span_processor, "_has_on_end", True):
+            span_processor.on_end(self._readable_span())
 
     @_check_span_ended
     def update_name(self, name: str) -> None:
@@ -1056,6 +1187,125 @@ class _TracerConfig:
         return cls(is_enabled=True)
 
 
+class _CurrentSpanContextManager:
+    """Context manager returned by `Tracer.start_as_current_span`.
+
+    Starts a span and makes it the current span on enter, like
+    `opentelemetry.trace.use_span` does, without the generator based context
+    managers. It can also decorate sync and async functions, a new span is then
+    started for each call.
+    """
+
+    __slots__ = (
+        "_tracer",
+        "_name",
+        "_context",
+        "_kind",
+        "_attributes",
+        "_links",
+        "_start_time",
+        "_record_exception",
+        "_set_status_on_exception",
+        "_end_on_exit",
+        "_span",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        context: context_api.Context | None,
+        kind: trace_api.SpanKind,
+        attributes: types.Attributes,
+        links: Sequence[trace_api.Link] | None,
+        start_time: int | None,
+        record_exception: bool,
+        set_status_on_exception: bool,
+        end_on_exit: bool,
+    ) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._context = context
+        self._kind = kind
+        self._attributes = attributes
+        self._links = links
+        self._start_time = start_time
+        self._record_exception = record_exception
+        self._set_status_on_exception = set_status_on_exception
+        self._end_on_exit = end_on_exit
+
+    def _recreate(self) -> "_CurrentSpanContextManager":
+        return _CurrentSpanContextManager(
+            self._tracer,
+            self._name,
+            self._context,
+            self._kind,
+            self._attributes,
+            self._links,
+            self._start_time,
+            self._record_exception,
+            self._set_status_on_exception,
+            self._end_on_exit,
+        )
+
+    def __enter__(self) -> trace_api.Span:
+        span = self._span = self._tracer.start_span(
+            name=self._name,
+            context=self._context,
+            kind=self._kind,
+            attributes=self._attributes,
+            links=self._links,
+            start_time=self._start_time,
+            record_exception=self._record_exception,
+            set_status_on_exception=self._set_status_on_exception,
+        )
+        self._token = context_api.attach(trace_api.set_span_in_context(span))
+        return span
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        span = self._span
+        try:
+            context_api.detach(self._token)
+            # Record only exceptions that inherit Exception class but not
+            # BaseException, see `opentelemetry.trace.use_span`.
+            if isinstance(exc_val, Exception) and span.is_recording():
+                if self._record_exception:
+                    span.record_exception(exc_val)
+                if self._set_status_on_exception:
+                    span.set_status(
+                        Status(
+                            status_code=StatusCode.ERROR,
+                            description=f"{type(exc_val).__name__}: {exc_val}",
+                        )
+                    )
+        finally:
+            if self._end_on_exit:
+                span.end()
+
+    def __call__(self, func: _FuncT) -> _FuncT:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                with self._recreate():
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with self._recreate():
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
 class Tracer(trace_api.Tracer):
     """See `opentelemetry.trace.Tracer`."""
 
@@ -1097,8 +1347,7 @@ class Tracer(trace_api.Tracer):
         """If the tracer is not enabled, start_span will create a NonRecordingSpan"""
         return self._tracer_config.is_enabled
 
-    @_agnosticcontextmanager  # pylint: disable=protected-access
-    def start_as_current_span(
+    def start_as_current_span(  # type: ignore[override]
         self,
         name: str,
         context: context_api.Context | None = None,
@@ -1109,24 +1358,19 @@ class Tracer(trace_api.Tracer):
         record_exception: bool = True,
         set_status_on_exception: bool = True,
         end_on_exit: bool = True,
-    ) -> Iterator[trace_api.Span]:
-        span = self.start_span(
-            name=name,
-            context=context,
-            kind=kind,
-            attributes=attributes,
-            links=links,
-            start_time=start_time,
-            record_exception=record_exception,
-            set_status_on_exception=set_status_on_exception,
+    ) -> "_CurrentSpanContextManager":
+        return _CurrentSpanContextManager(
+            self,
+            name,
+            context,
+            kind,
+            attributes,
+            links,
+            start_time,
+            record_exception,
+            set_status_on_exception,
+            end_on_exit,
         )
-        with trace_api.use_span(
-            span,
-            end_on_exit=end_on_exit,
-            record_exception=record_exception,
-            set_status_on_exception=set_status_on_exception,
-        ) as span:
-            yield span
 
     def start_span(  # pylint: disable=too-many-locals
         self,
@@ -1279,6 +1523,8 @@ class TracerProvider(trace_api.TracerProvider):
         self._tracer_configurator = _tracer_configurator or _default_tracer_configurator
         self._tracers_lock = threading.Lock()
         self._tracers: dict[InstrumentationScope, Tracer] = {}
+        # Tracers by get_tracer arguments, read without locking.
+        self._tracer_cache: dict[tuple[object, ...], Tracer] = {}
         if hasattr(os, "register_at_fork"):
             weak_at_fork = weakref.WeakMethod(self._handle_fork)
 
@@ -1340,18 +1586,16 @@ class TracerProvider(trace_api.TracerProvider):
         if instrumenting_library_version is None:
             instrumenting_library_version = ""
 
-        filterwarnings(
-            "ignore",
-            message=(r"You should use InstrumentationScope. Deprecated since version 1.11.1."),
-            category=DeprecationWarning,
-            module="opentelemetry.sdk.trace",
-        )
-
-        instrumentation_info = InstrumentationInfo(
+        key = _instrumentation_scope_key(
             instrumenting_module_name,
             instrumenting_library_version,
             schema_url,
+            attributes,
         )
+        if key is not None:
+            tracer = self._tracer_cache.get(key)
+            if tracer is not None:
+                return tracer
 
         instrumentation_scope = InstrumentationScope(
             instrumenting_module_name,
@@ -1362,7 +1606,16 @@ class TracerProvider(trace_api.TracerProvider):
 
         with self._tracers_lock:
             if instrumentation_scope in self._tracers:
-                return self._tracers[instrumentation_scope]
+                tracer = self._tracers[instrumentation_scope]
+                if key is not None:
+                    self._tracer_cache[key] = tracer
+                return tracer
+
+            instrumentation_info = _instrumentation_info(
+                instrumenting_module_name,
+                instrumenting_library_version,
+                schema_url,
+            )
 
             tracer_config = self._apply_tracer_configurator(instrumentation_scope)
             tracer = Tracer(
@@ -1377,6 +1630,8 @@ class TracerProvider(trace_api.TracerProvider):
                 _tracer_config=tracer_config,
             )
             self._tracers[instrumentation_scope] = tracer
+            if key is not None:
+                self._tracer_cache[key] = tracer
 
         return tracer
 
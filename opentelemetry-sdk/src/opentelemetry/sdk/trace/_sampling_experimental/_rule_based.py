@@ -4,8 +4,10 @@
 from __future__ import annotations
 
 import logging
+import re
+import threading
 from collections.abc import Sequence
-from fnmatch import fnmatchcase
+from fnmatch import translate
 from typing import Protocol
 
 from opentelemetry.context import Context
@@ -136,8 +138,8 @@ class AttributePatternsPredicate:
         excluded: Sequence[str] | None = None,
     ):
         self._key = key
-        self._included = tuple(included or ())
-        self._excluded = tuple(excluded or ())
+        self._included = _compile_patterns(included or ())
+        self._excluded = _compile_patterns(excluded or ())
 
     def __call__(
         self,
@@ -153,14 +155,40 @@ class AttributePatternsPredicate:
         return any(self._matches_value(str(value)) for value in _attribute_values(attributes[self._key]))
 
     def _matches_value(self, value: str) -> bool:
-        included = not self._included or any(fnmatchcase(value, pattern) for pattern in self._included)
-        excluded = any(fnmatchcase(value, pattern) for pattern in self._excluded)
-        return included and not excluded
+        if self._excluded is not None and self._excluded.match(value):
+            return False
+        return self._included is None or self._included.match(value) is not None
 
     def __str__(self) -> str:
         return f"{self._key} matches"
 
 
+class SpanNamePredicate:
+    """Matches the span name against exact names or glob patterns"""
+
+    def __init__(self, names: Sequence[str]):
+        self._names = tuple(names)
+        self._exact = frozenset(name for name in self._names if not _is_pattern(name))
+        self._patterns = _compile_patterns([name for name in self._names if _is_pattern(name)])
+
+    def __call__(
+        self,
+        parent_ctx: Context | None,
+        name: str,
+        span_kind: SpanKind | None,
+        attributes: Attributes,
+        links: Sequence[Link] | None,
+        trace_state: TraceState | None,
+    ) -> bool:
+        if name in self._exact:
+            return True
+        return self._patterns is not None and self._patterns.match(name) is not None
+
+    def __str__(self) -> str:
+        names = ",".join(self._names)
+        return f"name in [{names}]"
+
+
 class SpanKindPredicate:
     def __init__(self, span_kinds: Sequence[SpanKind]):
         self._span_kinds = frozenset(span_kinds)
@@ -181,6 +209,15 @@ class SpanKindPredicate:
         return f"span_kind in [{kinds}]"
 
 
+def _parent_kind(parent_ctx: Context | None) -> str:
+    parent_span_context = get_current_span(parent_ctx).get_span_context()
+    if not parent_span_context.is_valid:
+        return "none"
+    if parent_span_context.is_remote:
+        return "remote"
+    return "local"
+
+
 class ParentPredicate:
     def __init__(self, parents: Sequence[str]):
         self._parents = frozenset(parents)
@@ -194,20 +231,25 @@ class ParentPredicate:
         links: Sequence[Link] | None,
         trace_state: TraceState | None,
     ) -> bool:
-        parent_span_context = get_current_span(parent_ctx).get_span_context()
-        if not parent_span_context.is_valid:
-            parent = "none"
-        elif parent_span_context.is_remote:
-            parent = "remote"
-        else:
-            parent = "local"
-        return parent in self._parents
+        return _parent_kind(parent_ctx) in self._parents
 
     def __str__(self) -> str:
         parents = ",".join(self._parents)
         return f"parent in [{parents}]"
 
 
+def _is_pattern(value: str) -> bool:
+    return any(char in value for char in "*?[")
+
+
+def _compile_patterns(patterns: Sequence[str]) -> re.Pattern[str] | None:
+    # A single regex alternation is much cheaper than one fnmatchcase call
+    # per pattern. fnmatch.translate anchors each pattern at the end.
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{translate(pattern)})" for pattern in patterns))
+
+
 def _attribute_values(value):
     if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
         return value
@@ -219,11 +261,73 @@ RulesT = Sequence[tuple[PredicateT, ComposableSampler]]
 _non_sampling_intent = SamplingIntent(threshold=INVALID_THRESHOLD, threshold_reliable=False)
 
 
+_NO_MATCH = -1
+_MISSING = object()
+
+
+def _leaf_predicates(predicate: PredicateT) -> Sequence[PredicateT]:
+    if isinstance(predicate, AllPredicate):
+        return [leaf for child in predicate._predicates for leaf in _leaf_predicates(child)]
+    return [predicate]
+
+
 class _ComposableRuleBased(ComposableSampler):
-    def __init__(self, rules: RulesT):
+    def __init__(self, rules: RulesT, decision_cache_size: int = 1024):
         # work on an internal copy of the rules
         self._rules = list(rules)
 
+        # Rules are compiled into an index so that only rules which can
+        # possibly match a span name are evaluated: rules without a name
+        # predicate always apply, the others are looked up by exact name or
+        # through a single regex union of all their glob patterns.
+        self._unnamed_rules: list[int] = []
+        self._rules_by_name: dict[str, list[int]] = {}
+        self._rules_by_pattern: list[tuple[int, re.Pattern[str]]] = []
+        # Attribute keys a rule requires, so that it is skipped without being
+        # called when one of them is missing.
+        self._required_keys: list[tuple[str, ...]] = []
+        # Everything but span name, span kind, the parent and the attributes
+        # below is unknown to the cache, which is only used if all predicates
+        # are known.
+        self._attribute_keys: list[str] = []
+        self._uses_parent = False
+        cacheable = True
+
+        for index, (predicate, _) in enumerate(self._rules):
+            name_predicate = None
+            required_keys = []
+            for leaf in _leaf_predicates(predicate):
+                if isinstance(leaf, SpanNamePredicate):
+                    name_predicate = name_predicate or leaf
+                elif isinstance(leaf, (AttributeValuesPredicate, AttributePatternsPredicate)):
+                    required_keys.append(leaf._key)
+                elif isinstance(leaf, AttributePredicate):
+                    required_keys.append(leaf.key)
+                elif isinstance(leaf, ParentPredicate):
+                    self._uses_parent = True
+                elif not isinstance(leaf, (SpanKindPredicate, AlwaysMatchPredicate)):
+                    cacheable = False
+            for key in required_keys:
+                if key not in self._attribute_keys:
+                    self._attribute_keys.append(key)
+            self._required_keys.append(tuple(required_keys))
+
+            if name_predicate is None:
+                self._unnamed_rules.append(index)
+                continue
+            for name in name_predicate._exact:
+                self._rules_by_name.setdefault(name, []).append(index)
+            if name_predicate._patterns is not None:
+                self._rules_by_pattern.append((index, name_predicate._patterns))
+
+        self._patterns_union = None
+        if self._rules_by_pattern:
+            self._patterns_union = re.compile("|".join(pattern.pattern for _, pattern in self._rules_by_pattern))
+
+        self._decision_cache_size = decision_cache_size if cacheable else 0
+        self._decision_cache: dict[tuple, int] = {}
+        self._decision_cache_lock = threading.Lock()
+
     def sampling_intent(
         self,
         parent_ctx: Context | None,
@@ -233,8 +337,77 @@ class _ComposableRuleBased(ComposableSampler):
         links: Sequence[Link] | None,
         trace_state: TraceState | None = None,
     ) -> SamplingIntent:
-        for predicate, sampler in self._rules:
-            if predicate(
+        cache_key = self._cache_key(parent_ctx, name, span_kind, attributes)
+        index = self._decision_cache.get(cache_key) if cache_key is not None else None
+        if index is None:
+            index = self._match(parent_ctx, name, span_kind, attributes, links, trace_state)
+            if cache_key is not None:
+                with self._decision_cache_lock:
+                    if len(self._decision_cache) >= self._decision_cache_size:
+                        # Evict the oldest decision.
+                        del self._decision_cache[next(iter(self._decision_cache))]
+                    self._decision_cache[cache_key] = index
+
+        if index == _NO_MATCH:
+            return _non_sampling_intent
+        return self._rules[index][1].sampling_intent(
+            parent_ctx=parent_ctx,
+            name=name,
+            span_kind=span_kind,
+            attributes=attributes,
+            links=links,
+            trace_state=trace_state,
+        )
+
+    def _cache_key(
+        self,
+        parent_ctx: Context | None,
+        name: str,
+        span_kind: SpanKind | None,
+        attributes: Attributes,
+    ) -> tuple | None:
+        if not self._decision_cache_size:
+            return None
+        values = []
+        for key in self._attribute_keys:
+            value = attributes.get(key, _MISSING) if attributes else _MISSING
+            if value is not _MISSING:
+                # Values that are equal but of different types, like True, 1
+                # and 1.0, don't match the same predicates once stringified.
+                if isinstance(value, Sequence) and not isinstance(value, (str, bytes, bytearray)):
+                    value = (type(value), tuple((type(item), item) for item in value))
+                else:
+                    value = (type(value), value)
+            values.append(value)
+        parent = _parent_kind(parent_ctx) if self._uses_parent else None
+        cache_key = (name, span_kind, parent, *values)
+        try:
+            hash(cache_key)
+        except TypeError:
+            return None
+        return cache_key
+
+    def _match(
+        self,
+        parent_ctx: Context | None,
+        name: str,
+        span_kind: SpanKind | None,
+        attributes: Attributes,
+        links: Sequence[Link] | None,
+        trace_state: TraceState | None,
+    ) -> int:
+        candidates = self._unnamed_rules
+        named = self._rules_by_name.get(name)
+        if self._patterns_union is not None and self._patterns_union.match(name):
+            named = [*(named or ()), *(index for index, pattern in self._rules_by_pattern if pattern.match(name))]
+        if named:
+            candidates = sorted({*candidates, *named})
+
+        for index in candidates:
+            required_keys = self._required_keys[index]
+            if required_keys and (not attributes or any(key not in attributes for key in required_keys)):
+                continue
+            if self._rules[index][0](
                 parent_ctx=parent_ctx,
                 name=name,
                 span_kind=span_kind,
@@ -242,15 +415,8 @@ class _ComposableRuleBased(ComposableSampler):
                 links=links,
                 trace_state=trace_state,
             ):
-                return sampler.sampling_intent(
-                    parent_ctx=parent_ctx,
-                    name=name,
-                    span_kind=span_kind,
-                    attributes=attributes,
-                    links=links,
-                    trace_state=trace_state,
-                )
-        return _non_sampling_intent
+                return index
+        return _NO_MATCH
 
     def get_description(self) -> str:
         rules_str = ",".join(f"({predicate}:{sampler.get_description()})" for predicate, sampler in self._rules)
@@ -259,6 +425,7 @@ class _ComposableRuleBased(ComposableSampler):
 
 def composable_rule_based(
     rules: RulesT,
+    decision_cache_size: int = 1024,
 ) -> ComposableSampler:
     """Returns a consistent sampler that:
 
@@ -267,5 +434,8 @@ def composable_rule_based(
 
     Args:
         rules: A list of (Predicate, ComposableSampler) pairs, where Predicate is a function that evaluates whether a rule applies
+        decision_cache_size: The maximum number of matched rules to remember per span name, span kind, parent and the
+            attribute values the predicates look at. The cache is only used when all predicates are built-in ones,
+            0 disables it.
     """
-    return _ComposableRuleBased(rules)
+    return _ComposableRuleBased(rules, decision_cache_size)
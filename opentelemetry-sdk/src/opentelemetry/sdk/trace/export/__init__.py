@@ -11,7 +11,6 @@ from os import environ, linesep
 
 from opentelemetry.context import (
     _SUPPRESS_INSTRUMENTATION_KEY,
-    Context,
     attach,
     detach,
     set_value,
@@ -33,7 +32,7 @@ from opentelemetry.sdk.environment_variables import (
 from opentelemetry.sdk.environment_variables._internal import (
     parse_boolean_environment_variable,
 )
-from opentelemetry.sdk.trace import ReadableSpan, Span, SpanProcessor
+from opentelemetry.sdk.trace import ReadableSpan, SpanProcessor
 from opentelemetry.semconv._incubating.attributes.otel_attributes import (
     OtelComponentTypeValues,
 )
@@ -107,12 +106,6 @@ class SimpleSpanProcessor(SpanProcessor):
             enabled=parse_boolean_environment_variable(OTEL_PYTHON_SDK_INTERNAL_METRICS_ENABLED),
         )
 
-    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
-        pass
-
-    def _on_ending(self, span: Span) -> None:
-        pass
-
     def on_end(self, span: ReadableSpan) -> None:
         if not (span.context and span.context.trace_flags.sampled):
             return
@@ -203,12 +196,6 @@ class BatchSpanProcessor(SpanProcessor):
     def span_exporter(self):
         return self._batch_processor._exporter  # pylint: disable=protected-access
 
-    def on_start(self, span: Span, parent_context: Context | None = None) -> None:
-        pass
-
-    def _on_ending(self, span: Span) -> None:
-        pass
-
     def on_end(self, span: ReadableSpan) -> None:
         if not (span.context and span.context.trace_flags.sampled):
             return
@@ -2,7 +2,11 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import abc
+import array
+import os
 import random
+import threading
+import weakref
 
 from opentelemetry import trace
 
@@ -70,3 +74,65 @@ class RandomIdGenerator(IdGenerator):
 
     def is_trace_id_random(self) -> bool:
         return True
+
+
+class BufferedRandomIdGenerator(IdGenerator):
+    """An ID generator which randomly generates all bits when generating IDs,
+    slicing them out of a per thread buffer filled from `os.urandom`.
+
+    Unlike `RandomIdGenerator`, threads don't share the state of the global
+    `random` module, so IDs can be generated concurrently without contention
+    on free-threaded Python. With the GIL, `RandomIdGenerator` is usually
+    faster. The buffers are discarded in forked processes so that they never
+    reuse the IDs of their parent.
+
+    It can be selected by setting :envvar:`OTEL_PYTHON_ID_GENERATOR` to
+    ``buffered_random``.
+
+    Args:
+        buffer_size: The number of 64-bit random values read from `os.urandom`
+            every time the buffer of a thread is exhausted.
+    """
+
+    def __init__(self, buffer_size: int = 4096):
+        if buffer_size <= 0:
+            raise ValueError("buffer_size must be a positive integer.")
+        self._buffer_size = buffer_size
+        self._local = threading.local()
+        if hasattr(os, "register_at_fork"):
+            weak_reinit = weakref.WeakMethod(self._at_fork_reinit)
+
+            def _after_in_child() -> None:
+                reinit = weak_reinit()
+                if reinit is not None:
+                    reinit()
+
+            os.register_at_fork(after_in_child=_after_in_child)
+
+    def _at_fork_reinit(self) -> None:
+        self._local = threading.local()
+
+    def _getrandbits64(self) -> int:
+        try:
+            return self._local.next_random()
+        except (AttributeError, StopIteration):
+            buffer = array.array("Q")
+            buffer.frombytes(os.urandom(buffer.itemsize * self._buffer_size))
+            self._local.next_random = iter(buffer).__next__
+            return self._local.next_random()
+
+    def generate_span_id(self) -> int:
+        span_id = self._getrandbits64()
+        while span_id == trace.INVALID_SPAN_ID:
+            span_id = self._getrandbits64()
+        return span_id
+
+    def generate_trace_id(self) -> int:
+        getrandbits64 = self._getrandbits64
+        trace_id = getrandbits64() << 64 | getrandbits64()
+        while trace_id == trace.INVALID_TRACE_ID:
+            trace_id = getrandbits64() << 64 | getrandbits64()
+        return trace_id
+
+    def is_trace_id_random(self) -> bool:
+        return True
@@ -48,6 +48,16 @@ class BoundedList(Sequence):
             copy_._dq = copy.deepcopy(self._dq, memo)
         return copy_
 
+    def __getstate__(self):
+        # Locks can't be pickled, a fresh one is created on unpickling.
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
     def __repr__(self):
         return f"{type(self).__name__}({list(self._dq)}, maxlen={self._dq.maxlen})"
 
@@ -1,5 +1,7 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
+from __future__ import annotations
+
 import fnmatch
 from collections.abc import Callable
 from json import dumps
@@ -71,6 +73,21 @@ class InstrumentationInfo:
         return self._name
 
 
+def _instrumentation_info(
+    name: str,
+    version: str | None = None,
+    schema_url: str | None = None,
+) -> InstrumentationInfo:
+    """Creates an `InstrumentationInfo` for the tracers that still expose one,
+    without the deprecation warning, so no warning filter has to be installed
+    for every new tracer."""
+    instrumentation_info = InstrumentationInfo.__new__(InstrumentationInfo)
+    InstrumentationInfo.__init__.__wrapped__(  # type: ignore[attr-defined] # pylint: disable=no-member
+        instrumentation_info, name, version, schema_url
+    )
+    return instrumentation_info
+
+
 class InstrumentationScope:
     """A logical unit of the application code with which the emitted telemetry can be
     associated.
@@ -159,6 +176,23 @@ class InstrumentationScope:
         )
 
 
+def _instrumentation_scope_key(
+    name: str,
+    version: str | None,
+    schema_url: str | None,
+    attributes: _ExtendedAttributes | None,
+) -> tuple[object, ...] | None:
+    """Returns a key identifying the `InstrumentationScope` created from these
+    arguments without creating it, None if the attributes are not hashable.
+    """
+    if not attributes:
+        return (name, version, schema_url, None)
+    try:
+        return (name, version, schema_url, frozenset(attributes.items()))
+    except TypeError:
+        return None
+
+
 _InstrumentationScopePredicateT = Callable[[InstrumentationScope], bool]
 
 
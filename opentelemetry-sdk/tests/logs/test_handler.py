@@ -1,8 +1,10 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import io
 import logging
 import os
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
@@ -16,6 +18,11 @@ from opentelemetry.sdk._logs import (
     LogRecordProcessor,
     ReadableLogRecord,
 )
+from opentelemetry.sdk._logs._internal import _LoggerConfig
+from opentelemetry.sdk._logs.export import (
+    ConsoleLogRecordExporter,
+    SimpleLogRecordProcessor,
+)
 from opentelemetry.sdk.environment_variables import OTEL_ATTRIBUTE_COUNT_LIMIT
 from opentelemetry.semconv.attributes import (
     code_attributes,
@@ -99,6 +106,23 @@ class TestLoggingHandler(unittest.TestCase):
 
         logger.removeHandler(handler)
 
+    def test_loggers_are_cached_per_name(self):
+        logger_provider = Mock(wraps=LoggerProvider())
+        handler = LoggingHandler(logger_provider=logger_provider)
+        for name in ("foo", "bar", "foo"):
+            handler.handle(logging.makeLogRecord({"name": name, "levelno": logging.WARNING}))
+
+        self.assertEqual(
+            [call.args[0] for call in logger_provider.get_logger.call_args_list],
+            ["foo", "bar"],
+        )
+
+    def test_noop_loggers_are_cached_per_name(self):
+        handler = LoggingHandler(logger_provider=NoOpLoggerProvider())
+        handler.handle(logging.makeLogRecord({"name": "foo", "levelno": logging.WARNING}))
+
+        self.assertEqual(handler._loggers, {"foo": None})
+
     def test_log_record_no_span_context(self):
         processor, logger, handler = set_up_test_logging(logging.WARNING)
 
@@ -186,6 +210,27 @@ class TestLoggingHandler(unittest.TestCase):
 
         logger.removeHandler(handler)
 
+    def test_log_record_exception_stacktrace_is_formatted_lazily(self):
+        processor, logger, handler = set_up_test_logging(logging.ERROR)
+
+        try:
+            raise ZeroDivisionError("division by zero")
+        except ZeroDivisionError:
+            with self.assertLogs(level=logging.ERROR):
+                logger.exception("Zero Division Error")
+
+        attributes = processor.get_log_record(0).log_record.attributes
+        self.assertNotIsInstance(
+            attributes._pending[exception_attributes.EXCEPTION_STACKTRACE],
+            str,
+        )
+        self.assertIn(
+            "ZeroDivisionError",
+            attributes[exception_attributes.EXCEPTION_STACKTRACE],
+        )
+
+        logger.removeHandler(handler)
+
     def test_log_record_recursive_exception(self):
         """Exception information will be included in attributes even though it is recursive"""
         processor, logger, handler = set_up_test_logging(logging.ERROR)
@@ -492,13 +537,139 @@ class TestLoggingHandler(unittest.TestCase):
 
         logger.removeHandler(handler)
 
+    def test_records_dropped_by_logger_are_not_translated(self):
+        logger_provider = LoggerProvider(
+            _logger_configurator=lambda _scope: _LoggerConfig(minimum_severity=SeverityNumber.WARN)
+        )
+        processor = FakeProcessor()
+        logger_provider.add_log_record_processor(processor)
+        logger = logging.getLogger("minimum_severity")
+        handler = LoggingHandler(level=logging.DEBUG, logger_provider=logger_provider)
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+
+        with patch.object(handler, "_translate", wraps=handler._translate) as translate:
+            logger.debug("debug message")
+            translate.assert_not_called()
+            with self.assertLogs(level=logging.WARNING):
+                logger.warning("warning message")
+            translate.assert_called_once()
+
+        self.assertEqual(processor.emit_count(), 1)
+        self.assertEqual(processor.get_log_record(0).log_record.body, "warning message")
+
+        logger.removeHandler(handler)
+        logger.setLevel(logging.NOTSET)
+
+    def test_root_handler_warning_while_cleaning_attributes(self):
+        # Cleaning the invalid attribute logs a warning, which the root
+        # handler emits while the attributes of the first record are read.
+        logger_provider = LoggerProvider()
+        out = io.StringIO()
+        logger_provider.add_log_record_processor(SimpleLogRecordProcessor(ConsoleLogRecordExporter(out=out)))
+        handler = LoggingHandler(level=logging.WARNING, logger_provider=logger_provider)
+        root_logger = logging.getLogger()
+        root_logger.addHandler(handler)
+        try:
+            thread = threading.Thread(
+                target=logging.getLogger("app").warning,
+                args=("hello",),
+                kwargs={"extra": {"mixed": [1, "a"]}},
+                daemon=True,
+            )
+            thread.start()
+            thread.join(5)
+            self.assertFalse(thread.is_alive())
+        finally:
+            root_logger.removeHandler(handler)
+
+        self.assertIn('"body": "hello"', out.getvalue())
+
+
+class TestNonBlockingLoggingHandler(unittest.TestCase):
+    def test_records_are_emitted_on_flush(self):
+        processor, logger, handler = set_up_test_logging(logging.WARNING, non_blocking=True)
+        logger.warning("first %s", "message")
+        logger.warning("second message")
+        handler.flush()
+
+        self.assertEqual(
+            [record.log_record.body for record in processor.log_data_emitted],
+            ["first message", "second message"],
+        )
+        self.assertEqual(handler.dropped_log_records, 0)
+
+        logger.removeHandler(handler)
+        handler.close()
+
+    def test_context_is_captured_on_emit(self):
+        processor, logger, handler = set_up_test_logging(logging.WARNING, non_blocking=True)
+
+        tracer = trace.TracerProvider().get_tracer(__name__)
+        with tracer.start_as_current_span("test") as span:
+            logger.warning("message within span")
+        handler.flush()
+
+        record = processor.get_log_record(0)
+        span_context = span.get_span_context()
+        self.assertEqual(record.log_record.trace_id, span_context.trace_id)
+        self.assertEqual(record.log_record.span_id, span_context.span_id)
+
+        logger.removeHandler(handler)
+        handler.close()
+
+    def test_oldest_records_are_dropped_when_queue_is_full(self):
+        processor, logger, handler = set_up_test_logging(logging.WARNING, non_blocking=True, max_queue_size=2)
+        # Block the worker so that records accumulate in the queue.
+        with patch.object(handler._worker, "_worker_awaken"):
+            for index in range(5):
+                logger.warning("message %d", index)
+        self.assertEqual(handler.dropped_log_records, 3)
+
+        with self.assertLogs("opentelemetry.sdk._logs._internal", level=logging.WARNING):
+            handler.flush()
+        self.assertEqual(
+            [record.log_record.body for record in processor.log_data_emitted],
+            ["message 3", "message 4"],
+        )
+
+        logger.removeHandler(handler)
+        handler.close()
+
+    def test_close_emits_queued_records(self):
+        processor, logger, handler = set_up_test_logging(logging.WARNING, non_blocking=True)
+        logger.warning("message")
+        logger.removeHandler(handler)
+        handler.close()
+
+        self.assertEqual(processor.emit_count(), 1)
+        self.assertFalse(handler._worker._worker_thread.is_alive())
+
+    def test_invalid_max_queue_size(self):
+        with self.assertRaises(ValueError):
+            LoggingHandler(logger_provider=LoggerProvider(), non_blocking=True, max_queue_size=0)
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs *nix")
+    def test_worker_is_restarted_after_fork(self):
+        processor, logger, handler = set_up_test_logging(logging.WARNING, non_blocking=True)
+        worker_thread = handler._worker._worker_thread
+        handler._worker._at_fork_reinit()
+
+        self.assertIsNot(handler._worker._worker_thread, worker_thread)
+        logger.warning("message")
+        handler.flush()
+        self.assertEqual(processor.emit_count(), 1)
+
+        logger.removeHandler(handler)
+        handler.close()
+
 
-def set_up_test_logging(level, formatter=None, root_logger=False):
+def set_up_test_logging(level, formatter=None, root_logger=False, **handler_kwargs):
     logger_provider = LoggerProvider()
     processor = FakeProcessor()
     logger_provider.add_log_record_processor(processor)
     logger = logging.getLogger(None if root_logger else "foo")
-    handler = LoggingHandler(level=level, logger_provider=logger_provider)
+    handler = LoggingHandler(level=level, logger_provider=logger_provider, **handler_kwargs)
     if formatter:
         handler.setFormatter(formatter)
     logger.addHandler(handler)
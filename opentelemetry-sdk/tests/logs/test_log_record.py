@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import json
+import pickle
 import unittest
 import warnings
 
@@ -165,6 +166,42 @@ class TestLogRecord(unittest.TestCase):
             warning_message,
         )
 
+    def test_log_record_attributes_cleaned_on_first_access(self):
+        attr = {"key": "value", "key2": b"value2", "key3": "value3"}
+        limits = LogRecordLimits(max_attributes=2, max_attribute_length=3)
+
+        with warnings.catch_warnings(record=True) as cw:
+            warnings.simplefilter("always")
+            result = ReadWriteLogRecord(LogRecord(timestamp=0, attributes=attr), limits=limits)
+        # The dropped attributes are known before the attributes are cleaned.
+        self.assertEqual(len(cw), 1)
+        self.assertEqual(result.dropped_attributes, 1)
+        self.assertIsNotNone(result.log_record.attributes._pending)
+
+        result.log_record.attributes["key4"] = "value4"
+        self.assertEqual(result.log_record.attributes, {"key3": "val", "key4": "val"})
+        self.assertEqual(result.dropped_attributes, 2)
+        self.assertIsNone(result.log_record.attributes._pending)
+
+    def test_log_record_attributes_are_copied(self):
+        attr = {"a": 1, "lst": [1, 2, 3]}
+        result = ReadWriteLogRecord(LogRecord(timestamp=0, attributes=attr))
+
+        attr["a"] = 2
+        attr["b"] = 5
+        self.assertEqual(result.log_record.attributes, {"a": 1, "lst": (1, 2, 3)})
+
+    def test_log_record_attributes_pickle(self):
+        result = ReadWriteLogRecord(
+            LogRecord(timestamp=0, attributes={"key": "value"}),
+            limits=LogRecordLimits(max_attribute_length=1),
+        )
+
+        unpickled = pickle.loads(pickle.dumps(result.log_record.attributes))
+        self.assertEqual(unpickled, {"key": "v"})
+        unpickled["key2"] = "value2"
+        self.assertEqual(unpickled, {"key": "v", "key2": "v"})
+
     def test_log_record_dropped_attributes_unset_limits(self):
         attr = {"key": "value", "key2": "value2"}
         limits = LogRecordLimits()
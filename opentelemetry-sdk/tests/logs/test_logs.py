@@ -9,14 +9,16 @@ import subprocess
 import sys
 import unittest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from opentelemetry._logs import LogRecord, SeverityNumber
 from opentelemetry.attributes import BoundedAttributes
-from opentelemetry.context import get_current
+from opentelemetry.context import attach, detach, get_current
 from opentelemetry.sdk._logs import (
     Logger,
     LoggerProvider,
+    LogRecordLimits,
+    LogRecordProcessor,
     ReadableLogRecord,
     ReadWriteLogRecord,
 )
@@ -30,6 +32,7 @@ from opentelemetry.sdk._logs._internal import (
 )
 from opentelemetry.sdk.environment_variables import (
     OTEL_EXPERIMENTAL_RESOURCE_DETECTORS,
+    OTEL_LOGRECORD_ATTRIBUTE_COUNT_LIMIT,
     OTEL_SDK_DISABLED,
 )
 from opentelemetry.sdk.resources import Resource
@@ -38,6 +41,12 @@ from opentelemetry.sdk.util.instrumentation import (
     _scope_name_matches_glob,
 )
 from opentelemetry.semconv.attributes import exception_attributes
+from opentelemetry.trace import (
+    NonRecordingSpan,
+    SpanContext,
+    TraceFlags,
+    set_span_in_context,
+)
 
 
 class TestLoggerProvider(unittest.TestCase):
@@ -151,6 +160,17 @@ class TestLoggerProvider(unittest.TestCase):
         self.assertEqual(logger._instrumentation_scope.schema_url, "schema_url")
         self.assertEqual(logger._instrumentation_scope.attributes, {"key": "value"})
 
+    def test_get_logger_cached_logger_is_returned_without_locking(self):
+        provider = LoggerProvider()
+        logger = provider.get_logger("name", version="version")
+
+        provider._active_loggers_lock = MagicMock()
+        provider._logger_cache_lock = MagicMock()
+        self.assertIs(provider.get_logger("name", version="version"), logger)
+        provider._active_loggers_lock.__enter__.assert_not_called()
+        provider._logger_cache_lock.__enter__.assert_not_called()
+        self.assertIn(logger, provider._active_loggers)
+
     @patch.dict("os.environ", {OTEL_SDK_DISABLED: "true"})
     def test_get_logger_with_sdk_disabled(self):
         logger = LoggerProvider().get_logger(Mock())
@@ -170,6 +190,26 @@ class TestLoggerProvider(unittest.TestCase):
         )
         self.assertIsNotNone(logger_provider._at_exit_handler)
 
+    def test_log_record_limits_shared_by_loggers(self):
+        with patch.dict("os.environ", {OTEL_LOGRECORD_ATTRIBUTE_COUNT_LIMIT: "1"}):
+            provider = LoggerProvider()
+        processor_mock = Mock()
+        provider.add_log_record_processor(processor_mock)
+        logger = provider.get_logger("name")
+
+        self.assertIs(logger._log_record_limits, provider._log_record_limits)
+        logger.emit(body="body", attributes={"a": 1, "b": 2})
+        log_record = processor_mock.on_emit.call_args.args[0]
+        self.assertIs(log_record.limits, provider._log_record_limits)
+        self.assertEqual(log_record.log_record.attributes, {"b": 2})
+        self.assertEqual(log_record.dropped_attributes, 1)
+
+    def test_log_record_limits_argument(self):
+        limits = LogRecordLimits(max_log_record_attributes=2)
+        provider = LoggerProvider(log_record_limits=limits)
+
+        self.assertIs(provider.get_logger("name")._log_record_limits, limits)
+
     def test_default_logger_configurator(self):
         provider = LoggerProvider()
         logger = provider.get_logger("module_name", "1.0", "schema_url")
@@ -483,3 +523,102 @@ class TestLogger(unittest.TestCase):
         log_data = log_record_processor_mock.on_emit.call_args.args[0]
         attributes = dict(log_data.log_record.attributes)
         self.assertEqual(attributes[exception_attributes.EXCEPTION_TYPE], "RuntimeError")
+
+
+class _SeverityFilteringProcessor(LogRecordProcessor):
+    def __init__(self, minimum_severity):
+        self.minimum_severity = minimum_severity
+        self.emitted = []
+
+    def enabled(self, severity_number, context):
+        return severity_number.value >= self.minimum_severity.value
+
+    def on_emit(self, log_record):
+        self.emitted.append(log_record)
+
+    def shutdown(self):
+        pass
+
+    def force_flush(self, timeout_millis=30000):
+        return True
+
+
+class TestLoggerEnabled(unittest.TestCase):
+    @staticmethod
+    def _get_logger(logger_config, *processors):
+        provider = LoggerProvider(_logger_configurator=lambda _scope: logger_config)
+        for processor in processors:
+            provider.add_log_record_processor(processor)
+        return provider.get_logger("name")
+
+    def test_minimum_severity(self):
+        processor = Mock()
+        logger = self._get_logger(_LoggerConfig(minimum_severity=SeverityNumber.WARN), processor)
+
+        self.assertFalse(logger.enabled(SeverityNumber.DEBUG))
+        self.assertTrue(logger.enabled(SeverityNumber.WARN))
+        # Records without a severity are not filtered.
+        self.assertTrue(logger.enabled(SeverityNumber.UNSPECIFIED))
+        self.assertTrue(logger.enabled())
+
+        logger.emit(body="debug", severity_number=SeverityNumber.DEBUG)
+        logger.emit(LogRecord(body="info", severity_number=SeverityNumber.INFO))
+        logger.emit(body="error", severity_number=SeverityNumber.ERROR)
+        processor.on_emit.assert_called_once()
+        self.assertEqual(processor.on_emit.call_args.args[0].log_record.body, "error")
+
+    def test_trace_based(self):
+        processor = Mock()
+        logger = self._get_logger(_LoggerConfig(trace_based=True), processor)
+
+        def context_with_span(trace_flags):
+            span_context = SpanContext(1, 2, is_remote=False, trace_flags=TraceFlags(trace_flags))
+            return set_span_in_context(NonRecordingSpan(span_context))
+
+        sampled = context_with_span(TraceFlags.SAMPLED)
+        unsampled = context_with_span(TraceFlags.DEFAULT)
+        self.assertTrue(logger.enabled(context=sampled))
+        self.assertFalse(logger.enabled(context=unsampled))
+        # Records emitted outside of a span are not filtered.
+        self.assertTrue(logger.enabled(context=get_current()))
+
+        logger.emit(body="unsampled", context=unsampled)
+        processor.on_emit.assert_not_called()
+        token = attach(unsampled)
+        try:
+            logger.emit(body="unsampled")
+        finally:
+            detach(token)
+        processor.on_emit.assert_not_called()
+        logger.emit(body="sampled", context=sampled)
+        processor.on_emit.assert_called_once()
+
+    def test_processors_enabled(self):
+        warn_processor = _SeverityFilteringProcessor(SeverityNumber.WARN)
+        error_processor = _SeverityFilteringProcessor(SeverityNumber.ERROR)
+        logger = self._get_logger(_LoggerConfig(), warn_processor, error_processor)
+
+        self.assertFalse(logger.enabled(SeverityNumber.INFO))
+        self.assertTrue(logger.enabled(SeverityNumber.WARN))
+
+        logger.emit(body="info", severity_number=SeverityNumber.INFO)
+        logger.emit(body="warn", severity_number=SeverityNumber.WARN)
+        # Processors interested in the record only receive it once it is emitted.
+        self.assertEqual(len(warn_processor.emitted), 1)
+        self.assertEqual(len(error_processor.emitted), 1)
+
+    def test_processors_enabled_ignored_with_default_processor(self):
+        processor = Mock()
+        logger = self._get_logger(
+            _LoggerConfig(),
+            _SeverityFilteringProcessor(SeverityNumber.ERROR),
+            processor,
+        )
+
+        self.assertTrue(logger.enabled(SeverityNumber.INFO))
+        logger.emit(body="info", severity_number=SeverityNumber.INFO)
+        processor.on_emit.assert_called_once()
+
+    def test_disabled_logger(self):
+        logger = self._get_logger(_LoggerConfig(is_enabled=False), Mock())
+        self.assertFalse(logger.enabled(SeverityNumber.FATAL))
@@ -0,0 +1,162 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from threading import Barrier, Event
+from unittest import TestCase
+
+from opentelemetry.metrics import Observation
+from opentelemetry.metrics._internal import _ProxyMeterProvider
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+
+def _values(reader):
+    metrics_data = reader.get_metrics_data()
+    if metrics_data is None:
+        return {}
+    return {
+        metric.name: [data_point.value for data_point in metric.data.data_points]
+        for scope_metrics in metrics_data.resource_metrics[0].scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+class TestConcurrentCallbacks(TestCase):
+    def test_callbacks_run_concurrently(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader], callback_max_workers=2)
+        meter = meter_provider.get_meter("meter")
+        # Each callback waits for the other one, so this only collects when
+        # they run at the same time.
+        barrier = Barrier(2, timeout=5)
+
+        def callback(value):
+            def observe(options):
+                barrier.wait()
+                return [Observation(value)]
+
+            return observe
+
+        meter.create_observable_gauge("gauge1", callbacks=[callback(1)])
+        meter.create_observable_gauge("gauge2", callbacks=[callback(2)])
+
+        self.assertEqual(_values(reader), {"gauge1": [1], "gauge2": [2]})
+        meter_provider.shutdown()
+
+    def test_slow_callback_times_out(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(
+            metric_readers=[reader],
+            callback_max_workers=2,
+            callback_timeout_millis=50,
+        )
+        meter = meter_provider.get_meter("meter")
+        release = Event()
+
+        def slow_callback(options):
+            release.wait(5)
+            return [Observation(1)]
+
+        meter.create_observable_gauge("slow", callbacks=[slow_callback])
+        meter.create_observable_gauge("fast", callbacks=[lambda options: [Observation(2)]])
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(_values(reader), {"fast": [2]})
+        self.assertEqual(meter_provider.timed_out_callbacks, 1)
+
+        # The slow callback is still running, it is not run again.
+        self.assertEqual(_values(reader), {"fast": [2]})
+        self.assertEqual(meter_provider.skipped_callbacks, 1)
+
+        release.set()
+        meter_provider._measurement_consumer._running_callbacks[
+            meter_provider._measurement_consumer._async_instruments[0]
+        ].result()
+        self.assertEqual(_values(reader), {"slow": [1], "fast": [2]})
+        self.assertEqual(meter_provider.timed_out_callbacks, 1)
+        self.assertEqual(meter_provider.skipped_callbacks, 1)
+        meter_provider.shutdown()
+
+    def test_callbacks_after_shutdown_run_sequentially(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader], callback_max_workers=1)
+        meter_provider.get_meter("meter").create_observable_gauge("gauge", callbacks=[lambda options: [Observation(1)]])
+        meter_provider._measurement_consumer.shutdown()
+
+        self.assertEqual(_values(reader), {"gauge": [1]})
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            MeterProvider(callback_max_workers=0)
+        with self.assertRaises(ValueError):
+            MeterProvider(callback_timeout_millis=100)
+        with self.assertRaises(ValueError):
+            MeterProvider(callback_max_workers=1, callback_timeout_millis=0)
+
+
+class TestBatchCallback(TestCase):
+    def test_batch_callback(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter("meter")
+        used = meter.create_observable_gauge("pool.used")
+        idle = meter.create_observable_gauge("pool.idle")
+        other = meter.create_observable_gauge("other")
+        calls = []
+
+        def observe_pool(options):
+            calls.append(options)
+            yield used, Observation(3)
+            yield idle, Observation(7)
+            yield other, Observation(1)
+
+        meter.register_batch_callback(observe_pool, [used, idle])
+
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(_values(reader), {"pool.used": [3], "pool.idle": [7]})
+        self.assertEqual(len(calls), 1)
+
+    def test_batch_callback_of_proxy_meter(self):
+        proxy_meter_provider = _ProxyMeterProvider()
+        meter = proxy_meter_provider.get_meter("meter")
+        gauge = meter.create_observable_gauge("gauge")
+        meter.register_batch_callback(lambda options: [(gauge, Observation(1))], [gauge])
+
+        reader = InMemoryMetricReader()
+        proxy_meter_provider.on_set_meter_provider(MeterProvider(metric_readers=[reader]))
+
+        self.assertEqual(_values(reader), {"gauge": [1]})
+
+    def test_instruments_of_other_meters_are_ignored(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter("meter")
+        gauge = meter_provider.get_meter("other_meter").create_observable_gauge("gauge")
+        counter = meter.create_counter("counter")
+
+        with self.assertLogs(level="WARNING"):
+            meter.register_batch_callback(
+                lambda options: [(gauge, Observation(1))],
+                [gauge, counter],
+            )
+
+        self.assertEqual(meter_provider._measurement_consumer._async_instruments, [gauge])
+        self.assertEqual(_values(reader), {})
+
+    def test_failing_batch_callback(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader], callback_max_workers=2)
+        meter = meter_provider.get_meter("meter")
+        gauge = meter.create_observable_gauge("gauge")
+
+        def observe(options):
+            yield gauge, Observation(1)
+            raise ValueError("failed")
+
+        meter.register_batch_callback(observe, [gauge])
+
+        with self.assertLogs(level="ERROR"):
+            self.assertEqual(_values(reader), {"gauge": [1]})
+        meter_provider.shutdown()
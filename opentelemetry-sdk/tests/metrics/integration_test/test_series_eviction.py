@@ -0,0 +1,137 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from opentelemetry.metrics import Observation
+from opentelemetry.sdk.metrics import (
+    Counter,
+    MeterProvider,
+    ObservableCounter,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+)
+
+_DELTA = {
+    Counter: AggregationTemporality.DELTA,
+    ObservableCounter: AggregationTemporality.DELTA,
+}
+
+
+def _data_points(reader):
+    metrics_data = reader.get_metrics_data()
+    if metrics_data is None:
+        return []
+    return list(metrics_data.resource_metrics[0].scope_metrics[0].metrics[0].data.data_points)
+
+
+def _streams(meter_provider, instrument):
+    (reader_storage,) = meter_provider._measurement_consumer._reader_storages.values()
+    (view_instrument_match,) = reader_storage._instrument_view_instrument_matches[instrument]
+    return view_instrument_match._attributes_aggregation
+
+
+class TestSeriesEviction(TestCase):
+    def test_idle_delta_streams_are_evicted(self):
+        reader = InMemoryMetricReader(preferred_temporality=_DELTA)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+
+        counter.add(1, {"pod": "a"})
+        counter.add(2, {"pod": "b"})
+        self.assertEqual(len(_data_points(reader)), 2)
+
+        counter.add(3, {"pod": "b"})
+        (data_point,) = _data_points(reader)
+        self.assertEqual(data_point.attributes, {"pod": "b"})
+        self.assertEqual(meter_provider.evicted_series, 1)
+        self.assertEqual(list(_streams(meter_provider, counter)), [frozenset({("pod", "b")})])
+
+        self.assertEqual(_data_points(reader), [])
+        self.assertEqual(meter_provider.evicted_series, 2)
+        self.assertEqual(_streams(meter_provider, counter), {})
+
+        counter.add(4, {"pod": "a"})
+        (data_point,) = _data_points(reader)
+        self.assertEqual(data_point.value, 4)
+
+    def test_measurement_racing_eviction_is_not_lost(self):
+        reader = InMemoryMetricReader(preferred_temporality=_DELTA)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+        counter.add(1)
+        reader.get_metrics_data()
+        streams = _streams(meter_provider, counter)
+        (aggregation,) = streams.values()
+        aggregate = aggregation.aggregate
+
+        def evict_then_aggregate(*args):
+            # The stream is evicted after it was looked up by the measurement.
+            streams.clear()
+            aggregate(*args)
+
+        aggregation.aggregate = evict_then_aggregate
+        counter.add(5)
+
+        (data_point,) = _data_points(reader)
+        self.assertEqual(data_point.value, 5)
+
+    def test_asynchronous_delta_streams_are_kept(self):
+        reader = InMemoryMetricReader(preferred_temporality=_DELTA)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        observations = [[Observation(10)], [], [Observation(15)]]
+        meter_provider.get_meter("meter").create_observable_counter(
+            "counter", callbacks=[lambda options: observations.pop(0)]
+        )
+
+        self.assertEqual(_data_points(reader)[0].value, 10)
+        self.assertEqual(_data_points(reader), [])
+        self.assertEqual(_data_points(reader)[0].value, 5)
+        self.assertEqual(meter_provider.evicted_series, 0)
+
+    def test_cumulative_streams_are_kept_without_ttl(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+
+        counter.add(1, {"pod": "a"})
+        for _ in range(3):
+            self.assertEqual(_data_points(reader)[0].value, 1)
+        self.assertEqual(meter_provider.evicted_series, 0)
+
+    @patch("opentelemetry.sdk.metrics._internal.metric_reader_storage.time_ns")
+    def test_idle_cumulative_streams_are_evicted_after_ttl(self, mock_time_ns):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader], idle_series_ttl_millis=1000)
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+        counter.add(1, {"pod": "a"})
+        counter.add(1, {"pod": "b"})
+
+        mock_time_ns.return_value = 1_000_000_000
+        self.assertEqual(len(_data_points(reader)), 2)
+
+        counter.add(1, {"pod": "b"})
+        mock_time_ns.return_value = 1_500_000_000
+        self.assertEqual(len(_data_points(reader)), 2)
+
+        counter.add(1, {"pod": "b"})
+        mock_time_ns.return_value = 2_500_000_000
+        (data_point,) = _data_points(reader)
+        self.assertEqual(data_point.attributes, {"pod": "b"})
+        self.assertEqual(data_point.value, 3)
+        self.assertEqual(meter_provider.evicted_series, 1)
+
+        # An evicted stream starts again from zero.
+        counter.add(1, {"pod": "a"})
+        mock_time_ns.return_value = 3_000_000_000
+        values = {data_point.attributes["pod"]: data_point.value for data_point in _data_points(reader)}
+        self.assertEqual(values, {"a": 1, "b": 3})
+
+    def test_invalid_ttl(self):
+        with self.assertRaises(ValueError):
+            MeterProvider(idle_series_ttl_millis=0)
@@ -0,0 +1,182 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from time import sleep
+from unittest import TestCase
+
+from opentelemetry.sdk.metrics import (
+    AlwaysOnExemplarFilter,
+    Counter,
+    Histogram,
+    MeterProvider,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+)
+from opentelemetry.sdk.metrics.view import (
+    ExplicitBucketHistogramAggregation,
+)
+
+
+def _values(reader):
+    return {
+        metric.name: [data_point.value for data_point in metric.data.data_points]
+        for metric in reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics
+    }
+
+
+class TestSharedReaderStorage(TestCase):
+    def test_cumulative_readers_share_streams(self):
+        readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+        meter_provider = MeterProvider(metric_readers=readers)
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+
+        storages = meter_provider._measurement_consumer._storages
+        self.assertEqual(len(storages), 1)
+        self.assertEqual(len(storages[0]._instrument_view_instrument_matches), 0)
+
+        counter.add(1)
+        counter.add(2)
+        self.assertEqual(len(storages[0]._instrument_view_instrument_matches[counter]), 1)
+        self.assertEqual(_values(readers[0]), {"counter": [3]})
+        counter.add(4)
+        self.assertEqual(_values(readers[1]), {"counter": [7]})
+        self.assertEqual(_values(readers[0]), {"counter": [7]})
+
+    def test_readers_share_last_value_streams(self):
+        readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+        meter_provider = MeterProvider(metric_readers=readers)
+        gauge = meter_provider.get_meter("meter").create_gauge("gauge")
+
+        gauge.set(5)
+
+        self.assertEqual(_values(readers[0]), {"gauge": [5]})
+        self.assertEqual(_values(readers[1]), {"gauge": [5]})
+
+    def test_shared_streams_are_evicted_when_idle_for_every_reader(self):
+        readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+        meter_provider = MeterProvider(metric_readers=readers, idle_series_ttl_millis=50)
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+
+        values = []
+        for _ in range(3):
+            counter.add(1)
+            values.append(_values(readers[0])["counter"])
+            readers[1].get_metrics_data()
+            sleep(0.06)
+            readers[1].get_metrics_data()
+
+        self.assertEqual(values, [[1], [2], [3]])
+        self.assertEqual(meter_provider._measurement_consumer.evicted_series, 0)
+
+        readers[0].get_metrics_data()
+        sleep(0.06)
+        self.assertIsNone(readers[0].get_metrics_data())
+        self.assertEqual(meter_provider._measurement_consumer.evicted_series, 1)
+
+    def test_every_reader_gets_the_exemplars(self):
+        readers = [InMemoryMetricReader(), InMemoryMetricReader()]
+        meter_provider = MeterProvider(metric_readers=readers, exemplar_filter=AlwaysOnExemplarFilter())
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+
+        counter.add(1)
+
+        for reader in readers:
+            (data_point,) = reader.get_metrics_data().resource_metrics[0].scope_metrics[0].metrics[0].data.data_points
+            self.assertEqual(len(data_point.exemplars), 1)
+
+    def test_delta_readers_share_streams(self):
+        readers = [
+            InMemoryMetricReader(preferred_temporality={Histogram: AggregationTemporality.DELTA}),
+            InMemoryMetricReader(preferred_temporality={Histogram: AggregationTemporality.DELTA}),
+        ]
+        meter_provider = MeterProvider(metric_readers=readers)
+        histogram = meter_provider.get_meter("meter").create_histogram("histogram")
+
+        histogram.record(3)
+        self.assertEqual(
+            len(meter_provider._measurement_consumer._storages[0]._instrument_view_instrument_matches[histogram]), 1
+        )
+        readers[0].get_metrics_data()
+        histogram.record(1)
+        histogram.record(30)
+
+        (data_point,) = readers[1].get_metrics_data().resource_metrics[0].scope_metrics[0].metrics[0].data.data_points
+        self.assertEqual(data_point.count, 3)
+        self.assertEqual(data_point.sum, 34)
+        self.assertEqual(data_point.min, 1)
+        self.assertEqual(data_point.max, 30)
+        self.assertEqual(sum(data_point.bucket_counts), 3)
+
+        (data_point,) = readers[0].get_metrics_data().resource_metrics[0].scope_metrics[0].metrics[0].data.data_points
+        self.assertEqual(data_point.count, 2)
+        self.assertEqual(data_point.sum, 31)
+        self.assertEqual(data_point.min, 1)
+        self.assertIsNone(readers[1].get_metrics_data())
+
+    def test_delta_readers_keep_their_own_delta(self):
+        readers = [
+            InMemoryMetricReader(preferred_temporality={Counter: AggregationTemporality.DELTA}),
+            InMemoryMetricReader(preferred_temporality={Counter: AggregationTemporality.DELTA}),
+        ]
+        meter_provider = MeterProvider(metric_readers=readers)
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+
+        counter.add(1)
+        self.assertEqual(_values(readers[0]), {"counter": [1]})
+        counter.add(2)
+        self.assertEqual(_values(readers[0]), {"counter": [2]})
+        self.assertEqual(_values(readers[1]), {"counter": [3]})
+
+    def test_readers_with_different_configuration_do_not_share(self):
+        readers = [
+            InMemoryMetricReader(),
+            InMemoryMetricReader(preferred_temporality={Counter: AggregationTemporality.DELTA}),
+            InMemoryMetricReader(
+                preferred_aggregation={Histogram: ExplicitBucketHistogramAggregation(boundaries=(1.0,))}
+            ),
+            InMemoryMetricReader(
+                preferred_aggregation={Histogram: ExplicitBucketHistogramAggregation(boundaries=(1.0,))}
+            ),
+        ]
+        meter_provider = MeterProvider(metric_readers=readers)
+
+        self.assertEqual(len(meter_provider._measurement_consumer._storages), 3)
+
+    def test_added_reader_shares_storage(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+        gauge = meter_provider.get_meter("meter").create_gauge("gauge")
+        counter.add(1)
+        gauge.set(1)
+
+        new_reader = InMemoryMetricReader()
+        meter_provider.add_metric_reader(new_reader)
+        self.assertEqual(len(meter_provider._measurement_consumer._storages), 1)
+        counter.add(2)
+        gauge.set(2)
+        self.assertEqual(_values(new_reader), {"counter": [3], "gauge": [2]})
+
+        meter_provider.remove_metric_reader(reader)
+        counter.add(3)
+        self.assertEqual(_values(new_reader), {"counter": [6]})
+
+    def test_removed_reader_leaves_no_streams_behind(self):
+        reader = InMemoryMetricReader()
+        new_reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader, new_reader])
+        counter = meter_provider.get_meter("meter").create_counter("counter")
+        counter.add(1)
+        self.assertEqual(_values(reader), {"counter": [1]})
+
+        meter_provider.remove_metric_reader(reader)
+
+        (storage,) = meter_provider._measurement_consumer._storages
+        (view_instrument_match,) = storage._instrument_view_instrument_matches[counter]
+        self.assertEqual(storage._named_view_instrument_matches, {"counter": [view_instrument_match]})
+        self.assertEqual(list(storage._data_builders), [view_instrument_match])
+        self.assertEqual(list(view_instrument_match._cursors), [new_reader])
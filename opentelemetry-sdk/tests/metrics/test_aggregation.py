@@ -202,6 +202,25 @@ class TestSynchronousSumAggregation(TestCase):
         third_sum = sum_aggregation.collect(AggregationTemporality.CUMULATIVE, 1)
         self.assertIsNone(third_sum)
 
+    def test_reservoir_built_on_first_sampled_measurement(self):
+        reservoir_builder = Mock()
+        sum_aggregation = _SumAggregation(
+            Mock(),
+            True,
+            AggregationTemporality.CUMULATIVE,
+            0,
+            reservoir_builder,
+        )
+
+        sum_aggregation.aggregate(measurement(1), should_sample_exemplar=False)
+        reservoir_builder.assert_not_called()
+        self.assertEqual(sum_aggregation.collect(AggregationTemporality.CUMULATIVE, 1).exemplars, [])
+
+        sum_aggregation.aggregate(measurement(2))
+        sum_aggregation.aggregate(measurement(3))
+        reservoir_builder.assert_called_once_with()
+        self.assertEqual(reservoir_builder.return_value.offer.call_count, 2)
+
 
 class TestLastValueAggregation(TestCase):
     def test_aggregate(self):
@@ -301,6 +320,30 @@ class TestExplicitBucketHistogramAggregation(TestCase):
         histo = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.CUMULATIVE, 1)
         self.assertEqual(histo.sum, 14)
 
+    def test_cumulative_bucket_counts_are_shared(self):
+        explicit_bucket_histogram_aggregation = _ExplicitBucketHistogramAggregation(
+            Mock(),
+            AggregationTemporality.DELTA,
+            0,
+            _default_reservoir_factory(_ExplicitBucketHistogramAggregation),
+            boundaries=[0, 2, 4],
+        )
+
+        explicit_bucket_histogram_aggregation.aggregate(measurement(1))
+        first_histo = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.CUMULATIVE, 1)
+        second_histo = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.CUMULATIVE, 2)
+        explicit_bucket_histogram_aggregation.aggregate(measurement(3))
+        third_histo = explicit_bucket_histogram_aggregation.collect(AggregationTemporality.CUMULATIVE, 3)
+
+        self.assertEqual(first_histo.bucket_counts, (0, 1, 0, 0))
+        # Without new measurements the bucket counts are not copied.
+        self.assertIs(second_histo.bucket_counts, first_histo.bucket_counts)
+        self.assertEqual(second_histo.count, 1)
+        self.assertEqual(third_histo.bucket_counts, (0, 1, 1, 0))
+        self.assertEqual(third_histo.count, 2)
+        self.assertEqual(third_histo.sum, 4)
+        self.assertEqual(first_histo.bucket_counts, (0, 1, 0, 0))
+
     def test_min_max(self):
         """
         `record_min_max` indicates the aggregator to record the minimum and
@@ -0,0 +1,269 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+
+from math import inf
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
+from opentelemetry.sdk.metrics._internal.export._delta_to_cumulative import (
+    _add_exponential_histogram_data_points,
+)
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    Buckets,
+    DeltaToCumulativeMetricExporter,
+    ExponentialHistogramDataPoint,
+    Gauge,
+    Metric,
+    MetricExporter,
+    MetricExportResult,
+    MetricsData,
+    NumberDataPoint,
+    PeriodicExportingMetricReader,
+    ResourceMetrics,
+    ScopeMetrics,
+    Sum,
+)
+from opentelemetry.sdk.metrics.view import (
+    ExponentialBucketHistogramAggregation,
+)
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
+
+_RESOURCE = Resource({"service.name": "test"})
+_SCOPE = InstrumentationScope("scope")
+
+
+class _InMemoryExporter(MetricExporter):
+    def __init__(self):
+        super().__init__(preferred_aggregation={Histogram: ExponentialBucketHistogramAggregation()})
+        self.metrics_data = []
+
+    def export(self, metrics_data, timeout_millis=10_000, **kwargs):
+        self.metrics_data.append(metrics_data)
+        return MetricExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis=10_000):
+        return True
+
+    def shutdown(self, timeout_millis=30_000, **kwargs):
+        pass
+
+
+def _sum(points, temporality=AggregationTemporality.DELTA, name="sum"):
+    return Metric(
+        name=name,
+        description="",
+        unit="",
+        data=Sum(
+            data_points=[
+                NumberDataPoint(
+                    attributes=attributes,
+                    start_time_unix_nano=start,
+                    time_unix_nano=time,
+                    value=value,
+                )
+                for attributes, start, time, value in points
+            ],
+            aggregation_temporality=temporality,
+            is_monotonic=True,
+        ),
+    )
+
+
+def _metrics_data(*metrics):
+    return MetricsData(
+        resource_metrics=[
+            ResourceMetrics(
+                resource=_RESOURCE,
+                scope_metrics=[ScopeMetrics(scope=_SCOPE, metrics=list(metrics), schema_url="")],
+                schema_url="",
+            )
+        ]
+    )
+
+
+def _points(metrics_data):
+    return {
+        metric.name: [
+            (dict(point.attributes), point.start_time_unix_nano, point.value) for point in metric.data.data_points
+        ]
+        for resource_metrics in metrics_data.resource_metrics
+        for scope_metrics in resource_metrics.scope_metrics
+        for metric in scope_metrics.metrics
+    }
+
+
+class TestDeltaToCumulativeMetricExporter(TestCase):
+    def setUp(self):
+        self.exporter = _InMemoryExporter()
+        self.delta_to_cumulative = DeltaToCumulativeMetricExporter(self.exporter)
+
+    def _export(self, *metrics):
+        self.assertEqual(
+            self.delta_to_cumulative.export(_metrics_data(*metrics)),
+            MetricExportResult.SUCCESS,
+        )
+        return self.exporter.metrics_data[-1]
+
+    def test_preferred_temporality_and_aggregation(self):
+        self.assertEqual(
+            self.delta_to_cumulative._preferred_temporality[Counter],
+            AggregationTemporality.DELTA,
+        )
+        self.assertIs(
+            self.delta_to_cumulative._preferred_aggregation,
+            self.exporter._preferred_aggregation,
+        )
+
+    def test_sums_are_accumulated(self):
+        metrics_data = self._export(_sum([({"a": 1}, 1, 2, 3), ({"a": 2}, 1, 2, 1)]))
+        self.assertEqual(_points(metrics_data), {"sum": [({"a": 1}, 1, 3), ({"a": 2}, 1, 1)]})
+        self.assertEqual(
+            metrics_data.resource_metrics[0].scope_metrics[0].metrics[0].data.aggregation_temporality,
+            AggregationTemporality.CUMULATIVE,
+        )
+
+        # Streams without new points are exported with their accumulated value.
+        metrics_data = self._export(_sum([({"a": 1}, 2, 3, 4)]))
+        self.assertEqual(_points(metrics_data), {"sum": [({"a": 1}, 1, 7), ({"a": 2}, 1, 1)]})
+
+        # Out of order points are dropped.
+        metrics_data = self._export(_sum([({"a": 1}, 1, 2, 3)]))
+        self.assertEqual(_points(metrics_data), {"sum": [({"a": 1}, 1, 7), ({"a": 2}, 1, 1)]})
+
+    def test_other_metrics_are_passed(self):
+        cumulative = _sum([({}, 1, 2, 5)], AggregationTemporality.CUMULATIVE, name="cumulative")
+        gauge = Metric(
+            name="gauge",
+            description="",
+            unit="",
+            data=Gauge(data_points=[NumberDataPoint(attributes={}, start_time_unix_nano=0, time_unix_nano=2, value=1)]),
+        )
+
+        metrics_data = self._export(cumulative, gauge, _sum([({}, 1, 2, 3)]))
+        metrics = metrics_data.resource_metrics[0].scope_metrics[0].metrics
+        self.assertIs(metrics[0], cumulative)
+        self.assertIs(metrics[1], gauge)
+        self.assertEqual(_points(metrics_data)["sum"], [({}, 1, 3)])
+
+        self.assertEqual(_points(self._export()), {"sum": [({}, 1, 3)]})
+
+    @patch("opentelemetry.sdk.metrics._internal.export._delta_to_cumulative.time_ns")
+    def test_stale_streams_are_evicted(self, mock_time_ns):
+        delta_to_cumulative = DeltaToCumulativeMetricExporter(self.exporter, stream_ttl_millis=1000)
+        mock_time_ns.return_value = 1_000_000_000
+        delta_to_cumulative.export(_metrics_data(_sum([({"a": 1}, 1, 2, 3), ({"a": 2}, 1, 2, 1)])))
+
+        mock_time_ns.return_value = 1_500_000_000
+        delta_to_cumulative.export(_metrics_data(_sum([({"a": 1}, 2, 3, 1)])))
+        self.assertEqual(len(_points(self.exporter.metrics_data[-1])["sum"]), 2)
+
+        mock_time_ns.return_value = 2_000_000_000
+        delta_to_cumulative.export(_metrics_data())
+        self.assertEqual(_points(self.exporter.metrics_data[-1]), {"sum": [({"a": 1}, 1, 4)]})
+        self.assertEqual(delta_to_cumulative.evicted_streams, 1)
+
+        mock_time_ns.return_value = 3_000_000_000
+        delta_to_cumulative.export(_metrics_data())
+        self.assertEqual(self.exporter.metrics_data[-1].resource_metrics, [])
+        self.assertEqual(delta_to_cumulative._resources, {})
+
+        # An evicted stream starts again with a new start time.
+        delta_to_cumulative.export(_metrics_data(_sum([({"a": 1}, 4, 5, 2)])))
+        self.assertEqual(_points(self.exporter.metrics_data[-1]), {"sum": [({"a": 1}, 4, 2)]})
+
+    def test_max_streams(self):
+        delta_to_cumulative = DeltaToCumulativeMetricExporter(self.exporter, max_streams=1)
+
+        with self.assertLogs(level="WARNING"):
+            delta_to_cumulative.export(_metrics_data(_sum([({"a": 1}, 1, 2, 3), ({"a": 2}, 1, 2, 1)])))
+        delta_to_cumulative.export(_metrics_data(_sum([({"a": 1}, 2, 3, 1)])))
+
+        self.assertEqual(_points(self.exporter.metrics_data[-1]), {"sum": [({"a": 1}, 1, 4)]})
+        self.assertEqual(delta_to_cumulative.dropped_points, 1)
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            DeltaToCumulativeMetricExporter(self.exporter, stream_ttl_millis=0)
+        with self.assertRaises(ValueError):
+            DeltaToCumulativeMetricExporter(self.exporter, max_streams=0)
+
+    def test_force_flush_and_shutdown(self):
+        exporter = Mock(_preferred_aggregation=None)
+        delta_to_cumulative = DeltaToCumulativeMetricExporter(exporter)
+
+        delta_to_cumulative.force_flush(timeout_millis=10)
+        exporter.force_flush.assert_called_once_with(timeout_millis=10)
+        delta_to_cumulative.shutdown(timeout_millis=10)
+        exporter.shutdown.assert_called_once_with(timeout_millis=10)
+
+    def test_add_exponential_histogram_data_points(self):
+        def point(scale, positive, negative=Buckets(offset=0, bucket_counts=[])):
+            return ExponentialHistogramDataPoint(
+                attributes={},
+                start_time_unix_nano=1,
+                time_unix_nano=2,
+                count=sum(positive.bucket_counts) + sum(negative.bucket_counts),
+                sum=1.0,
+                scale=scale,
+                zero_count=1,
+                positive=positive,
+                negative=negative,
+                flags=0,
+                min=0,
+                max=inf,
+            )
+
+        added = _add_exponential_histogram_data_points(
+            point(1, Buckets(offset=2, bucket_counts=[1, 2, 3])),
+            point(0, Buckets(offset=-1, bucket_counts=[4])),
+        )
+        self.assertEqual(added.scale, 0)
+        self.assertEqual(added.positive, Buckets(offset=-1, bucket_counts=[4, 0, 3, 3]))
+        self.assertEqual(added.count, 10)
+        self.assertEqual(added.zero_count, 2)
+
+        # Buckets are downscaled to fit in the maximum size.
+        added = _add_exponential_histogram_data_points(
+            point(0, Buckets(offset=0, bucket_counts=[1])),
+            point(0, Buckets(offset=200, bucket_counts=[1])),
+        )
+        self.assertEqual(added.scale, -1)
+        self.assertEqual(added.positive, Buckets(offset=0, bucket_counts=[1] + [0] * 99 + [1]))
+
+
+class TestDeltaToCumulativePipeline(TestCase):
+    def test_delta_collection_exported_as_cumulative(self):
+        exporter = _InMemoryExporter()
+        reader = PeriodicExportingMetricReader(DeltaToCumulativeMetricExporter(exporter), export_interval_millis=inf)
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter("meter")
+        counter = meter.create_counter("counter")
+        histogram = meter.create_histogram("histogram")
+
+        counter.add(1, {"a": 1})
+        histogram.record(1)
+        histogram.record(100)
+        reader.collect()
+        counter.add(2, {"a": 1})
+        histogram.record(1000)
+        reader.collect()
+        reader.collect()
+
+        for metrics_data in exporter.metrics_data[1:]:
+            metrics = metrics_data.resource_metrics[0].scope_metrics[0].metrics
+            self.assertEqual([point.value for point in metrics[0].data.data_points], [3])
+            (point,) = metrics[1].data.data_points
+            self.assertEqual(point.count, 3)
+            self.assertEqual(point.sum, 1101)
+            self.assertEqual(point.max, 1000)
+        # The SDK collects delta metrics, the exporter receives cumulative ones.
+        self.assertEqual(
+            exporter.metrics_data[0].resource_metrics[0].scope_metrics[0].metrics[0].data.aggregation_temporality,
+            AggregationTemporality.CUMULATIVE,
+        )
+        meter_provider.shutdown()
@@ -36,6 +36,7 @@ class TestImport(TestCase):
                 ConsoleMetricExporter,
                 DataPointT,
                 DataT,
+                DeltaToCumulativeMetricExporter,
                 Gauge,
                 Histogram,
                 HistogramDataPoint,
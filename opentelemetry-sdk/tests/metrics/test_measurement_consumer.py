@@ -8,6 +8,9 @@ from time import sleep
 from unittest import TestCase
 from unittest.mock import MagicMock, Mock, patch
 
+from opentelemetry.sdk.metrics._internal.exemplar import (
+    AlwaysOffExemplarFilter,
+)
 from opentelemetry.sdk.metrics._internal.measurement_consumer import (
     MeasurementConsumer,
     SynchronousMeasurementConsumer,
@@ -15,6 +18,8 @@ from opentelemetry.sdk.metrics._internal.measurement_consumer import (
 from opentelemetry.sdk.metrics._internal.sdk_configuration import (
     SdkConfiguration,
 )
+from opentelemetry.sdk.metrics.export import AggregationTemporality
+from opentelemetry.sdk.metrics.view import DefaultAggregation
 
 
 @patch("opentelemetry.sdk.metrics._internal.measurement_consumer.MetricReaderStorage")
@@ -36,7 +41,7 @@ class TestSynchronousMeasurementConsumer(TestCase):
             ),
             metric_readers=reader_mocks,
         )
-        self.assertEqual(len(MockMetricReaderStorage.mock_calls), 5)
+        self.assertEqual(len(MockMetricReaderStorage.call_args_list), 5)
 
     def test_measurements_passed_to_each_reader_storage(self, MockMetricReaderStorage):
         reader_mocks = [Mock() for _ in range(5)]
@@ -57,6 +62,26 @@ class TestSynchronousMeasurementConsumer(TestCase):
         for rs_mock in reader_storage_mocks:
             rs_mock.consume_measurement.assert_called_once_with(measurement_mock, False)
 
+    def test_always_off_exemplar_filter_is_not_called(self, MockMetricReaderStorage):
+        reader_storage_mock = Mock()
+        MockMetricReaderStorage.return_value = reader_storage_mock
+        exemplar_filter = AlwaysOffExemplarFilter()
+        exemplar_filter.should_sample = Mock(return_value=True)
+
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(
+                exemplar_filter=exemplar_filter,
+                resource=Mock(),
+                views=Mock(),
+            ),
+            metric_readers=[Mock()],
+        )
+        measurement_mock = Mock()
+        consumer.consume_measurement(measurement_mock)
+
+        exemplar_filter.should_sample.assert_not_called()
+        reader_storage_mock.consume_measurement.assert_called_once_with(measurement_mock, False)
+
     def test_collect_passed_to_reader_stage(self, MockMetricReaderStorage):
         """Its collect() method should defer to the underlying MetricReaderStorage"""
         reader_mocks = [Mock() for _ in range(5)]
@@ -74,7 +99,7 @@ class TestSynchronousMeasurementConsumer(TestCase):
         for r_mock, rs_mock in zip(reader_mocks, reader_storage_mocks):
             rs_mock.collect.assert_not_called()
             consumer.collect(r_mock)
-            rs_mock.collect.assert_called_once_with()
+            rs_mock.collect.assert_called_once_with(r_mock)
 
     def test_collect_calls_async_instruments(self, MockMetricReaderStorage):
         """Its collect() method should invoke async instruments and pass measurements to the
@@ -206,45 +231,54 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
             metric_readers=[MagicMock()],
         )
 
-        def _hooked_iter(iterable):
+        def _hooked_iter(iterator):
             nonlocal failure
 
-            iterable = iter(iterable)
             iteration_started.set()
             if not mutation_done.wait(timeout):
                 failure = mutation_timeout_error
-            yield next(iterable, None)
-            yield from iterable
-
-        class HookedDict(dict):
-            def values(self):
-                return _hooked_iter(super().values())
-
-        with patch.object(
-            consumer,
-            "_reader_storages",
-            # pylint: disable-next=protected-access
-            HookedDict(consumer._reader_storages),
+            yield from iterator
+
+        class HookedList(list):
+            def __iter__(self):
+                return _hooked_iter(super().__iter__())
+
+        class HookedTuple(tuple):
+            def __iter__(self):
+                return _hooked_iter(super().__iter__())
+
+        # pylint: disable-next=protected-access
+        (storage,) = consumer._storages
+
+        with (
+            patch.object(
+                consumer,
+                "_storages",
+                # pylint: disable-next=protected-access
+                HookedList(consumer._storages),
+            ),
+            patch.object(storage, "consume_measurement") as consume_measurement,
         ):
 
             def mutate():
-                """Directly mutate _reader_storages after iteration starts"""
+                """Directly mutate _storages after iteration starts"""
                 nonlocal failure
                 if not iteration_started.wait(timeout):
                     failure = iteration_timeout_error
                 # pylint: disable-next=protected-access
-                consumer._reader_storages.clear()
+                consumer._storages.clear()
                 mutation_done.set()
 
-            # Verify that test setup works (direct mutation with no synchronization fails)
-            with self.assertRaises(RuntimeError) as cm:
-                t = Thread(target=mutate)
-                t.start()
-                try:
-                    consumer.consume_measurement(MagicMock())
-                finally:
-                    t.join()
-            self.assertEqual("dictionary changed size during iteration", str(cm.exception))
+            # Verify that test setup works (direct mutation with no
+            # synchronization is seen by the iteration, so the storage misses
+            # the measurement)
+            t = Thread(target=mutate)
+            t.start()
+            try:
+                consumer.consume_measurement(MagicMock())
+            finally:
+                t.join()
+            consume_measurement.assert_not_called()
             self.assertIsNone(failure)
 
         # Reset the events for the second scenario
@@ -252,11 +286,14 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
         mutation_done.clear()
         failure = None
 
-        with patch.object(
-            consumer,
-            "_reader_storages",
-            # pylint: disable-next=protected-access
-            HookedDict(consumer._reader_storages),
+        with (
+            patch.object(
+                consumer,
+                "_storages",
+                # pylint: disable-next=protected-access
+                HookedTuple(consumer._storages),
+            ),
+            patch.object(storage, "consume_measurement") as consume_measurement,
         ):
 
             def add_and_remove_readers():
@@ -269,13 +306,43 @@ class TestSynchronousMeasurementConsumerConcurrency(TestCase):
                 consumer.remove_metric_reader(reader)
                 mutation_done.set()
 
-            # The copy-on-write API never mutates the mapping being
-            # iterated, so `consume_measurement` completes without raising even
-            # though add/remove run concurrently mid-iteration.
+            # The copy-on-write API never mutates the storages being
+            # iterated, so every storage consumes the measurement even though
+            # add/remove run concurrently mid-iteration.
             t = Thread(target=add_and_remove_readers)
             t.start()
             try:
                 consumer.consume_measurement(MagicMock())
             finally:
                 t.join()
+            consume_measurement.assert_called_once()
             self.assertIsNone(failure)
+
+
+class TestSharedMetricReaderStorage(TestCase):
+    def test_readers_with_the_same_configuration_share_storage(self):
+        readers = [
+            Mock(
+                _instrument_class_temporality={Mock: AggregationTemporality.CUMULATIVE},
+                _instrument_class_aggregation={Mock: DefaultAggregation()},
+            )
+            for _ in range(2)
+        ]
+        delta_reader = Mock(
+            _instrument_class_temporality={Mock: AggregationTemporality.DELTA},
+            _instrument_class_aggregation={Mock: DefaultAggregation()},
+        )
+        consumer = SynchronousMeasurementConsumer(
+            SdkConfiguration(exemplar_filter=Mock(), resource=Mock(), views=()),
+            metric_readers=[*readers, delta_reader],
+        )
+
+        # pylint: disable=protected-access
+        self.assertIs(consumer._reader_storages[readers[0]], consumer._reader_storages[readers[1]])
+        self.assertIsNot(consumer._reader_storages[readers[0]], consumer._reader_storages[delta_reader])
+        self.assertEqual(len(consumer._storages), 2)
+
+        consumer.remove_metric_reader(readers[0])
+        self.assertEqual(len(consumer._storages), 2)
+        consumer.remove_metric_reader(readers[1])
+        self.assertEqual(len(consumer._storages), 1)
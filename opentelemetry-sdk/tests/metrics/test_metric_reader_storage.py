@@ -38,7 +38,7 @@ from opentelemetry.test.concurrency_test import ConcurrencyTestBase, MockFunc
 
 
 def mock_view_matching(name, *instruments) -> Mock:
-    mock = Mock(name=name)
+    mock = Mock(name=name, _instrument_name=None, _instrument_type=None)
     mock._match.side_effect = lambda instrument: instrument in instruments
     return mock
 
@@ -90,9 +90,9 @@ class TestMetricReaderStorage(ConcurrencyTestBase):
 
     @patch("opentelemetry.sdk.metrics._internal.metric_reader_storage._ViewInstrumentMatch")
     def test_forwards_calls_to_view_instrument_match(self, MockViewInstrumentMatch: Mock):
-        view_instrument_match1 = Mock(_aggregation=_LastValueAggregation({}, Mock()))
-        view_instrument_match2 = Mock(_aggregation=_LastValueAggregation({}, Mock()))
-        view_instrument_match3 = Mock(_aggregation=_LastValueAggregation({}, Mock()))
+        view_instrument_match1 = Mock(_name="name", _aggregation=_LastValueAggregation({}, Mock()))
+        view_instrument_match2 = Mock(_name="name", _aggregation=_LastValueAggregation({}, Mock()))
+        view_instrument_match3 = Mock(_name="name", _aggregation=_LastValueAggregation({}, Mock()))
         MockViewInstrumentMatch.side_effect = [
             view_instrument_match1,
             view_instrument_match2,
@@ -264,6 +264,52 @@ class TestMetricReaderStorage(ConcurrencyTestBase):
 
         self.assertIsNone(metric_reader_storage.collect())
 
+    def test_collect_chunks(self):
+        instrumentation_scope1 = Mock(name="scope1")
+        instrumentation_scope2 = Mock(name="scope2")
+        counters = [_Counter(f"counter{i}", instrumentation_scope1, Mock()) for i in range(3)]
+        counters.append(_Counter("counter3", instrumentation_scope2, Mock()))
+        metric_reader_storage = MetricReaderStorage(
+            SdkConfiguration(
+                exemplar_filter=Mock(),
+                resource=Mock(),
+                views=(),
+            ),
+            MagicMock(**{"__getitem__.return_value": AggregationTemporality.CUMULATIVE}),
+            MagicMock(**{"__getitem__.return_value": DefaultAggregation()}),
+        )
+        for counter in counters:
+            metric_reader_storage.consume_measurement(Measurement(1, time_ns(), counter, Context()))
+
+        chunks = list(metric_reader_storage.collect_chunks(max_metrics_per_chunk=2))
+
+        self.assertEqual(
+            [
+                [
+                    (scope_metrics.scope, [metric.name for metric in scope_metrics.metrics])
+                    for scope_metrics in chunk.resource_metrics[0].scope_metrics
+                ]
+                for chunk in chunks
+            ],
+            [
+                [(instrumentation_scope1, ["counter0", "counter1"])],
+                [
+                    (instrumentation_scope1, ["counter2"]),
+                    (instrumentation_scope2, ["counter3"]),
+                ],
+            ],
+        )
+        time_unix_nanos = {
+            metric.data.data_points[0].time_unix_nano
+            for chunk in chunks
+            for scope_metrics in chunk.resource_metrics[0].scope_metrics
+            for metric in scope_metrics.metrics
+        }
+        self.assertEqual(len(time_unix_nanos), 1)
+
+        with self.assertRaises(ValueError):
+            list(metric_reader_storage.collect_chunks(max_metrics_per_chunk=0))
+
     def test_same_collection_start(self):
         counter = _Counter("name", Mock(), Mock())
         up_down_counter = _UpDownCounter("name", Mock(), Mock())
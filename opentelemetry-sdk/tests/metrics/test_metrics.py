@@ -291,6 +291,22 @@ class TestMeterProvider(ConcurrencyTestBase, TestCase):
         self.assertIs(meter1, meter2)
         self.assertIsNot(meter1, meter3)
 
+    def test_get_meter_cached_meter_is_returned_without_creating_scope(self):
+        mp = MeterProvider()
+        meter = mp.get_meter("name", version="version", attributes={"key": "value"})
+
+        with patch("opentelemetry.sdk.metrics._internal.InstrumentationScope") as scope_mock:
+            self.assertIs(
+                mp.get_meter("name", version="version", attributes={"key": "value"}),
+                meter,
+            )
+        scope_mock.assert_not_called()
+        # Unhashable attributes are compared through the scope.
+        self.assertIs(
+            mp.get_meter("name", attributes={"key": ["value"]}),
+            mp.get_meter("name", attributes={"key": ["value"]}),
+        )
+
     def test_get_meter_comparison_with_attributes(self):
         """
         Subsequent calls to `MeterProvider.get_meter` with the same arguments
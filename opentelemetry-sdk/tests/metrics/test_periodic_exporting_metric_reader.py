@@ -210,6 +210,73 @@ class TestPeriodicExportingMetricReader(ConcurrencyTestBase):
             export_interval_millis=-100,
         )
 
+    def test_max_metrics_per_export_exception_on_zero(self):
+        self.assertRaises(
+            ValueError,
+            PeriodicExportingMetricReader,
+            FakeMetricsExporter(),
+            export_interval_millis=math.inf,
+            max_metrics_per_export=0,
+        )
+
+    def test_export_in_chunks(self):
+        exporter = FakeMetricsExporter()
+        pmr = PeriodicExportingMetricReader(
+            exporter,
+            export_interval_millis=math.inf,
+            max_metrics_per_export=2,
+        )
+        meter_provider = MeterProvider(metric_readers=[pmr])
+        meter = meter_provider.get_meter("meter")
+        for index in range(5):
+            meter.create_counter(f"counter{index}").add(1)
+
+        pmr.force_flush()
+
+        self.assertEqual(
+            [
+                [
+                    metric.name
+                    for scope_metrics in metrics_data.resource_metrics[0].scope_metrics
+                    for metric in scope_metrics.metrics
+                ]
+                for metrics_data in exporter.metrics
+            ],
+            [["counter0", "counter1"], ["counter2", "counter3"], ["counter4"]],
+        )
+        meter_provider.shutdown()
+
+    def test_export_chunk_before_collecting_next_chunk(self):
+        events = []
+        exporter = FakeMetricsExporter()
+        exporter.export = Mock(side_effect=lambda metrics_data, **kwargs: events.append(("export", metrics_data)))
+        pmr = PeriodicExportingMetricReader(
+            exporter,
+            export_interval_millis=math.inf,
+            max_metrics_per_export=1,
+        )
+
+        def _collect_chunks(reader, max_metrics_per_chunk, timeout_millis):
+            self.assertIs(reader, pmr)
+            self.assertEqual(max_metrics_per_chunk, 1)
+            for chunk in ("chunk0", "chunk1"):
+                events.append(("collect", chunk))
+                yield chunk
+
+        pmr._set_collect_callback(Mock(), _collect_chunks)
+        pmr.collect()
+
+        self.assertEqual(
+            events,
+            [
+                ("collect", "chunk0"),
+                ("export", "chunk0"),
+                ("collect", "chunk1"),
+                ("export", "chunk1"),
+            ],
+        )
+        pmr.shutdown()
+
     @pytest.mark.flaky(max_runs=3, min_passes=1)
     def test_ticker_collects_metrics(self):
         exporter = FakeMetricsExporter()
@@ -1,6 +1,7 @@
 # Copyright The OpenTelemetry Authors
 # SPDX-License-Identifier: Apache-2.0
 
+import pickle
 from unittest import TestCase
 
 from opentelemetry.sdk.metrics.export import (
@@ -263,3 +264,29 @@ class TestToJson(TestCase):
 
     def test_metrics_data(self):
         self.assertEqual(self.metrics_data_0.to_json(indent=None), self.metrics_data_0_str)
+
+
+class TestSlots(TestCase):
+    def test_points_have_no_instance_dict(self):
+        number_data_point = NumberDataPoint(
+            attributes={"a": 1},
+            start_time_unix_nano=0,
+            time_unix_nano=1,
+            value=2,
+        )
+        metric = Metric(
+            name="metric",
+            description=None,
+            unit=None,
+            data=Sum(
+                data_points=[number_data_point],
+                aggregation_temporality=AggregationTemporality.CUMULATIVE,
+                is_monotonic=True,
+            ),
+        )
+
+        for point in (number_data_point, metric, metric.data):
+            self.assertFalse(hasattr(point, "__dict__"))
+        with self.assertRaises(AttributeError):
+            number_data_point.value = 3
+        self.assertEqual(pickle.loads(pickle.dumps(metric)), metric)
@@ -6,7 +6,13 @@
 from unittest import TestCase
 from unittest.mock import Mock
 
+from opentelemetry.sdk.metrics._internal.instrument import (
+    _Counter,
+    _Histogram,
+)
+from opentelemetry.sdk.metrics._internal.view import _ViewIndex
 from opentelemetry.sdk.metrics.view import View
+from opentelemetry.sdk.util.instrumentation import InstrumentationScope
 
 
 class TestView(TestCase):
@@ -87,3 +93,54 @@ class TestView(TestCase):
     def test_view_name(self):
         with self.assertRaises(Exception):
             View(name="name", instrument_name="instrument_name*")
+
+
+class TestViewIndex(TestCase):
+    def setUp(self):
+        self.scope = InstrumentationScope("meter")
+
+    def test_exact_name(self):
+        view = View(instrument_name="counter")
+        view_index = _ViewIndex([View(instrument_name="other"), view])
+
+        self.assertEqual(view_index.match(_Counter("counter", self.scope, Mock())), [view])
+        self.assertEqual(view_index.match(_Counter("counter_2", self.scope, Mock())), [])
+
+    def test_wildcard_name(self):
+        view1 = View(instrument_name="counter_*")
+        view2 = View(instrument_name="c?unter_[0-9]")
+        view_index = _ViewIndex([view1, View(instrument_name="histogram*"), view2])
+
+        self.assertEqual(view_index.match(_Counter("counter_1", self.scope, Mock())), [view1, view2])
+        self.assertEqual(view_index.match(_Counter("counter_a", self.scope, Mock())), [view1])
+        self.assertEqual(view_index.match(_Counter("gauge", self.scope, Mock())), [])
+
+    def test_instrument_type(self):
+        view1 = View(instrument_type=_Counter)
+        view2 = View(meter_name="meter")
+        view_index = _ViewIndex([view1, View(instrument_type=_Histogram), view2])
+
+        self.assertEqual(view_index.match(_Counter("counter", self.scope, Mock())), [view1, view2])
+        self.assertEqual(
+            view_index.match(_Counter("counter", InstrumentationScope("other"), Mock())),
+            [view1],
+        )
+
+    def test_registration_order(self):
+        views = [
+            View(meter_name="meter"),
+            View(instrument_name="counter*"),
+            View(instrument_name="counter"),
+            View(instrument_type=_Counter),
+            View(instrument_name="*"),
+        ]
+        view_index = _ViewIndex(views)
+
+        self.assertEqual(view_index.match(_Counter("counter", self.scope, Mock())), views)
+
+    def test_view_criteria(self):
+        view = View(instrument_name="counter", instrument_unit="s")
+        view_index = _ViewIndex([view])
+
+        self.assertEqual(view_index.match(_Counter("counter", self.scope, Mock(), unit="s")), [view])
+        self.assertEqual(view_index.match(_Counter("counter", self.scope, Mock(), unit="ms")), [])
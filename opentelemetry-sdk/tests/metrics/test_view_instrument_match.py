@@ -492,6 +492,30 @@ class Test_ViewInstrumentMatch(TestCase):  # pylint: disable=invalid-name
             _LastValueAggregation,
         )
 
+    def test_collect_delta_skips_unchanged_streams(self):
+        instrument1 = _Counter("instrument1", Mock(), Mock())
+        view_instrument_match = _ViewInstrumentMatch(
+            view=View(instrument_name="instrument1"),
+            instrument=instrument1,
+            instrument_class_aggregation={_Counter: DefaultAggregation()},
+        )
+        view_instrument_match.consume_measurement(Measurement(1, time_ns(), instrument1, Context(), {"a": "b"}))
+        (aggregation,) = view_instrument_match._attributes_aggregation.values()
+
+        with patch.object(aggregation, "collect", wraps=aggregation.collect) as mock_collect:
+            (data_point,) = view_instrument_match.collect(AggregationTemporality.DELTA, 1)
+            self.assertEqual(data_point.value, 1)
+            self.assertEqual(mock_collect.call_count, 1)
+
+            # No measurement since the last collection, the stream is
+            # evicted without being collected.
+            self.assertIsNone(view_instrument_match.collect(AggregationTemporality.DELTA, 2))
+            self.assertEqual(mock_collect.call_count, 1)
+            self.assertEqual(view_instrument_match._attributes_aggregation, {})
+            self.assertEqual(view_instrument_match._evicted_series, 1)
+
+        self.assertIsNone(view_instrument_match.collect(AggregationTemporality.DELTA, 3))
+
 
 class TestSimpleFixedSizeExemplarReservoir(TestCase):
     def test_consume_measurement_with_custom_reservoir_factory(self):
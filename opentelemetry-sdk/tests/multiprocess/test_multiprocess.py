@@ -0,0 +1,259 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+import multiprocessing
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import Mock
+
+from opentelemetry.sdk._logs import LoggerProvider
+from opentelemetry.sdk._logs.export import (
+    InMemoryLogRecordExporter,
+    SimpleLogRecordProcessor,
+)
+from opentelemetry.sdk._multiprocess import (
+    ForwardingLogRecordExporter,
+    ForwardingMetricExporter,
+    ForwardingSpanExporter,
+    TelemetryCollector,
+)
+from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider
+from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
+    InMemoryMetricReader,
+    MetricExporter,
+    MetricExportResult,
+)
+from opentelemetry.sdk.resources import SERVICE_INSTANCE_ID, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor, SpanExportResult
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+
+class InMemoryMetricExporter(MetricExporter):
+    def __init__(self):
+        super().__init__()
+        self.metrics_data = []
+
+    def export(self, metrics_data, timeout_millis=10_000, **kwargs):
+        self.metrics_data.append(metrics_data)
+        return MetricExportResult.SUCCESS
+
+    def force_flush(self, timeout_millis=10_000):
+        return True
+
+    def shutdown(self, timeout_millis=30_000, **kwargs):
+        pass
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "needs *nix")
+class TestTelemetryCollector(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.path = os.path.join(self.tmp_dir.name, "otel.sock")
+        self.span_exporter = InMemorySpanExporter()
+        self.log_record_exporter = InMemoryLogRecordExporter()
+        self.metric_exporter = InMemoryMetricExporter()
+        self.collector = TelemetryCollector(
+            self.path,
+            span_exporter=self.span_exporter,
+            log_record_exporter=self.log_record_exporter,
+            metric_exporter=self.metric_exporter,
+            schedule_delay_millis=60_000,
+        )
+        self.collector.start()
+
+    def tearDown(self):
+        self.collector.shutdown()
+        self.tmp_dir.cleanup()
+
+    def _flush_until(self, predicate):
+        # Forwarded frames are read asynchronously by the collector.
+        for _ in range(500):
+            self.collector.force_flush()
+            if predicate():
+                return
+            time.sleep(0.01)
+        self.fail("Forwarded telemetry was not received")
+
+    def test_forward_spans(self):
+        exporter = ForwardingSpanExporter(self.path)
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer = tracer_provider.get_tracer(__name__)
+        with tracer.start_as_current_span("parent", attributes={"key": "value"}) as span:
+            span.add_event("event", {"event.key": 1})
+            with tracer.start_as_current_span("child"):
+                pass
+        tracer_provider.shutdown()
+        self._flush_until(lambda: len(self.span_exporter.get_finished_spans()) == 2)
+
+        spans = self.span_exporter.get_finished_spans()
+        self.assertEqual([span.name for span in spans], ["child", "parent"])
+        self.assertEqual(spans[1].attributes, {"key": "value"})
+        self.assertEqual(spans[1].events[0].attributes, {"event.key": 1})
+        self.assertEqual(spans[0].parent.span_id, spans[1].context.span_id)
+
+    def test_forward_log_records(self):
+        exporter = ForwardingLogRecordExporter(self.path)
+        logger_provider = LoggerProvider()
+        logger_provider.add_log_record_processor(SimpleLogRecordProcessor(exporter))
+        logger_provider.get_logger(__name__).emit(body="hello", attributes={"key": "value"})
+        logger_provider.shutdown()
+        self._flush_until(lambda: self.log_record_exporter.get_finished_logs())
+
+        logs = self.log_record_exporter.get_finished_logs()
+        self.assertEqual(len(logs), 1)
+        self.assertEqual(logs[0].log_record.body, "hello")
+        self.assertEqual(logs[0].log_record.attributes, {"key": "value"})
+
+    def test_forward_metrics_stamps_service_instance_id(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader], resource=Resource({"service.name": "test"}))
+        meter_provider.get_meter(__name__).create_counter("counter").add(1)
+        exporter = ForwardingMetricExporter(self.path)
+
+        exporter.export(reader.get_metrics_data())
+        exporter.export(reader.get_metrics_data())
+        exporter.shutdown()
+        # Both exports are received before the collector is flushed.
+        time.sleep(0.1)
+        self._flush_until(lambda: self.metric_exporter.metrics_data)
+
+        resource_metrics = self.metric_exporter.metrics_data[0].resource_metrics
+        self.assertEqual(len(resource_metrics), 1)
+        self.assertEqual(resource_metrics[0].resource.attributes["service.name"], "test")
+        self.assertIn(SERVICE_INSTANCE_ID, resource_metrics[0].resource.attributes)
+        # Both exports share the same resource, so they are merged and only
+        # the latest state of the counter is exported.
+        (scope_metrics,) = resource_metrics[0].scope_metrics
+        (metric,) = scope_metrics.metrics
+        self.assertEqual(metric.name, "counter")
+        meter_provider.shutdown()
+
+    def test_forward_metrics_exports_latest_state(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter(__name__)
+        counter = meter.create_counter("counter")
+        exporter = ForwardingMetricExporter(self.path)
+
+        counter.add(1)
+        exporter.export(reader.get_metrics_data())
+        counter.add(2)
+        meter.create_counter("other").add(1)
+        exporter.export(reader.get_metrics_data())
+        exporter.shutdown()
+        time.sleep(0.1)
+        self._flush_until(lambda: self.metric_exporter.metrics_data)
+
+        (metrics_data,) = self.metric_exporter.metrics_data
+        (resource_metrics,) = metrics_data.resource_metrics
+        (scope_metrics,) = resource_metrics.scope_metrics
+        values = {metric.name: metric.data.data_points[0].value for metric in scope_metrics.metrics}
+        self.assertEqual(values, {"counter": 3, "other": 1})
+        meter_provider.shutdown()
+
+    def test_forward_delta_metrics_adds_points(self):
+        reader = InMemoryMetricReader(
+            preferred_temporality={
+                Counter: AggregationTemporality.DELTA,
+                Histogram: AggregationTemporality.DELTA,
+            }
+        )
+        meter_provider = MeterProvider(metric_readers=[reader])
+        meter = meter_provider.get_meter(__name__)
+        counter = meter.create_counter("counter")
+        histogram = meter.create_histogram("histogram")
+        exporter = ForwardingMetricExporter(self.path)
+
+        counter.add(1, {"key": "a"})
+        histogram.record(5)
+        exporter.export(reader.get_metrics_data())
+        counter.add(2, {"key": "a"})
+        counter.add(4, {"key": "b"})
+        histogram.record(1)
+        exporter.export(reader.get_metrics_data())
+        exporter.shutdown()
+        time.sleep(0.1)
+        self._flush_until(lambda: self.metric_exporter.metrics_data)
+
+        (metrics_data,) = self.metric_exporter.metrics_data
+        (resource_metrics,) = metrics_data.resource_metrics
+        (scope_metrics,) = resource_metrics.scope_metrics
+        metrics = {metric.name: metric for metric in scope_metrics.metrics}
+        self.assertEqual(
+            {point.attributes["key"]: point.value for point in metrics["counter"].data.data_points},
+            {"a": 3, "b": 4},
+        )
+        (point,) = metrics["histogram"].data.data_points
+        self.assertEqual((point.count, point.sum, point.min, point.max), (2, 6, 1, 5))
+        meter_provider.shutdown()
+
+    def test_shutdown_with_closed_connection(self):
+        connection = Mock()
+        connection.shutdown.side_effect = OSError("Transport endpoint is not connected")
+        self.collector._connections.add(connection)
+
+        self.collector.shutdown()
+
+        connection.shutdown.assert_called_once()
+
+    def test_forward_metrics_from_forked_children(self):
+        reader = InMemoryMetricReader()
+        meter_provider = MeterProvider(metric_readers=[reader])
+        counter = meter_provider.get_meter(__name__).create_counter("counter")
+        exporter = ForwardingMetricExporter(self.path)
+
+        def child():
+            counter.add(1)
+            exporter.export(reader.get_metrics_data())
+            exporter.shutdown()
+
+        processes = [multiprocessing.get_context("fork").Process(target=child) for _ in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+
+        def instance_ids():
+            return {
+                resource_metrics.resource.attributes[SERVICE_INSTANCE_ID]
+                for metrics_data in self.metric_exporter.metrics_data
+                for resource_metrics in metrics_data.resource_metrics
+            }
+
+        self._flush_until(lambda: len(instance_ids()) == 3)
+        meter_provider.shutdown()
+
+    def test_shutdown_exports_remaining_telemetry(self):
+        exporter = ForwardingSpanExporter(self.path)
+        tracer_provider = TracerProvider()
+        tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+        with tracer_provider.get_tracer(__name__).start_as_current_span("span"):
+            pass
+        tracer_provider.shutdown()
+        # The span is received before the collector is shut down.
+        time.sleep(0.1)
+
+        self.collector.shutdown()
+        self.assertEqual(len(self.span_exporter.get_finished_spans()), 1)
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_forwarding_without_collector_fails(self):
+        exporter = ForwardingSpanExporter(os.path.join(self.tmp_dir.name, "missing.sock"))
+        with self.assertLogs("opentelemetry.sdk._multiprocess", level="ERROR"):
+            result = exporter.export([])
+        self.assertEqual(result, SpanExportResult.FAILURE)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            TelemetryCollector(self.path, schedule_delay_millis=0)
+        with self.assertRaises(ValueError):
+            TelemetryCollector(self.path, max_export_batch_size=10, max_queue_size=5)
@@ -0,0 +1,103 @@
+# Copyright The OpenTelemetry Authors
+# SPDX-License-Identifier: Apache-2.0
+
+# pylint: disable=protected-access
+import threading
+import unittest
+from unittest.mock import Mock
+
+from opentelemetry.sdk._shared_internal import _QueueWorker
+
+
+class TestQueueWorker(unittest.TestCase):
+    def test_items_are_processed_in_order(self):
+        processed = []
+        worker = _QueueWorker("TestWorker", processed.append, Mock(), Mock(), 10)
+        for item in range(3):
+            worker.put(item)
+
+        self.assertTrue(worker.flush(5000))
+        self.assertEqual(processed, [0, 1, 2])
+        worker.shutdown(5000)
+        self.assertFalse(worker._worker_thread.is_alive())
+
+    def test_oldest_items_are_dropped_and_reported(self):
+        release = threading.Event()
+        processed = []
+
+        def process(item):
+            release.wait(5)
+            processed.append(item)
+
+        report_dropped = Mock()
+        worker = _QueueWorker("TestWorker", process, Mock(), report_dropped, 2)
+        worker.put(0)
+        # Wait for the worker to block on the first item.
+        while worker._queue:
+            pass
+        for item in range(1, 5):
+            worker.put(item)
+        self.assertEqual(worker.dropped, 2)
+        report_dropped.assert_not_called()
+
+        release.set()
+        self.assertTrue(worker.flush(5000))
+        self.assertEqual(processed, [0, 3, 4])
+        report_dropped.assert_called_once_with(2)
+        worker.shutdown(5000)
+
+    def test_drops_are_counted_from_concurrent_producers(self):
+        release = threading.Event()
+        worker = _QueueWorker("TestWorker", lambda item: release.wait(5), Mock(), Mock(), 1)
+        worker.put(0)
+        # Wait for the worker to block on the first item.
+        while worker._queue:
+            pass
+        worker.put(1)
+
+        def produce():
+            for item in range(1000):
+                worker.put(item)
+
+        threads = [threading.Thread(target=produce) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(worker.dropped, 4000)
+        release.set()
+        worker.shutdown(5000)
+
+    def test_items_put_after_shutdown_are_dropped(self):
+        processed = []
+        worker = _QueueWorker("TestWorker", processed.append, Mock(), Mock(), 10)
+        worker.shutdown(5000)
+
+        worker.put(1)
+
+        self.assertEqual(processed, [])
+        self.assertEqual(len(worker._queue), 0)
+        self.assertEqual(worker.dropped, 1)
+
+    def test_errors_do_not_stop_the_worker(self):
+        on_error = Mock()
+        worker = _QueueWorker("TestWorker", Mock(side_effect=[ValueError(), None]), on_error, Mock(), 10)
+        worker.put("failing")
+        worker.put("item")
+
+        self.assertTrue(worker.flush(5000))
+        on_error.assert_called_once_with("failing")
+        worker.shutdown(5000)
+
+    def test_at_fork_reinit(self):
+        processed = []
+        worker = _QueueWorker("TestWorker", processed.append, Mock(), Mock(), 10)
+        worker_thread = worker._worker_thread
+        worker._at_fork_reinit()
+
+        self.assertIsNot(worker._worker_thread, worker_thread)
+        worker.put(1)
+        self.assertTrue(worker.flush(5000))
+        self.assertEqual(processed, [1])
+        worker.shutdown(5000)
@@ -73,7 +73,11 @@ from opentelemetry.sdk.trace.export import (
     ConsoleSpanExporter,
     SimpleSpanProcessor,
 )
-from opentelemetry.sdk.trace.id_generator import IdGenerator, RandomIdGenerator
+from opentelemetry.sdk.trace.id_generator import (
+    BufferedRandomIdGenerator,
+    IdGenerator,
+    RandomIdGenerator,
+)
 from opentelemetry.sdk.trace.sampling import (
     ALWAYS_ON,
     Decision,
@@ -436,6 +440,14 @@ class TestTraceInit(TestCase):
         provider = self.set_provider_mock.call_args[0][0]
         self.assertIsInstance(provider.id_generator, CustomIdGenerator)
 
+    @patch.dict(environ, {OTEL_PYTHON_ID_GENERATOR: "buffered_random"})
+    def test_trace_init_buffered_random_id_generator(self):
+        id_generator_name = _get_id_generator()
+        id_generator = _import_id_generator(id_generator_name)
+        _init_tracing({}, id_generator=id_generator)
+        provider = self.set_provider_mock.call_args[0][0]
+        self.assertIsInstance(provider.id_generator, BufferedRandomIdGenerator)
+
     @patch.dict("os.environ", {OTEL_TRACES_SAMPLER: "non_existent_entry_point"})
     def test_trace_init_custom_sampler_with_env_non_existent_entry_point(self):
         sampler_name = _get_sampler()
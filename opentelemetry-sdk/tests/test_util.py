@@ -2,6 +2,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import copy
+import pickle
 import unittest
 
 from opentelemetry.sdk.util import BoundedList
@@ -150,3 +151,16 @@ class TestBoundedList(unittest.TestCase):
         self.assertEqual(blist._dq.maxlen, blist_copy._dq.maxlen)
         self.assertIsNot(blist[1], blist_copy[1])
         self.assertEqual(blist[1], blist_copy[1])
+
+    def test_pickle(self):
+        blist = BoundedList(maxlen=10)
+        blist.append(1)
+        blist.append([2, 3])
+        blist.dropped = 5
+
+        blist_copy = pickle.loads(pickle.dumps(blist))
+
+        self.assertEqual(list(blist), list(blist_copy))
+        self.assertEqual(blist.dropped, blist_copy.dropped)
+        blist_copy.append(4)
+        self.assertEqual(list(blist_copy), [1, [2, 3], 4])
@@ -15,6 +15,7 @@ from opentelemetry.sdk.trace._sampling_experimental._rule_based import (
     AttributeValuesPredicate,
     ParentPredicate,
     SpanKindPredicate,
+    SpanNamePredicate,
 )
 from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 from opentelemetry.sdk.trace.sampling import Decision
@@ -336,3 +337,81 @@ def test_attribute_predicate_match():
         composable_rule_based(rules=rules).sampling_intent(None, "span", None, {"foo": "bar"}, None, None).threshold
         == 0
     )
+
+
+def test_span_name_predicate():
+    predicate = SpanNamePredicate(["GET /users", "POST /api/*"])
+
+    assert predicate(None, "GET /users", None, None, None, None) is True
+    assert predicate(None, "POST /api/orders", None, None, None, None) is True
+    assert predicate(None, "GET /api/orders", None, None, None, None) is False
+    assert str(predicate) == "name in [GET /users,POST /api/*]"
+
+
+def test_indexed_rules_keep_rule_order():
+    rules = [
+        (SpanNamePredicate(["health*"]), composable_always_off()),
+        (SpanNamePredicate(["healthcheck"]), composable_always_on()),
+        (AttributeValuesPredicate("http.route", ["/users"]), composable_always_on()),
+        (SpanNamePredicate(["other"]), composable_always_on()),
+    ]
+    sampler = composable_rule_based(rules=rules)
+
+    assert sampler.sampling_intent(None, "healthcheck", None, None, None, None).threshold == -1
+    assert sampler.sampling_intent(None, "users", None, {"http.route": "/users"}, None, None).threshold == 0
+    assert sampler.sampling_intent(None, "users", None, {"http.route": "/orders"}, None, None).threshold == -1
+    assert sampler.sampling_intent(None, "other", None, None, None, None).threshold == 0
+
+
+def test_decision_cache():
+    rules = [
+        (
+            AllPredicate(
+                [
+                    AttributeValuesPredicate("http.route", ["/users"]),
+                    ParentPredicate(["none"]),
+                ]
+            ),
+            composable_always_on(),
+        ),
+    ]
+    sampler = composable_rule_based(rules=rules, decision_cache_size=2)
+
+    attributes = {"http.route": "/users", "http.request.method": ["GET"]}
+    assert sampler.sampling_intent(None, "span", None, attributes, None, None).threshold == 0
+    assert sampler.sampling_intent(None, "span", None, attributes, None, None).threshold == 0
+    # Only the attributes predicates look at are part of the key.
+    assert list(sampler._decision_cache.values()) == [0]
+
+    parent_ctx = _parent_context(is_remote=True)
+    assert sampler.sampling_intent(parent_ctx, "span", None, attributes, None, None).threshold == -1
+    assert sampler.sampling_intent(None, "span", None, None, None, None).threshold == -1
+    assert len(sampler._decision_cache) == 2
+    assert sampler.sampling_intent(None, "span", None, attributes, None, None).threshold == 0
+
+
+def test_decision_cache_equal_values_of_different_types():
+    rules = [(AttributeValuesPredicate("key", ["True"]), composable_always_on())]
+    sampler = composable_rule_based(rules=rules)
+
+    assert sampler.sampling_intent(None, "span", None, {"key": 1}, None, None).threshold == -1
+    assert sampler.sampling_intent(None, "span", None, {"key": True}, None, None).threshold == 0
+    assert sampler.sampling_intent(None, "span", None, {"key": [1.0]}, None, None).threshold == -1
+    assert sampler.sampling_intent(None, "span", None, {"key": [True]}, None, None).threshold == 0
+    assert sampler.sampling_intent(None, "span", None, {"key": 1}, None, None).threshold == -1
+
+
+def test_decision_cache_unhashable_attribute_value():
+    rules = [(AttributeValuesPredicate("key", ["value"]), composable_always_on())]
+    sampler = composable_rule_based(rules=rules)
+
+    assert sampler.sampling_intent(None, "span", None, {"key": ["value", ["nested"]]}, None, None).threshold == 0
+    assert not sampler._decision_cache
+
+
+def test_decision_cache_disabled_for_custom_predicates():
+    rules = [(NameIsFooPredicate(), composable_always_on())]
+    sampler = composable_rule_based(rules=rules)
+
+    assert sampler.sampling_intent(None, "foo", None, None, None, None).threshold == 0
+    assert not sampler._decision_cache
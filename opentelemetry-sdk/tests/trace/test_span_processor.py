@@ -251,6 +251,26 @@ class TestSpanProcessor(unittest.TestCase):
 
         self.assertListEqual(spans_calls_list, expected_list)
 
+    def test_span_end_skips_readable_span_without_on_end(self):
+        tracer_provider = trace.TracerProvider()
+        spans_calls_list = []
+
+        class OnStartSpanProcessor(trace.SpanProcessor):
+            def on_start(self, span: "trace.Span", parent_context: Context | None = None) -> None:
+                spans_calls_list.append(span_event_start_fmt("SP1", span.name))
+
+        tracer_provider.add_span_processor(OnStartSpanProcessor())
+        with mock.patch.object(trace._Span, "_readable_span") as readable_span:  # pylint: disable=protected-access
+            with tracer_provider.get_tracer(__name__).start_as_current_span("foo"):
+                pass
+        readable_span.assert_not_called()
+        self.assertListEqual(spans_calls_list, [span_event_start_fmt("SP1", "foo")])
+
+        tracer_provider.add_span_processor(MySpanProcessor("SP2", spans_calls_list))
+        with tracer_provider.get_tracer(__name__).start_as_current_span("bar"):
+            pass
+        self.assertEqual(spans_calls_list[-1], span_event_end_fmt("SP2", "bar"))
+
 
 class MultiSpanProcessorTestBase(abc.ABC):
     @abc.abstractmethod
@@ -368,9 +388,34 @@ class MultiSpanProcessorTestBase(abc.ABC):
             # pylint: disable=no-member
             self.fail("_on_ending() should not raise an exception")
 
+        multi_processor.force_flush()
         # pylint: disable=no-member
         self.assertListEqual(spans_calls_list, expected_list)
 
+    def test_not_implemented_hooks_are_skipped(self):
+        multi_processor = self.create_multi_span_processor()
+        spans_calls_list = []
+        on_end_processor = MySpanProcessor("SP1", spans_calls_list)
+        on_ending_processor = MyExtendedSpanProcessor("SP2", spans_calls_list)
+        default_processor = trace.SpanProcessor()
+        for span_processor in (on_end_processor, on_ending_processor, default_processor):
+            multi_processor.add_span_processor(span_processor)
+
+        # pylint: disable=protected-access
+        self.assertEqual(multi_processor._on_start_span_processors, (on_end_processor, on_ending_processor))
+        self.assertEqual(multi_processor._on_ending_span_processors, (on_ending_processor,))
+        self.assertEqual(multi_processor._on_end_span_processors, (on_end_processor, on_ending_processor))
+        self.assertTrue(multi_processor._has_on_end)
+        multi_processor.shutdown()
+
+    def test_has_no_on_end(self):
+        multi_processor = self.create_multi_span_processor()
+        multi_processor.add_span_processor(trace.SpanProcessor())
+
+        # pylint: disable=protected-access
+        self.assertFalse(multi_processor._has_on_end)
+        multi_processor.shutdown()
+
 
 class TestSynchronousMultiSpanProcessor(MultiSpanProcessorTestBase, unittest.TestCase):
     def create_multi_span_processor(
@@ -557,3 +602,155 @@ class TestConcurrentMultiSpanProcessor(MultiSpanProcessorTestBase, unittest.Test
         with tracer.start_as_current_span("main process after fork span"):
             pass
         assert exporter.get_finished_spans()[-1].name == "main process after fork span"
+
+
+class TestFireAndForgetConcurrentMultiSpanProcessor(MultiSpanProcessorTestBase, unittest.TestCase):
+    def create_multi_span_processor(
+        self,
+    ) -> trace.ConcurrentMultiSpanProcessor:
+        return trace.ConcurrentMultiSpanProcessor(3, fire_and_forget=True)
+
+    def test_on_end(self):
+        multi_processor = self.create_multi_span_processor()
+
+        mocks = [mock.Mock(spec=trace.SpanProcessor) for _ in range(0, 5)]
+        for mock_processor in mocks:
+            multi_processor.add_span_processor(mock_processor)
+
+        span = self.create_default_span()
+        multi_processor.on_end(span)
+        self.assertTrue(multi_processor.force_flush())
+
+        for mock_processor in mocks:
+            mock_processor.on_end.assert_called_once_with(span)
+        multi_processor.shutdown()
+
+    def test_on_end_does_not_wait_for_span_processors(self):
+        multi_processor = self.create_multi_span_processor()
+        wait_event = Event()
+        late_mock = mock.Mock(spec=trace.SpanProcessor)
+        late_mock.on_end = mock.Mock(side_effect=lambda _: wait_event.wait())
+        multi_processor.add_span_processor(late_mock)
+
+        multi_processor.on_end(self.create_default_span())
+        self.assertFalse(multi_processor.force_flush(timeout_millis=25))
+
+        wait_event.set()
+        self.assertTrue(multi_processor.force_flush())
+        late_mock.on_end.assert_called_once()
+        multi_processor.shutdown()
+
+    def test_on_end_drops_oldest_spans_when_queue_full(self):
+        multi_processor = trace.ConcurrentMultiSpanProcessor(fire_and_forget=True, max_queue_size=2)
+        wait_event = Event()
+        received = []
+
+        def on_end(span):
+            wait_event.wait()
+            received.append(span)
+
+        blocked_mock = mock.Mock(spec=trace.SpanProcessor)
+        blocked_mock.on_end = mock.Mock(side_effect=on_end)
+        multi_processor.add_span_processor(blocked_mock)
+
+        spans = [
+            trace_api.NonRecordingSpan(trace_api.SpanContext(37, span_id, is_remote=False)) for span_id in range(1, 6)
+        ]
+        multi_processor.on_end(spans[0])
+        # Wait for the worker to block on the first span.
+        while not blocked_mock.on_end.called:
+            time.sleep(0.001)
+        for span in spans[1:]:
+            multi_processor.on_end(span)
+
+        self.assertEqual(multi_processor.dropped_spans, 2)
+        wait_event.set()
+        # Dropped spans are reported from the worker thread.
+        with self.assertLogs(level="WARNING"):
+            self.assertTrue(multi_processor.force_flush())
+        self.assertEqual(received, [spans[0], spans[3], spans[4]])
+        multi_processor.shutdown()
+
+    def test_on_end_exception_does_not_stop_worker(self):
+        multi_processor = self.create_multi_span_processor()
+        failing_mock = mock.Mock(spec=trace.SpanProcessor)
+        failing_mock.on_end = mock.Mock(side_effect=[ValueError("on_end failed"), None])
+        multi_processor.add_span_processor(failing_mock)
+
+        with self.assertLogs(level="ERROR"):
+            multi_processor.on_end(self.create_default_span())
+            self.assertTrue(multi_processor.force_flush())
+        multi_processor.on_end(self.create_default_span())
+        self.assertTrue(multi_processor.force_flush())
+
+        self.assertEqual(failing_mock.on_end.call_count, 2)
+        multi_processor.shutdown()
+
+    def test_shutdown_processes_queued_spans(self):
+        multi_processor = self.create_multi_span_processor()
+        exporter = InMemorySpanExporter()
+        multi_processor.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer_provider = trace.TracerProvider()
+        tracer_provider.add_span_processor(multi_processor)
+
+        with tracer_provider.get_tracer(__name__).start_as_current_span("span"):
+            pass
+        multi_processor.shutdown()
+
+        self.assertEqual([span.name for span in exporter.get_finished_spans()], ["span"])
+
+    def test_invalid_max_queue_size(self):
+        with self.assertRaises(ValueError):
+            trace.ConcurrentMultiSpanProcessor(fire_and_forget=True, max_queue_size=0)
+
+    def test_shutdown_workers_share_one_deadline(self):
+        # pylint: disable=protected-access
+        multi_processor = self.create_multi_span_processor()
+        for _ in range(3):
+            multi_processor.add_span_processor(mock.Mock(spec=trace.SpanProcessor))
+        for worker in multi_processor._workers:
+            worker.shutdown(5000)
+
+        now_ns = 0
+
+        def slow_shutdown(timeout_millis):
+            nonlocal now_ns
+            now_ns += 20000 * 1000000
+
+        workers = [mock.Mock(shutdown=mock.Mock(side_effect=slow_shutdown)) for _ in range(3)]
+        multi_processor._workers = tuple(workers)
+        with mock.patch("opentelemetry.sdk.trace.time_ns", side_effect=lambda: now_ns):
+            multi_processor.shutdown()
+
+        self.assertEqual(
+            [worker.shutdown.call_args.args[0] for worker in workers],
+            [30000, 10000, 0],
+        )
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs *nix")
+    def test_fire_and_forget_fork(self):
+        multiprocessing_context = multiprocessing.get_context("fork")
+        tracer_provider = trace.TracerProvider()
+        tracer = tracer_provider.get_tracer(__name__)
+        exporter = InMemorySpanExporter()
+        multi_processor = self.create_multi_span_processor()
+        multi_processor.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer_provider.add_span_processor(multi_processor)
+
+        def child(conn):
+            with tracer.start_as_current_span("child process span"):
+                pass
+            multi_processor.force_flush()
+            conn.send(exporter.get_finished_spans()[-1].name)
+            conn.close()
+
+        parent_conn, child_conn = multiprocessing_context.Pipe()
+        process = multiprocessing_context.Process(target=child, args=(child_conn,))
+        process.start()
+        has_response = parent_conn.poll(timeout=5)
+        if not has_response:
+            process.kill()
+            self.fail("The child process did not send any message after 5 seconds, it's very probably locked")
+        process.join(timeout=5)
+        self.assertEqual(parent_conn.recv(), "child process span")
+        multi_processor.shutdown()
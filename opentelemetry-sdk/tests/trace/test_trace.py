@@ -4,6 +4,7 @@
 # pylint: disable=too-many-lines
 # pylint: disable=no-member
 
+import asyncio
 import copy
 import dataclasses
 import json
@@ -11,7 +12,9 @@ import os
 import shutil
 import subprocess
 import sys
+import threading
 import unittest
+import warnings
 from importlib import reload
 from logging import ERROR, WARNING
 from pathlib import Path
@@ -44,7 +47,10 @@ from opentelemetry.sdk.trace import (
     _RuleBasedTracerConfigurator,
     _TracerConfig,
 )
-from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
+from opentelemetry.sdk.trace.id_generator import (
+    BufferedRandomIdGenerator,
+    RandomIdGenerator,
+)
 from opentelemetry.sdk.trace.sampling import (
     ALWAYS_OFF,
     ALWAYS_ON,
@@ -250,6 +256,34 @@ tracer_provider.add_span_processor(mock_processor)
         self.assertEqual(tracer1, tracer2)
         self.assertTrue(tracer1 is tracer2)
 
+    def test_get_tracer_sdk_cached_tracer_is_returned_without_creating_scope(
+        self,
+    ):
+        tracer_provider = trace.TracerProvider()
+        tracer = tracer_provider.get_tracer("module_name", "library_version", attributes={"key": "value"})
+
+        with mock.patch("opentelemetry.sdk.trace.InstrumentationScope") as scope_mock:
+            self.assertIs(
+                tracer_provider.get_tracer("module_name", "library_version", attributes={"key": "value"}),
+                tracer,
+            )
+        scope_mock.assert_not_called()
+
+    def test_get_tracer_sdk_does_not_install_warning_filters(self):
+        filters = list(warnings.filters)
+        tracer = trace.TracerProvider().get_tracer("module_name", "library_version")
+
+        self.assertEqual(warnings.filters, filters)
+        self.assertEqual(tracer.instrumentation_info.name, "module_name")
+        self.assertEqual(tracer.instrumentation_info.version, "library_version")
+        self.assertEqual(tracer.instrumentation_info.schema_url, "")
+
+    def test_get_tracer_sdk_with_unhashable_attributes(self):
+        tracer_provider = trace.TracerProvider()
+        tracer1 = tracer_provider.get_tracer("module_name", attributes={"key": ["value"]})
+        tracer2 = tracer_provider.get_tracer("module_name", attributes={"key": ["value"]})
+        self.assertIs(tracer1, tracer2)
+
     def test_get_tracer_sdk_sets_default_tracer_config_if_configurator_raises(
         self,
     ):
@@ -639,6 +673,45 @@ class TestSpanCreation(unittest.TestCase):
         self.assertIsNotNone(root2.end_time)
         self.assertIsNot(root1, root2)
 
+    def test_start_as_current_span_async_decorator(self):
+        tracer = new_tracer()
+
+        @tracer.start_as_current_span("root")
+        async def func():
+            await asyncio.sleep(0)
+            root = trace_api.get_current_span()
+            # The span only ends after the coroutine completes.
+            self.assertIsNone(root.end_time)
+            return root
+
+        root1 = asyncio.run(func())
+        root2 = asyncio.run(func())
+        self.assertIsNotNone(root1.end_time)
+        self.assertIsNot(root1, root2)
+        self.assertEqual(func.__name__, "func")
+
+    def test_start_as_current_span_records_exception(self):
+        tracer = new_tracer()
+
+        with self.assertRaises(ValueError):
+            with tracer.start_as_current_span("root") as root:
+                raise ValueError("error")
+
+        self.assertEqual(trace_api.get_current_span(), trace_api.INVALID_SPAN)
+        self.assertIsNotNone(root.end_time)
+        self.assertIs(root.status.status_code, StatusCode.ERROR)
+        self.assertEqual(root.status.description, "ValueError: error")
+        self.assertEqual(root.events[0].name, "exception")
+
+        with self.assertRaises(KeyboardInterrupt):
+            with tracer.start_as_current_span("root", record_exception=False) as root:
+                raise KeyboardInterrupt()
+
+        # Exceptions not inheriting from Exception are not errors.
+        self.assertIsNotNone(root.end_time)
+        self.assertIs(root.status.status_code, StatusCode.UNSET)
+        self.assertEqual(len(root.events), 0)
+
     def test_start_as_current_span_no_end_on_exit(self):
         tracer = new_tracer()
 
@@ -2341,3 +2414,83 @@ class TestRandomIdGenerator(unittest.TestCase):
     def test_is_trace_id_random_returns_true(self):
         generator = RandomIdGenerator()
         self.assertTrue(generator.is_trace_id_random())
+
+
+class TestBufferedRandomIdGenerator(unittest.TestCase):
+    @patch(
+        "os.urandom",
+        side_effect=[
+            bytes(8),
+            (0x00000000DEADBEF0).to_bytes(8, sys.byteorder),
+        ],
+    )
+    def test_generate_span_id_avoids_invalid(self, mock_urandom):
+        generator = BufferedRandomIdGenerator(buffer_size=1)
+        span_id = generator.generate_span_id()
+
+        self.assertEqual(span_id, 0x00000000DEADBEF0)
+        self.assertEqual(mock_urandom.call_count, 2)
+
+    @patch(
+        "os.urandom",
+        side_effect=[
+            bytes(16),
+            (0xDEADBEEF).to_bytes(8, sys.byteorder) + (0xDEADBEF0).to_bytes(8, sys.byteorder),
+        ],
+    )
+    def test_generate_trace_id_avoids_invalid(self, mock_urandom):
+        generator = BufferedRandomIdGenerator(buffer_size=2)
+        trace_id = generator.generate_trace_id()
+
+        self.assertEqual(trace_id, 0xDEADBEEF << 64 | 0xDEADBEF0)
+        self.assertEqual(mock_urandom.call_count, 2)
+
+    def test_generate_ids_refills_buffer(self):
+        generator = BufferedRandomIdGenerator(buffer_size=4)
+        span_ids = {generator.generate_span_id() for _ in range(100)}
+        trace_ids = {generator.generate_trace_id() for _ in range(100)}
+
+        self.assertEqual(len(span_ids), 100)
+        self.assertEqual(len(trace_ids), 100)
+        self.assertTrue(all(0 < span_id < 2**64 for span_id in span_ids))
+        self.assertTrue(all(0 < trace_id < 2**128 for trace_id in trace_ids))
+
+    def test_threads_use_separate_buffers(self):
+        generator = BufferedRandomIdGenerator()
+        generator.generate_span_id()
+        span_ids = []
+        thread = threading.Thread(target=lambda: span_ids.append(generator.generate_span_id()))
+        thread.start()
+        thread.join()
+
+        # The buffer of the main thread is left untouched by the other thread.
+        self.assertNotEqual(span_ids[0], generator.generate_span_id())
+        # pylint: disable=protected-access
+        self.assertEqual(
+            len(list(iter(generator._local.next_random, None))),
+            generator._buffer_size - 2,
+        )
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs *nix")
+    def test_fork_discards_buffer(self):
+        generator = BufferedRandomIdGenerator()
+        generator.generate_span_id()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, generator.generate_span_id().to_bytes(8, "big"))
+            os._exit(0)  # pylint: disable=protected-access
+        os.close(write_fd)
+        child_span_id = int.from_bytes(os.read(read_fd, 8), "big")
+        os.close(read_fd)
+        os.waitpid(pid, 0)
+
+        self.assertNotEqual(child_span_id, generator.generate_span_id())
+
+    def test_invalid_buffer_size(self):
+        with self.assertRaises(ValueError):
+            BufferedRandomIdGenerator(buffer_size=0)
+
+    def test_is_trace_id_random_returns_true(self):
+        self.assertTrue(BufferedRandomIdGenerator().is_trace_id_random())